@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import json
+import threading
 import types
+import weakref
 from typing import Any
 
+_DEFAULT_MAX_METADATA_BYTES = 4096
+
+# One background logger per Grantex client, shared by every tool wrapped with
+# background=True so their entries are batched together.
+_background_loggers: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+_background_loggers_lock = threading.Lock()
+
 
 def with_audit_logging(
     tool: Any,
@@ -10,18 +20,41 @@ def with_audit_logging(
     *,
     agent_id: str,
     grant_id: str,
+    agent_did: str | None = None,
+    principal_id: str | None = None,
+    background: bool = False,
+    audit_logger: Any = None,
+    max_metadata_bytes: int | None = _DEFAULT_MAX_METADATA_BYTES,
 ) -> Any:
     """Wrap a CrewAI tool's ``_run`` method with Grantex audit logging.
 
     On success, logs a ``'tool.run'`` audit entry with ``status='success'``.
     On failure, logs with ``status='failure'`` and re-raises the exception.
 
+    By default the entry is written synchronously with ``client.audit.log``
+    after the tool returns. With ``background=True`` entries are queued on a
+    ``BatchingAuditLogger`` shared by all tools using the same client and
+    sent in batches off the tool's thread; ``agent_did`` and ``principal_id``
+    are then required. Pass ``audit_logger`` to use a logger you manage
+    yourself (anything with a ``log(**entry)`` method, e.g. from
+    ``client.audit.batching()``).
+
+    Tool arguments are recorded under ``metadata["kwargs"]``. If their JSON
+    encoding exceeds ``max_metadata_bytes`` only the argument names are kept
+    (``None`` disables the limit); error messages are clipped to the same
+    size.
+
     Args:
         tool: A CrewAI ``BaseTool`` instance (returned by
               :func:`create_grantex_tool`).
         client: A ``grantex.Grantex`` client instance.
         agent_id: The Grantex agent ID to attribute the action to.
         grant_id: The grant ID authorising this tool invocation.
+        agent_did: The agent's DID, sent with each entry when given.
+        principal_id: The principal the grant belongs to, sent when given.
+        background: Queue entries on a shared background logger.
+        audit_logger: Explicit logger to queue entries on.
+        max_metadata_bytes: Size cap for recorded tool arguments.
 
     Returns:
         The same ``tool`` object with its ``_run`` method patched in-place.
@@ -31,26 +64,38 @@ def with_audit_logging(
         tool = with_audit_logging(tool, grantex_client,
                                   agent_id="ag_01...", grant_id="grnt_01...")
     """
+    if background and audit_logger is None:
+        if agent_did is None or principal_id is None:
+            raise ValueError("background audit logging requires agent_did and principal_id")
+        audit_logger = _shared_background_logger(client)
+    sink = audit_logger if audit_logger is not None else client.audit
+
+    identity: dict[str, str] = {"agent_id": agent_id, "grant_id": grant_id}
+    if agent_did is not None:
+        identity["agent_did"] = agent_did
+    if principal_id is not None:
+        identity["principal_id"] = principal_id
+
     original_run = tool._run  # noqa: SLF001
 
     def _audited_run(**kwargs: Any) -> str:
         action = f"tool.run:{tool.name}"
         try:
             result: str = original_run(**kwargs)
-            client.audit.log(
-                agent_id=agent_id,
-                grant_id=grant_id,
+            sink.log(
+                **identity,
                 action=action,
-                metadata={"kwargs": kwargs},
+                metadata=_tool_metadata(kwargs, max_metadata_bytes),
                 status="success",
             )
             return result
         except Exception as exc:
-            client.audit.log(
-                agent_id=agent_id,
-                grant_id=grant_id,
+            metadata = _tool_metadata(kwargs, max_metadata_bytes)
+            metadata["error"] = _clip(str(exc), max_metadata_bytes)
+            sink.log(
+                **identity,
                 action=action,
-                metadata={"kwargs": kwargs, "error": str(exc)},
+                metadata=metadata,
                 status="failure",
             )
             raise
@@ -60,3 +105,34 @@ def with_audit_logging(
         lambda self, **kw: _audited_run(**kw), tool
     )
     return tool
+
+
+def _shared_background_logger(client: Any) -> Any:
+    with _background_loggers_lock:
+        logger = _background_loggers.get(client)
+        if logger is None:
+            logger = _background_loggers[client] = client.audit.batching()
+            # The worker thread keeps the logger alive, so flush and stop it
+            # once the client is collected rather than leaving it running.
+            weakref.finalize(client, logger.close)
+        return logger
+
+
+def _tool_metadata(kwargs: dict[str, Any], max_bytes: int | None) -> dict[str, Any]:
+    if max_bytes is None:
+        return {"kwargs": kwargs}
+    size = len(json.dumps(kwargs, default=str).encode("utf-8"))
+    if size <= max_bytes:
+        return {"kwargs": kwargs}
+    return {
+        "kwargs_keys": sorted(kwargs),
+        "kwargs_truncated": True,
+        "kwargs_bytes": size,
+    }
+
+
+def _clip(text: str, max_bytes: int | None) -> str:
+    encoded = text.encode("utf-8")
+    if max_bytes is None or len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", errors="ignore") + "…"
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from unittest.mock import MagicMock
 
 import pytest
 
-from grantex_crewai import create_grantex_tool, with_audit_logging
+from grantex import BatchingAuditLogger, Grantex
+from grantex_crewai import _audit, create_grantex_tool, with_audit_logging
 from .conftest import make_grant_token
 
 
@@ -86,3 +89,104 @@ def test_audit_does_not_log_on_scope_error() -> None:
         )
 
     mock_client.audit.log.assert_not_called()
+
+
+def test_audit_passes_agent_did_and_principal(mock_grantex: MagicMock) -> None:
+    tool = _make_tool(lambda item: item)
+    tool = with_audit_logging(
+        tool, mock_grantex, agent_id="ag_01", grant_id="grnt_01",
+        agent_did="did:grantex:ag_01", principal_id="user_01",
+    )
+
+    tool._run(item="widget")
+
+    kwargs = mock_grantex.audit.log.call_args.kwargs
+    assert kwargs["agent_did"] == "did:grantex:ag_01"
+    assert kwargs["principal_id"] == "user_01"
+
+
+def test_audit_truncates_large_kwargs(mock_grantex: MagicMock) -> None:
+    def boom(item: str) -> str:
+        raise RuntimeError("x" * 500)
+
+    tool = with_audit_logging(
+        _make_tool(boom), mock_grantex, agent_id="ag_01", grant_id="grnt_01",
+        max_metadata_bytes=100,
+    )
+
+    with pytest.raises(RuntimeError):
+        tool._run(item="y" * 1000)
+
+    metadata = mock_grantex.audit.log.call_args.kwargs["metadata"]
+    assert "kwargs" not in metadata
+    assert metadata["kwargs_keys"] == ["item"]
+    assert metadata["kwargs_truncated"] is True
+    assert metadata["kwargs_bytes"] > 1000
+    assert metadata["error"] == "x" * 100 + "…"
+
+
+def test_audit_background_uses_shared_batching_logger(mock_grantex: MagicMock) -> None:
+    first = with_audit_logging(
+        _make_tool(lambda item: item), mock_grantex, agent_id="ag_01", grant_id="grnt_01",
+        agent_did="did:grantex:ag_01", principal_id="user_01", background=True,
+    )
+    second = with_audit_logging(
+        _make_tool(lambda item: item), mock_grantex, agent_id="ag_01", grant_id="grnt_01",
+        agent_did="did:grantex:ag_01", principal_id="user_01", background=True,
+    )
+
+    first._run(item="a")
+    second._run(item="b")
+
+    mock_grantex.audit.batching.assert_called_once_with()
+    logger = mock_grantex.audit.batching.return_value
+    assert logger.log.call_count == 2
+    mock_grantex.audit.log.assert_not_called()
+
+
+def test_audit_background_logger_stops_with_its_client() -> None:
+    client = Grantex(api_key="test-key")
+    tool = with_audit_logging(
+        _make_tool(lambda item: item), client, agent_id="ag_01", grant_id="grnt_01",
+        agent_did="did:grantex:ag_01", principal_id="user_01", background=True,
+    )
+    logger = _audit._background_loggers[client]
+    client_ref = weakref.ref(client)
+
+    del client
+    gc.collect()
+
+    assert client_ref() is None
+    assert logger not in _audit._background_loggers.values()
+    assert not logger._worker.is_alive()
+    assert tool is not None
+
+
+def test_audit_background_requires_identity(mock_grantex: MagicMock) -> None:
+    with pytest.raises(ValueError, match="agent_did and principal_id"):
+        with_audit_logging(
+            _make_tool(lambda: "ok"), mock_grantex, agent_id="ag_01",
+            grant_id="grnt_01", background=True,
+        )
+
+
+def test_audit_explicit_logger_with_real_batching(mock_grantex: MagicMock) -> None:
+    audit_client = MagicMock()
+    with BatchingAuditLogger(audit_client, flush_interval=60.0) as logger:
+        tool = with_audit_logging(
+            _make_tool(lambda item: item), mock_grantex, agent_id="ag_01",
+            grant_id="grnt_01", agent_did="did:grantex:ag_01",
+            principal_id="user_01", audit_logger=logger,
+        )
+        assert tool._run(item="widget") == "widget"
+        audit_client.log.assert_not_called()
+
+    audit_client.log.assert_called_once_with(
+        agent_id="ag_01",
+        agent_did="did:grantex:ag_01",
+        grant_id="grnt_01",
+        principal_id="user_01",
+        action="tool.run:test_tool",
+        metadata={"kwargs": {"item": "widget"}},
+        status="success",
+    )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import gzip
 import json
 import os
 from datetime import datetime, timezone
@@ -180,6 +181,7 @@ class OfflineAuditLog:
         api_key: str,
         bundle_id: str,
         batch_size: int = 100,
+        compress: bool = False,
     ) -> SyncResult:
         """Sync audit entries to the cloud in batches.
 
@@ -188,6 +190,12 @@ class OfflineAuditLog:
             api_key: Developer API key for authentication.
             bundle_id: The consent bundle ID.
             batch_size: Max entries per HTTP request.
+            compress: Gzip each batch (``Content-Encoding: gzip``). The
+                Grantex API does not decode compressed bodies, so only use
+                this with an endpoint that does. A batch refused with 415,
+                or with a 400 that the plain-JSON resend does not repeat,
+                is resent as plain JSON and compression is turned off for
+                the rest of the sync.
 
         Returns:
             A SyncResult with accepted/rejected counts.
@@ -218,12 +226,30 @@ class OfflineAuditLog:
                     "bundleId": bundle_id,
                     "entries": batch,
                 }
-                resp = await client.post(
-                    endpoint,
-                    json=body,
-                    headers=headers,
-                    timeout=30.0,
-                )
+                resp = None
+                refused = 0
+                if compress:
+                    resp = await client.post(
+                        endpoint,
+                        content=gzip.compress(
+                            json.dumps(body).encode("utf-8"), mtime=0
+                        ),
+                        headers={**headers, "Content-Encoding": "gzip"},
+                        timeout=30.0,
+                    )
+                    refused = resp.status_code
+                    if refused in (400, 415):
+                        resp = None
+                if resp is None:
+                    resp = await client.post(
+                        endpoint,
+                        json=body,
+                        headers=headers,
+                        timeout=30.0,
+                    )
+                    # A 400 for the plain body too is the batch's own fault
+                    if compress and (refused == 415 or resp.status_code != 400):
+                        compress = False
                 if resp.status_code >= 400:
                     raise HashChainError(
                         f"Sync failed ({resp.status_code}): {resp.text}"
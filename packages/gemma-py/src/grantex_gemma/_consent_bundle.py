@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from ._errors import GrantexAuthError
+from ._http import post_json
 from ._types import ConsentBundle, JWKSSnapshot, OfflineAuditKey
 
 
@@ -22,7 +23,9 @@ async def create_consent_bundle(
 
     Makes an HTTP POST to ``/v1/consent-bundles`` on the Grantex API,
     returning a ``ConsentBundle`` that contains everything the device
-    needs for offline operation.
+    needs for offline operation. The request goes through a pooled
+    client shared by calls on the same event loop and is retried on
+    connection errors and 429/502/503/504 responses.
 
     Args:
         api_key: Developer API key.
@@ -50,18 +53,12 @@ async def create_consent_bundle(
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.post(
-                url,
-                json=body,
-                headers=headers,
-                timeout=30.0,
-            )
-        except httpx.HTTPError as exc:
-            raise GrantexAuthError(
-                f"Network error creating consent bundle: {exc}"
-            ) from exc
+    try:
+        resp = await post_json(url, body, headers)
+    except httpx.HTTPError as exc:
+        raise GrantexAuthError(
+            f"Network error creating consent bundle: {exc}"
+        ) from exc
 
     if resp.status_code == 401:
         raise GrantexAuthError(
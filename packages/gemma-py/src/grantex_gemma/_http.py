@@ -0,0 +1,95 @@
+"""Shared, retrying HTTP transport for Grantex API calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import httpx
+
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.5  # seconds
+_RETRY_MAX_DELAY = 10.0  # seconds
+
+# httpx.AsyncClient is bound to the event loop that first uses it, so one
+# pooled client is kept per running loop. Its connections reference the
+# loop, so entries are removed explicitly rather than by garbage collection:
+# by aclose(), or when the loop closes its async generators on shutdown
+# (asyncio.run() does) through the generator that owns each client.
+_clients: dict[
+    asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+] = {}
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(timeout=30.0)
+        owner = _own(loop, client)
+        _clients[loop] = (client, owner)
+        await owner.asend(None)
+        return client
+    return entry[0]
+
+
+async def aclose() -> None:
+    """Close the pooled client of the running event loop, if any."""
+    entry = _clients.get(asyncio.get_running_loop())
+    if entry is not None:
+        await entry[1].aclose()
+
+
+async def _own(
+    loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+) -> AsyncGenerator[None, None]:
+    """Keep *client* until closed by aclose() or loop.shutdown_asyncgens()."""
+    try:
+        yield
+    finally:
+        entry = _clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _clients[loop]
+        await client.aclose()
+
+
+async def post_json(
+    url: str,
+    body: dict[str, Any],
+    headers: dict[str, str],
+    *,
+    max_retries: int = 2,
+    timeout: float = 30.0,
+) -> httpx.Response:
+    """POST ``body`` as JSON, retrying transport errors and 429/502/503/504.
+
+    Raises the last ``httpx.TransportError`` once retries are exhausted;
+    HTTP error responses are returned for the caller to interpret.
+    """
+    client = await get_client()
+    for attempt in range(max_retries + 1):
+        try:
+            resp = await client.post(url, json=body, headers=headers, timeout=timeout)
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+            await asyncio.sleep(_retry_delay(attempt, None))
+            continue
+        if resp.status_code in _RETRYABLE_STATUS_CODES and attempt < max_retries:
+            await asyncio.sleep(_retry_delay(attempt, resp.headers.get("retry-after")))
+            continue
+        return resp
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), _RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    delay = _RETRY_BASE_DELAY * (2**attempt) + random.random() * _RETRY_BASE_DELAY
+    return float(min(delay, _RETRY_MAX_DELAY))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -215,3 +216,82 @@ async def test_append_with_no_metadata(
     log = create_offline_audit_log(offline_audit_key, tmp_log_path)
     entry = await log.append("action1", sample_grant, "success")
     assert entry.metadata == {}
+
+
+@pytest.mark.asyncio
+async def test_sync_compressed_falls_back_on_415(
+    offline_audit_key: OfflineAuditKey,
+    tmp_log_path: str,
+    sample_grant: VerifiedGrant,
+) -> None:
+    """Compressed sync should gzip batches and drop to plain JSON on 415."""
+    log = create_offline_audit_log(offline_audit_key, tmp_log_path)
+    for i in range(4):
+        await log.append(f"action{i}", sample_grant, "success")
+
+    unsupported = MagicMock()
+    unsupported.status_code = 415
+    ok = MagicMock()
+    ok.status_code = 200
+    ok.json.return_value = {"accepted": 2, "rejected": 0}
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = [unsupported, ok, ok]
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+
+    with patch("grantex_gemma._audit_log.httpx.AsyncClient", return_value=mock_client):
+        result = await log.sync(
+            endpoint="https://api.grantex.dev/v1/audit/sync",
+            api_key="test-key",
+            bundle_id="bundle-123",
+            batch_size=2,
+            compress=True,
+        )
+
+    first, retry, second = mock_client.post.call_args_list
+    assert first.kwargs["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(first.kwargs["content"]))
+    assert body["bundleId"] == "bundle-123"
+    assert len(body["entries"]) == 2
+    assert retry.kwargs["json"] == body
+    assert "Content-Encoding" not in second.kwargs["headers"]
+    assert result.accepted == 4
+
+
+@pytest.mark.asyncio
+async def test_sync_compressed_falls_back_on_400(
+    offline_audit_key: OfflineAuditKey,
+    tmp_log_path: str,
+    sample_grant: VerifiedGrant,
+) -> None:
+    """A server without body decompression answers 400; sync resends plain JSON."""
+    log = create_offline_audit_log(offline_audit_key, tmp_log_path)
+    for i in range(4):
+        await log.append(f"action{i}", sample_grant, "success")
+
+    undecodable = MagicMock()
+    undecodable.status_code = 400
+    ok = MagicMock()
+    ok.status_code = 200
+    ok.json.return_value = {"accepted": 2, "rejected": 0}
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = [undecodable, ok, ok]
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+
+    with patch("grantex_gemma._audit_log.httpx.AsyncClient", return_value=mock_client):
+        result = await log.sync(
+            endpoint="https://api.grantex.dev/v1/audit/sync",
+            api_key="test-key",
+            bundle_id="bundle-123",
+            batch_size=2,
+            compress=True,
+        )
+
+    first, retry, second = mock_client.post.call_args_list
+    assert first.kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert "json" in retry.kwargs
+    assert "Content-Encoding" not in second.kwargs["headers"]
+    assert result.accepted == 4
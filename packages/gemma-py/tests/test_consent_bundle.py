@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import respx
 
+from grantex_gemma import _http
 from grantex_gemma import (
     BundleTamperedError,
     ConsentBundle,
@@ -112,6 +116,85 @@ async def test_create_bundle_auth_error() -> None:
             )
 
 
+_BUNDLE_RESPONSE: dict[str, Any] = {
+    "bundleId": "bnd_new",
+    "grantToken": "eyJ...",
+    "jwksSnapshot": {
+        "keys": [],
+        "fetchedAt": "2026-04-01T00:00:00Z",
+        "validUntil": "2026-04-04T00:00:00Z",
+    },
+    "offlineAuditKey": {"publicKey": "pub", "privateKey": "priv", "algorithm": "Ed25519"},
+    "checkpointAt": 0,
+    "syncEndpoint": "https://api.grantex.dev/v1/audit/sync",
+    "offlineExpiresAt": "2026-04-04T00:00:00Z",
+}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_create_bundle_retries_and_reuses_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Transient failures are retried on one pooled client per event loop."""
+    monkeypatch.setattr("grantex_gemma._http.asyncio.sleep", AsyncMock())
+    route = respx.post("https://api.grantex.dev/v1/consent-bundles").mock(
+        side_effect=[
+            httpx.ConnectError("refused"),
+            httpx.Response(503),
+            httpx.Response(200, json=_BUNDLE_RESPONSE),
+            httpx.Response(200, json=_BUNDLE_RESPONSE),
+        ]
+    )
+
+    first = await create_consent_bundle("key", "agent", "user", ["read:contacts"])
+    client = await _http.get_client()
+    second = await create_consent_bundle("key", "agent", "user", ["read:contacts"])
+
+    assert first.bundle_id == second.bundle_id == "bnd_new"
+    assert route.call_count == 4
+    assert await _http.get_client() is client
+    assert route.calls.last.request.headers["authorization"] == "Bearer key"
+    await _http.aclose()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_create_bundle_gives_up_after_retries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Persistent 503s surface as GrantexAuthError with the status code."""
+    monkeypatch.setattr("grantex_gemma._http.asyncio.sleep", AsyncMock())
+    route = respx.post("https://api.grantex.dev/v1/consent-bundles").mock(
+        return_value=httpx.Response(503, text="unavailable")
+    )
+
+    with pytest.raises(GrantexAuthError, match="503"):
+        await create_consent_bundle("key", "agent", "user", ["read:contacts"])
+    assert route.call_count == 3
+    await _http.aclose()
+
+
+@respx.mock
+def test_pooled_client_is_closed_with_its_loop() -> None:
+    """asyncio.run() shutting the loop down closes and drops its client."""
+    respx.post("https://api.grantex.dev/v1/consent-bundles").mock(
+        return_value=httpx.Response(200, json=_BUNDLE_RESPONSE)
+    )
+    clients: list[httpx.AsyncClient] = []
+
+    async def create() -> None:
+        await create_consent_bundle("key", "agent", "user", ["read:contacts"])
+        clients.append(await _http.get_client())
+
+    for _ in range(3):
+        asyncio.run(create())
+
+    assert _http._clients == {}
+    assert len(clients) == 3
+    assert all(client.is_closed for client in clients)
+
+
 def test_store_and_load_encrypted_bundle(tmp_path: Any) -> None:
     """Bundle should survive encrypt -> store -> load -> decrypt."""
     bundle = _make_bundle()
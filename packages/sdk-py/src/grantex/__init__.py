@@ -2,11 +2,34 @@
 
 from __future__ import annotations
 
+from ._audit_chain import compute_audit_hash, verify_audit_chain
+from ._audit_mirror import AuditMirror
+from ._batching import BatchingAuditLogger
+from ._cache import ResponseCache
+from ._circuit import CircuitBreaker
 from ._client import Grantex
+from ._codec import JsonCodec, get_json_codec
+from ._compression import RequestCompression
+from ._dispatcher import EventDispatcher
+from ._hedging import HedgingPolicy
+from ._hooks import (
+    ErrorEvent,
+    LatencyRecorder,
+    RequestEvent,
+    RequestHooks,
+    ResponseEvent,
+    RetryEvent,
+    RouteLatency,
+)
+from ._lazy import LazySequence
+from ._journal import EventJournal
+from ._multiplex import SharedEventStream, SharedSubscription
+from ._revocation import REVOCATION_EVENT_TYPES, RevocationCache
 from ._errors import (
     GrantexApiError,
     GrantexAuthError,
     GrantexError,
+    GrantexEventError,
     GrantexNetworkError,
     GrantexTokenError,
 )
@@ -145,7 +168,14 @@ from ._types import (
 from .resources._passports import PassportsClient
 from .resources._dpdp import DpdpClient
 from .resources._commerce import CommerceClient
-from .resources._events import EventsClient, GrantexEvent as GrantexStreamEvent, StreamOptions, Subscription
+from .resources._events import (
+    EventsClient,
+    GrantexEvent as GrantexStreamEvent,
+    ReconnectPolicy,
+    StreamMetrics,
+    StreamOptions,
+    Subscription,
+)
 
 # ─── Aliases for cross-SDK naming consistency ────────────────────────────────
 # The TypeScript SDK uses SsoConnectionListResponse / SsoSessionListResponse
@@ -156,7 +186,14 @@ SsoSessionListResponse = ListSsoSessionsResponse
 
 from ._pkce import PkceChallenge, generate_pkce
 from ._verify import verify_grant_token
-from ._webhook import verify_webhook, verify_webhook_signature
+from ._webhook import (
+    ReplayStore,
+    WebhookDelivery,
+    WebhookVerifier,
+    verify_webhook,
+    verify_webhook_signature,
+)
+from ._receiver import WebhookReceiver
 from .manifest import ToolManifest, Permission, EnforceResult
 from ._fastapi import GrantexEnforcer
 
@@ -177,14 +214,47 @@ __all__ = [
     # Webhook signature verification
     "verify_webhook",
     "verify_webhook_signature",
+    "WebhookVerifier",
+    "WebhookDelivery",
+    "ReplayStore",
+    "WebhookReceiver",
     # Errors
     "GrantexError",
     "GrantexApiError",
     "GrantexAuthError",
     "GrantexTokenError",
     "GrantexNetworkError",
+    "GrantexEventError",
     # Rate Limits
     "RateLimit",
+    # Response cache
+    "ResponseCache",
+    # Circuit breaker
+    "CircuitBreaker",
+    # Lazy list responses
+    "LazySequence",
+    # Hedged requests
+    "HedgingPolicy",
+    # JSON codec
+    "JsonCodec",
+    "get_json_codec",
+    # Request compression
+    "RequestCompression",
+    # Request lifecycle hooks
+    "RequestHooks",
+    "RequestEvent",
+    "ResponseEvent",
+    "RetryEvent",
+    "ErrorEvent",
+    "LatencyRecorder",
+    "RouteLatency",
+    # Background audit logging
+    "BatchingAuditLogger",
+    # Local audit chain verification
+    "compute_audit_hash",
+    "verify_audit_chain",
+    # Local audit mirror
+    "AuditMirror",
     # Types
     "Agent",
     "Anomaly",
@@ -308,6 +378,14 @@ __all__ = [
     "GrantexStreamEvent",
     "StreamOptions",
     "Subscription",
+    "ReconnectPolicy",
+    "StreamMetrics",
+    "EventDispatcher",
+    "EventJournal",
+    "SharedEventStream",
+    "SharedSubscription",
+    "RevocationCache",
+    "REVOCATION_EVENT_TYPES",
     # DPDP (Digital Personal Data Protection)
     "DpdpClient",
     "CommerceClient",
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from decimal import Decimal
+from typing import Any, Optional
+
+from ._types import AuditEntry, ChainIntegrity
+
+_DEFAULT_CHUNK_SIZE = 2048
+
+# (id, agentId, agentDid, grantId, principalId, developerId, action,
+#  metadata, timestamp, prevHash, status, hash) — plain values so chunks
+# pickle cheaply to worker processes.
+_Row = tuple[str, str, str, str, str, str, str, Any, str, Optional[str], str, str]
+
+
+def compute_audit_hash(entry: AuditEntry) -> str:
+    """Return the hash the server computes for *entry* in its current format.
+
+    Mirrors the auth service's ``computeAuditHash``: SHA-256 over the entry's
+    fields in a fixed order with ``metadata`` serialized canonically (keys
+    sorted). Requires ``entry.developer_id``, which the list and export
+    endpoints include.
+    """
+    row = _to_row(entry)
+    metadata = row[7] if row[7] is not None else {}
+    return _hash_current(row, _js_json(metadata, sort_keys=True))
+
+
+def verify_audit_chain(
+    entries: Iterable[AuditEntry],
+    *,
+    workers: int | None = None,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> ChainIntegrity:
+    """Verify an audit hash chain locally, the way the evidence pack does.
+
+    *entries* must be in chain order (oldest first), as returned by
+    ``client.compliance.iter_audit_export()``. Two properties are checked:
+    each entry's ``prev_hash`` links to its predecessor's ``hash``, and each
+    stored ``hash`` matches the entry's own fields under any hash layout the
+    service has used.
+
+    Hashes are recomputed in chunks of *chunk_size* entries on a process
+    pool of *workers* processes (default: one per CPU; ``0`` or ``1``
+    verifies in this process), while linkage is checked in a single pass as
+    entries are read. *entries* is consumed lazily, so a streamed export is
+    never held in memory as a whole. Verification stops at the first break,
+    which is reported with ``first_broken_at`` set to the entry's ID and
+    ``reason`` set to ``'link'`` or ``'content'``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return _verify(entries, chunk_size, None, 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _verify(entries, chunk_size, pool, workers * 2)
+
+
+def _verify(
+    entries: Iterable[AuditEntry],
+    chunk_size: int,
+    pool: Executor | None,
+    max_in_flight: int,
+) -> ChainIntegrity:
+    # Content checks for chunks already link-checked, in submission order.
+    pending: deque[tuple[int, list[_Row], Future[int]]] = deque()
+    link_break: int | None = None
+    link_break_id: str | None = None
+    prev_hash: str | None = None
+    offset = 0
+
+    def resolve() -> ChainIntegrity | None:
+        # Rows past a broken link are never submitted, so any content break
+        # found here comes before it.
+        start, rows, future = pending.popleft()
+        index = future.result()
+        if index < 0:
+            return None
+        return _broken(start + index, rows[index][0], "content")
+
+    for rows in _chunks(entries, chunk_size):
+        for i, row in enumerate(rows):
+            if prev_hash is not None and row[9] != prev_hash:
+                link_break, link_break_id = offset + i, row[0]
+                rows = rows[:i]
+                break
+            prev_hash = row[11]
+        if rows:
+            pending.append((offset, rows, _submit(pool, rows)))
+        offset += len(rows)
+        if link_break is not None:
+            break
+        while len(pending) >= max_in_flight:
+            result = resolve()
+            if result is not None:
+                return result
+
+    while pending:
+        result = resolve()
+        if result is not None:
+            return result
+    if link_break is not None:
+        return _broken(link_break, link_break_id, "link")
+    return ChainIntegrity(valid=True, checked_entries=offset, first_broken_at=None)
+
+
+def _submit(pool: Executor | None, rows: list[_Row]) -> Future[int]:
+    if pool is not None:
+        return pool.submit(_first_mismatch, rows)
+    future: Future[int] = Future()
+    future.set_result(_first_mismatch(rows))
+    return future
+
+
+def _broken(index: int, entry_id: str | None, reason: str) -> ChainIntegrity:
+    return ChainIntegrity(
+        valid=False, checked_entries=index, first_broken_at=entry_id, reason=reason
+    )
+
+
+def _chunks(entries: Iterable[AuditEntry], size: int) -> Iterator[list[_Row]]:
+    chunk: list[_Row] = []
+    for entry in entries:
+        chunk.append(_to_row(entry))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _to_row(entry: AuditEntry) -> _Row:
+    if entry.developer_id is None:
+        raise ValueError(
+            f"audit entry {entry.entry_id} has no developer_id; "
+            "it is required to recompute the entry hash"
+        )
+    return (
+        entry.entry_id,
+        entry.agent_id,
+        entry.agent_did,
+        entry.grant_id,
+        entry.principal_id,
+        entry.developer_id,
+        entry.action,
+        entry.metadata,
+        entry.timestamp,
+        entry.prev_hash,
+        entry.status,
+        entry.hash,
+    )
+
+
+def _first_mismatch(rows: list[_Row]) -> int:
+    """Index of the first row whose stored hash doesn't match, or -1."""
+    for i, row in enumerate(rows):
+        if not _matches(row):
+            return i
+    return -1
+
+
+def _matches(row: _Row) -> bool:
+    stored = row[11]
+    metadata = row[7] if row[7] is not None else {}
+    if _hash_current(row, _js_json(metadata, sort_keys=True)) == stored:
+        return True
+    # Entries written before metadata was canonicalized hashed the original
+    # JSON text, whose key order the API preserves.
+    legacy = _js_json(metadata, sort_keys=False)
+    return _hash_current(row, legacy) == stored or _hash_era_a(row, legacy) == stored
+
+
+def _prefix(row: _Row) -> str:
+    s = _js_string
+    return (
+        f'{{"id":{s(row[0])},"agentId":{s(row[1])},"agentDid":{s(row[2])},'
+        f'"grantId":{s(row[3])},"principalId":{s(row[4])},'
+        f'"developerId":{s(row[5])},"action":{s(row[6])},'
+    )
+
+
+def _hash_current(row: _Row, metadata_json: str) -> str:
+    payload = (
+        f'{_prefix(row)}"metadata":{metadata_json},"timestamp":{_js_string(row[8])},'
+        f'"prevHash":{_js_json(row[9])},"status":{_js_string(row[10])}}}'
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _hash_era_a(row: _Row, metadata_json: str) -> str:
+    payload = (
+        f'{_prefix(row)}"metadata":{metadata_json},"timestamp":{_js_string(row[8])},'
+        f'"previousHash":{_js_json(row[9])}}}'
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _js_string(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _js_json(value: Any, *, sort_keys: bool = False) -> str:
+    """Serialize *value* byte-for-byte as JavaScript's ``JSON.stringify`` would."""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, str):
+        return _js_string(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _js_number(value)
+    if isinstance(value, dict):
+        keys = list(value)
+        if sort_keys:
+            # JavaScript compares strings by UTF-16 code unit.
+            keys.sort(key=lambda k: k.encode("utf-16-be"))
+        items = ",".join(
+            f"{_js_string(k)}:{_js_json(value[k], sort_keys=sort_keys)}" for k in keys
+        )
+        return "{" + items + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_js_json(v, sort_keys=sort_keys) for v in value) + "]"
+    raise TypeError(f"unsupported metadata value: {type(value).__name__}")
+
+
+def _js_number(value: float) -> str:
+    if not math.isfinite(value):
+        return "null"
+    if value.is_integer() and abs(value) < 1e21:
+        return str(int(value))
+    text = repr(value)
+    if "e" not in text:
+        return text
+    mantissa, exp_text = text.split("e")
+    exp = int(exp_text)
+    if -7 < exp < 21:
+        return format(Decimal(text), "f")
+    return f"{mantissa}e{'+' if exp > 0 else '-'}{abs(exp)}"
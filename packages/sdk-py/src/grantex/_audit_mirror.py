@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import sqlite3
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Union
+
+from ._types import AuditEntry, ComplianceExportAuditParams, ListAuditParams
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .resources._compliance import ComplianceClient
+
+_DEFAULT_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_entries (
+    entry_id     TEXT PRIMARY KEY,
+    agent_id     TEXT NOT NULL,
+    agent_did    TEXT NOT NULL,
+    grant_id     TEXT NOT NULL,
+    principal_id TEXT NOT NULL,
+    developer_id TEXT,
+    action       TEXT NOT NULL,
+    metadata     TEXT NOT NULL,
+    hash         TEXT NOT NULL,
+    prev_hash    TEXT,
+    timestamp    TEXT NOT NULL,
+    status       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS audit_entries_timestamp
+    ON audit_entries (timestamp, entry_id);
+CREATE INDEX IF NOT EXISTS audit_entries_agent_id
+    ON audit_entries (agent_id, timestamp);
+CREATE INDEX IF NOT EXISTS audit_entries_grant_id
+    ON audit_entries (grant_id, timestamp);
+CREATE INDEX IF NOT EXISTS audit_entries_principal_id
+    ON audit_entries (principal_id, timestamp);
+CREATE INDEX IF NOT EXISTS audit_entries_action
+    ON audit_entries (action, timestamp);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "entry_id, agent_id, agent_did, grant_id, principal_id, developer_id, "
+    "action, metadata, hash, prev_hash, timestamp, status"
+)
+_INSERT = f"INSERT OR IGNORE INTO audit_entries ({_COLUMNS}) VALUES ({', '.join('?' * 12)})"
+_SAVE_WATERMARK = (
+    "INSERT INTO sync_state (key, value) VALUES ('watermark', ?) "
+    "ON CONFLICT (key) DO UPDATE SET value = excluded.value"
+)
+
+# ListAuditParams field -> indexed column
+_FILTERS = (
+    ("agent_id", "agent_id"),
+    ("grant_id", "grant_id"),
+    ("principal_id", "principal_id"),
+    ("action", "action"),
+)
+
+MirrorPath = Union[str, "os.PathLike[str]"]
+
+
+class AuditMirror:
+    """Keeps a local SQLite copy of the audit log for repeated queries.
+
+    ``sync()`` streams audit entries newer than the last synced timestamp
+    (the watermark) from the compliance export and appends them to the
+    database, committing every ``batch_size`` entries together with the
+    watermark so an interrupted sync resumes where it stopped. Entries are
+    immutable and keyed by ID, so the overlap at the watermark is skipped.
+
+    ``entries()`` and ``count()`` take the same :class:`ListAuditParams` as
+    ``client.audit.list()`` and are answered from indexes on ``agent_id``,
+    ``grant_id``, ``principal_id``, ``action`` and ``timestamp``. For other
+    analysis use :attr:`connection` directly; the table is
+    ``audit_entries`` with ``metadata`` stored as JSON text.
+
+    Example::
+
+        with client.audit.mirror("audit.db") as mirror:
+            mirror.sync()
+            for entry in mirror.entries(ListAuditParams(agent_id="ag_01", since="2026-01-01")):
+                ...
+    """
+
+    def __init__(
+        self,
+        compliance: ComplianceClient,
+        path: MirrorPath,
+        *,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._compliance = compliance
+        self._batch_size = batch_size
+        self._conn = sqlite3.connect(os.fspath(path))
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The underlying SQLite connection, for ad-hoc SQL."""
+        return self._conn
+
+    @property
+    def watermark(self) -> str | None:
+        """Timestamp of the newest synced entry, or ``None`` before the first sync."""
+        row = self._conn.execute(
+            "SELECT value FROM sync_state WHERE key = 'watermark'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, *, until: str | None = None) -> int:
+        """Fetch entries newer than the watermark; returns how many were added."""
+        params = ComplianceExportAuditParams(since=self.watermark, until=until)
+        entries = self._compliance.iter_audit_export(params)
+        added = 0
+        while True:
+            batch = list(itertools.islice(entries, self._batch_size))
+            if not batch:
+                return added
+            with self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany(_INSERT, [_to_row(e) for e in batch])
+                added += self._conn.total_changes - before
+                self._conn.execute(_SAVE_WATERMARK, (batch[-1].timestamp,))
+
+    def entries(self, params: ListAuditParams | None = None) -> Iterator[AuditEntry]:
+        """Mirrored entries matching *params*, oldest first.
+
+        ``page`` and ``page_size`` are applied as in the API; without
+        ``page_size`` every match is returned.
+        """
+        where, args = _where(params)
+        sql = f"SELECT {_COLUMNS} FROM audit_entries{where} ORDER BY timestamp, entry_id"
+        if params is not None and params.page_size is not None:
+            sql += " LIMIT ? OFFSET ?"
+            args += [params.page_size, ((params.page or 1) - 1) * params.page_size]
+        for row in self._conn.execute(sql, args):
+            yield _from_row(row)
+
+    def count(self, params: ListAuditParams | None = None) -> int:
+        """Number of mirrored entries matching *params* (paging is ignored)."""
+        where, args = _where(params)
+        row = self._conn.execute(f"SELECT COUNT(*) FROM audit_entries{where}", args).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _where(params: ListAuditParams | None) -> tuple[str, list[Any]]:
+    if params is None:
+        return "", []
+    clauses: list[str] = []
+    args: list[Any] = []
+    for field, column in _FILTERS:
+        value = getattr(params, field)
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            args.append(value)
+    if params.since is not None:
+        clauses.append("timestamp >= ?")
+        args.append(params.since)
+    if params.until is not None:
+        clauses.append("timestamp <= ?")
+        args.append(params.until)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), args
+
+
+def _to_row(entry: AuditEntry) -> tuple[Any, ...]:
+    return (
+        entry.entry_id,
+        entry.agent_id,
+        entry.agent_did,
+        entry.grant_id,
+        entry.principal_id,
+        entry.developer_id,
+        entry.action,
+        json.dumps(entry.metadata, ensure_ascii=False),
+        entry.hash,
+        entry.prev_hash,
+        entry.timestamp,
+        entry.status,
+    )
+
+
+def _from_row(row: tuple[Any, ...]) -> AuditEntry:
+    return AuditEntry(
+        entry_id=row[0],
+        agent_id=row[1],
+        agent_did=row[2],
+        grant_id=row[3],
+        principal_id=row[4],
+        developer_id=row[5],
+        action=row[6],
+        metadata=json.loads(row[7]),
+        hash=row[8],
+        prev_hash=row[9],
+        timestamp=row[10],
+        status=row[11],
+    )
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable
+
+from ._errors import GrantexApiError, GrantexNetworkError
+from ._http import _retries
+from ._types import LogAuditParams
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .resources._audit import AuditClient
+
+_DEFAULT_MAX_QUEUE = 10_000
+_DEFAULT_BATCH_SIZE = 50
+_DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+_DEFAULT_MAX_RETRIES = 3
+_DEFAULT_CLOSE_TIMEOUT = 10.0  # seconds
+_RETRY_BASE_DELAY = 1.0  # seconds
+_RETRY_MAX_DELAY = 30.0  # seconds
+
+_logger = logging.getLogger(__name__)
+
+DropHandler = Callable[[LogAuditParams, "Exception | None"], None]
+
+
+class BatchingAuditLogger:
+    """Moves ``audit.log()`` off the request path.
+
+    Entries go into a bounded in-memory queue and return immediately. A
+    background thread drains the queue once ``batch_size`` entries are
+    waiting or every ``flush_interval`` seconds, posting them in order
+    through the client's ``HttpClient`` (so its circuit breaker and hooks
+    still apply). Retries are the logger's, not the client's: each entry is
+    posted through ``audit.log()`` with the client's retries turned off, and
+    entries that fail with a network error, ``429`` or ``5xx`` are retried
+    with backoff up to ``max_retries`` more times; other API errors are not
+    retried.
+
+    When the queue is full new entries are dropped. Drops and entries that
+    could not be delivered are counted and passed to ``on_drop`` together
+    with the error (``None`` for a full queue); exceptions raised by
+    ``on_drop`` are logged and otherwise ignored.
+
+    ``close()`` flushes what is queued and stops the worker; it also runs at
+    interpreter exit.
+
+    Example::
+
+        with client.audit.batching(flush_interval=2.0) as audit:
+            audit.log(agent_id=..., agent_did=..., grant_id=...,
+                      principal_id=..., action="email.send")
+    """
+
+    def __init__(
+        self,
+        audit: AuditClient,
+        *,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        on_drop: DropHandler | None = None,
+    ) -> None:
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+        self._audit = audit
+        self._max_queue = max_queue
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_retries = max_retries
+        self._on_drop = on_drop
+        self._queue: deque[LogAuditParams] = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._sent = 0
+        self._dropped = 0
+        self._failed = 0
+        self._worker = threading.Thread(
+            target=self._run, name="grantex-audit-batch", daemon=True
+        )
+        self._worker.start()
+        self._atexit = functools.partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit)
+
+    @property
+    def sent(self) -> int:
+        """Entries accepted by the server."""
+        return self._sent
+
+    @property
+    def dropped(self) -> int:
+        """Entries rejected because the queue was full (or the logger closed)."""
+        return self._dropped
+
+    @property
+    def failed(self) -> int:
+        """Entries given up on after an API or network error."""
+        return self._failed
+
+    @property
+    def pending(self) -> int:
+        """Entries queued or being sent."""
+        with self._cond:
+            return len(self._queue) + self._in_flight
+
+    def log(
+        self,
+        *,
+        agent_id: str,
+        agent_did: str,
+        grant_id: str,
+        principal_id: str,
+        action: str,
+        metadata: dict[str, Any] | None = None,
+        status: str = "success",
+    ) -> bool:
+        """Queue an entry (same arguments as ``AuditClient.log``).
+
+        Returns ``False`` if the entry was dropped.
+        """
+        return self.enqueue(
+            LogAuditParams(
+                agent_id=agent_id,
+                agent_did=agent_did,
+                grant_id=grant_id,
+                principal_id=principal_id,
+                action=action,
+                metadata=metadata,
+                status=status,
+            )
+        )
+
+    def enqueue(self, params: LogAuditParams) -> bool:
+        with self._cond:
+            accepted = not self._closed and len(self._queue) < self._max_queue
+            if accepted:
+                self._queue.append(params)
+                if len(self._queue) >= self._batch_size:
+                    self._cond.notify_all()
+            else:
+                self._dropped += 1
+        if not accepted:
+            self._report_drop(params, None)
+        return accepted
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything queued so far has been handled.
+
+        Returns ``False`` if *timeout* elapsed first.
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._queue and self._in_flight == 0, timeout
+            )
+
+    def close(self, timeout: float | None = _DEFAULT_CLOSE_TIMEOUT) -> bool:
+        """Flush, stop the worker and refuse further entries.
+
+        Returns ``False`` if entries were still pending after *timeout*.
+        """
+        atexit.unregister(self._atexit)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+        return not self._worker.is_alive()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            for params in batch:
+                try:
+                    self._deliver(params)
+                finally:
+                    with self._cond:
+                        self._in_flight -= 1
+                        self._cond.notify_all()
+
+    def _next_batch(self) -> list[LogAuditParams] | None:
+        with self._cond:
+            wake_at = time.monotonic() + self._flush_interval
+            while (
+                not self._closed
+                and not self._flush_requested
+                and len(self._queue) < self._batch_size
+            ):
+                remaining = wake_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if not self._queue:
+                self._flush_requested = False
+                return None if self._closed else []
+            count = min(self._batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._in_flight = count
+            return batch
+
+    def _deliver(self, params: LogAuditParams) -> None:
+        attempt = 0
+        while True:
+            try:
+                with _retries(0):
+                    self._audit.log(**vars(params))
+            except Exception as exc:  # noqa: BLE001
+                # Any failure is reported rather than allowed to kill the worker
+                if _is_retryable(exc) and attempt < self._max_retries:
+                    time.sleep(_backoff(attempt))
+                    attempt += 1
+                    continue
+                with self._cond:
+                    self._failed += 1
+                self._report_drop(params, exc)
+                return
+            with self._cond:
+                self._sent += 1
+            return
+
+    def _report_drop(self, params: LogAuditParams, error: Exception | None) -> None:
+        if self._on_drop is None:
+            return
+        try:
+            self._on_drop(params, error)
+        except Exception:
+            _logger.exception("BatchingAuditLogger on_drop handler raised")
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, GrantexNetworkError):
+        return True
+    return isinstance(exc, GrantexApiError) and (
+        exc.status_code == 429 or exc.status_code >= 500
+    )
+
+
+def _backoff(attempt: int) -> float:
+    delay = _RETRY_BASE_DELAY * (2 ** attempt) + random.random() * _RETRY_BASE_DELAY
+    return float(min(delay, _RETRY_MAX_DELAY))
+
+
+def _close_at_exit(ref: weakref.ReferenceType[BatchingAuditLogger]) -> None:
+    logger = ref()
+    if logger is not None:
+        logger.close()
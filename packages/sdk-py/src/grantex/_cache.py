@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+_DEFAULT_MAX_ENTRIES = 256
+_DEFAULT_TTL = 300.0  # seconds
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored GET response together with its validators."""
+
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that turn the next GET into a conditional request."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Bounded LRU cache of GET responses, revalidated with ETag/Last-Modified.
+
+    The cache never serves a body without asking the server first: a cached
+    entry only adds ``If-None-Match`` / ``If-Modified-Since`` to the next GET
+    for the same path, and the stored body is reused when the server answers
+    ``304 Not Modified``. Responses without validators are not stored.
+
+    Entries are dropped once their TTL elapses or when the cache is full
+    (least recently used first); a ``304`` restarts the entry's TTL. ``path_ttls`` maps path prefixes to TTLs in
+    seconds; the longest matching prefix wins, and a TTL of ``0`` disables
+    caching for that prefix.
+
+    Subclass and override :meth:`get`, :meth:`store` and :meth:`invalidate`
+    to back the cache with another store.
+
+    Example::
+
+        cache = ResponseCache(max_entries=512, path_ttls={"/v1/policies": 60})
+        client = Grantex(api_key="...", cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl: float = _DEFAULT_TTL,
+        path_ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        # Longest prefix first so the first match is the most specific one
+        self._path_ttls = sorted(
+            (path_ttls or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL that applies to *path* (query string ignored)."""
+        bare_path = path.split("?", 1)[0]
+        for prefix, ttl in self._path_ttls:
+            if bare_path.startswith(prefix):
+                return ttl
+        return self._ttl
+
+    def get(self, path: str) -> CachedResponse | None:
+        """Return the live entry for *path*, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[path]
+                return None
+            self._entries.move_to_end(path)
+            return entry
+
+    def store(
+        self,
+        path: str,
+        content: bytes,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Store a response body for *path* if it carries a validator."""
+        ttl = self.ttl_for(path)
+        if ttl <= 0 or (etag is None and last_modified is None):
+            self.invalidate(path)
+            return
+        entry = CachedResponse(
+            content=content,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=time.monotonic() + ttl,
+        )
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry whose path starts with *prefix* (all by default)."""
+        with self._lock:
+            for path in [p for p in self._entries if p.startswith(prefix)]:
+                del self._entries[path]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from ._errors import GrantexNetworkError
+
+_DEFAULT_FAILURE_THRESHOLD = 5
+_DEFAULT_RECOVERY_TIMEOUT = 30.0  # seconds
+_DEFAULT_HALF_OPEN_MAX_CALLS = 1
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+class CircuitBreaker:
+    """Per-route circuit breaker for :class:`~grantex._http.HttpClient`.
+
+    Circuits are keyed by HTTP method and route template (``GET
+    /v1/grants/:id``), so one failing endpoint does not block the others.
+    Network errors, timeouts and 5xx responses count as failures; after
+    ``failure_threshold`` consecutive failures the circuit opens and calls
+    fail immediately with :class:`GrantexNetworkError` instead of running the
+    retry loop. Once ``recovery_timeout`` seconds have passed, up to
+    ``half_open_max_calls`` probe requests are let through: a success closes
+    the circuit, a failure opens it again. A probe whose call is abandoned
+    before a response or network error is handed back with :meth:`release`.
+
+    Example::
+
+        client = Grantex(api_key="...", circuit_breaker=CircuitBreaker(failure_threshold=3))
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = _DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = _DEFAULT_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = _DEFAULT_HALF_OPEN_MAX_CALLS,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, key: str) -> str:
+        """Return ``"closed"``, ``"open"`` or ``"half_open"`` for *key*."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self._recovery_elapsed(circuit):
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, key: str) -> None:
+        """Admit a request on *key* or raise if its circuit is open."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                if not self._recovery_elapsed(circuit):
+                    remaining = circuit.opened_at + self._recovery_timeout - time.monotonic()
+                    raise GrantexNetworkError(
+                        f"Circuit open for {key}; failing fast "
+                        f"(next probe in {remaining:.1f}s)"
+                    )
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self._half_open_max_calls:
+                raise GrantexNetworkError(
+                    f"Circuit half-open for {key}; probe already in flight"
+                )
+            circuit.probes += 1
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None:
+                circuit.state = CLOSED
+                circuit.failures = 0
+                circuit.probes = 0
+
+    def release(self, key: str) -> None:
+        """Give back a probe admitted by :meth:`before_request` whose call
+        ended without an outcome (deadline, hook error, interrupt)."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self._failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _recovery_elapsed(self, circuit: _Circuit) -> bool:
+        return time.monotonic() - circuit.opened_at >= self._recovery_timeout
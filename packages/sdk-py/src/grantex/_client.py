@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Callable
-
-import httpx
-
+import threading
+from typing import Any, Callable, ContextManager, Sequence
+
+from ._cache import ResponseCache
+from ._circuit import CircuitBreaker
+from ._codec import JsonCodec
+from ._compression import RequestCompression
+from ._hedging import HedgingPolicy
+from ._hooks import RequestHooks
+from ._errors import GrantexApiError
 from ._http import HttpClient
 from ._types import (
     AuthorizationRequest,
@@ -39,11 +45,25 @@ from .resources._passports import PassportsClient
 from .resources._dpdp import DpdpClient
 from .resources._commerce import CommerceClient
 from .manifest import ToolManifest, Permission, EnforceResult
+from ._revocation import _DEFAULT_TTL as _REVOCATION_TTL, RevocationCache
 from ._verify import verify_grant_token
 from ._types import VerifyGrantTokenOptions
 
 _DEFAULT_BASE_URL = "https://api.grantex.dev"
 
+_signup_clients: dict[str, HttpClient] = {}
+_signup_clients_lock = threading.Lock()
+
+
+def _signup_client(base_url: str) -> HttpClient:
+    """Shared anonymous client per base URL so repeated signups reuse connections."""
+    key = base_url.rstrip("/")
+    with _signup_clients_lock:
+        client = _signup_clients.get(key)
+        if client is None:
+            client = _signup_clients[key] = HttpClient(base_url=key, api_key="")
+        return client
+
 
 class Grantex:
     """Main entry point for the Grantex SDK."""
@@ -83,6 +103,13 @@ class Grantex:
         timeout: float = 30.0,
         max_retries: int = 3,
         enforce_mode: str = "strict",
+        cache: ResponseCache | None = None,
+        json_codec: str | JsonCodec = "auto",
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        compression: RequestCompression | None = None,
+        hooks: RequestHooks | Sequence[RequestHooks] | None = None,
+        deadline: float | None = None,
     ) -> None:
         resolved_key = (api_key or os.environ.get("GRANTEX_API_KEY", "")).strip()
         if not resolved_key:
@@ -98,6 +125,13 @@ class Grantex:
             api_key=resolved_key,
             timeout=timeout,
             max_retries=max_retries,
+            cache=cache,
+            json_codec=json_codec,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            compression=compression,
+            hooks=hooks,
+            deadline=deadline,
         )
 
         self.agents = AgentsClient(self._http)
@@ -112,7 +146,7 @@ class Grantex:
         self.scim = ScimClient(self._http)
         self.sso = SsoClient(self._http)
         self.principal_sessions = PrincipalSessionsClient(self._http)
-        self.vault = VaultClient(self._http, base_url)
+        self.vault = VaultClient(self._http)
         self.budgets = BudgetsClient(self._http)
         self.events = EventsClient(base_url, resolved_key)
         self.usage = UsageClient(self._http)
@@ -123,6 +157,7 @@ class Grantex:
         self.dpdp = DpdpClient(self._http)
         self.commerce = CommerceClient(self._http)
         self._manifests: dict[str, ToolManifest] = {}
+        self._revocations: RevocationCache | None = None
         self._jwks_uri = f"{base_url.rstrip('/')}/.well-known/jwks.json"
 
     @staticmethod
@@ -135,25 +170,19 @@ class Grantex:
 
         Returns the developer ID and a one-time API key.
         """
-        url = f"{base_url.rstrip('/')}/v1/signup"
-        response = httpx.post(
-            url,
-            json=params.to_dict(),
-            headers={"Accept": "application/json"},
-        )
-        if not response.is_success:
-            body = None
-            try:
-                body = response.json()
-            except Exception:
-                pass
-            message = (
-                body["message"]
-                if isinstance(body, dict) and isinstance(body.get("message"), str)
-                else f"HTTP {response.status_code}"
-            )
-            raise ValueError(message)
-        return SignupResponse.from_dict(response.json())
+        try:
+            data = _signup_client(base_url).post("/v1/signup", params.to_dict())
+        except GrantexApiError as exc:
+            raise ValueError(str(exc)) from exc
+        return SignupResponse.from_dict(data)
+
+    def deadline(self, seconds: float) -> ContextManager[None]:
+        """Give every API call inside a ``with`` block one shared time budget.
+
+        Retries are skipped once the remaining budget cannot cover another
+        attempt, and a call that runs out raises ``GrantexNetworkError``.
+        """
+        return self._http.deadline(seconds)
 
     def rotate_key(self) -> RotateKeyResponse:
         """Rotate the current API key. Returns a new key; the old key is invalidated."""
@@ -191,6 +220,24 @@ class Grantex:
             if fname.endswith(".json"):
                 self.load_manifest(ToolManifest.from_file(os.path.join(dir_path, fname)))
 
+    def watch_revocations(
+        self,
+        *,
+        ttl: float = _REVOCATION_TTL,
+        fail_closed: bool = False,
+    ) -> RevocationCache:
+        """Start a :class:`RevocationCache` on this client's event stream.
+
+        :meth:`enforce` then rejects tokens for grants revoked since the
+        cache started, without an online check. Returns the running cache;
+        calling again returns the same one.
+        """
+        if self._revocations is None:
+            self._revocations = RevocationCache(
+                self.events, ttl=ttl, fail_closed=fail_closed
+            ).start()
+        return self._revocations
+
     def enforce(
         self,
         grant_token: str,
@@ -201,6 +248,7 @@ class Grantex:
         """Enforce scope for a tool call.
 
         1. Verifies the grant token JWT locally using the issuer's JWKS
+           (and, after :meth:`watch_revocations`, that it is not revoked)
         2. Looks up the tool's required permission from loaded manifests
         3. Checks if the granted scope level covers the required permission
 
@@ -226,6 +274,7 @@ class Grantex:
             grant = verify_grant_token(
                 grant_token,
                 VerifyGrantTokenOptions(jwks_uri=self._jwks_uri),
+                revocations=self._revocations,
             )
         except Exception as e:
             return self._apply_enforce_mode(EnforceResult(
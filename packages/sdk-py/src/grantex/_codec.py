@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+_CODEC_PREFERENCE = ("orjson", "msgspec", "stdlib")
+
+
+class JsonCodec:
+    """JSON encoder/decoder pair used for request and response bodies.
+
+    Use :func:`get_json_codec` to pick the fastest installed backend, or build
+    one from any ``dumps``/``loads`` pair::
+
+        codec = JsonCodec("custom", dumps=my_dumps, loads=my_loads)
+        client = Grantex(api_key="...", json_codec=codec)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes | str], Any],
+    ) -> None:
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize *obj* to UTF-8 JSON bytes."""
+        return self._dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Deserialize a JSON document."""
+        return self._loads(data)
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JsonCodec:
+    # Same settings httpx uses for ``json=`` so the wire format does not change
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    return JsonCodec("stdlib", dumps=dumps, loads=json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec("orjson", dumps=dumps, loads=orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec  # type: ignore[import-not-found,unused-ignore]
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec("msgspec", dumps=encoder.encode, loads=decoder.decode)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "stdlib": _stdlib_codec,
+}
+
+
+def get_json_codec(name: str = "auto") -> JsonCodec:
+    """Return the JSON codec called *name*.
+
+    ``"auto"`` picks orjson, then msgspec, then the standard library,
+    depending on what is installed. Naming a backend that is not installed
+    raises :class:`ImportError`.
+    """
+    if name == "auto":
+        for candidate in _CODEC_PREFERENCE:
+            try:
+                return _FACTORIES[candidate]()
+            except ImportError:
+                continue
+    try:
+        factory = _FACTORIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON codec {name!r}; expected one of "
+            f"{', '.join(('auto',) + _CODEC_PREFERENCE)}"
+        ) from None
+    return factory()
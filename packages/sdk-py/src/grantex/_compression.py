@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gzip
+from typing import Callable
+
+_DEFAULT_THRESHOLD = 1024  # bytes
+_SUPPORTED_ENCODINGS = ("gzip", "zstd")
+
+
+class RequestCompression:
+    """Opt-in ``Content-Encoding`` for large request bodies.
+
+    JSON bodies of at least ``threshold`` bytes are compressed with
+    ``encoding`` (``"gzip"``, or ``"zstd"`` when the ``zstandard`` package is
+    installed) before being sent.
+
+    The Grantex API does not currently decode compressed request bodies, so
+    this is meant for proxies or deployments that do. A server that can't
+    decode the body answers ``415 Unsupported Media Type`` or, like the
+    Grantex API, ``400 Bad Request``; either way the request is resent
+    uncompressed once. After a ``415``, or a ``400`` that the uncompressed
+    resend does not repeat, compression stays off for the rest of this
+    object's life. A ``400`` that comes back for the uncompressed body too
+    is a genuine client error and is raised as usual.
+
+    Example::
+
+        client = Grantex(api_key="...", compression=RequestCompression("gzip"))
+        client.commerce.bulk_upsert_catalog_products({"products": products})
+    """
+
+    def __init__(
+        self,
+        encoding: str = "gzip",
+        *,
+        threshold: int = _DEFAULT_THRESHOLD,
+        level: int | None = None,
+    ) -> None:
+        if encoding not in _SUPPORTED_ENCODINGS:
+            raise ValueError(
+                f"Unsupported encoding {encoding!r}; expected one of "
+                f"{', '.join(_SUPPORTED_ENCODINGS)}"
+            )
+        self.encoding = encoding
+        self.threshold = threshold
+        self._compress = _compressor(encoding, level)
+        self._enabled = True
+
+    @property
+    def enabled(self) -> bool:
+        """``False`` once the server has refused a compressed body."""
+        return self._enabled
+
+    def compress(self, content: bytes) -> bytes | None:
+        """Return the compressed body, or ``None`` to send *content* as is."""
+        if not self._enabled or len(content) < self.threshold:
+            return None
+        return self._compress(content)
+
+    def disable(self) -> None:
+        self._enabled = False
+
+
+def _compressor(encoding: str, level: int | None) -> Callable[[bytes], bytes]:
+    if encoding == "gzip":
+        gzip_level = 6 if level is None else level
+
+        def compress_gzip(content: bytes) -> bytes:
+            return gzip.compress(content, compresslevel=gzip_level, mtime=0)
+
+        return compress_gzip
+
+    try:
+        import zstandard  # type: ignore[import-not-found,unused-ignore]
+    except ImportError:
+        raise ImportError(
+            "zstd request compression requires the 'zstandard' package"
+        ) from None
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    compress_zstd: Callable[[bytes], bytes] = compressor.compress
+    return compress_zstd
@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import deque
+from typing import IO, TYPE_CHECKING, Callable
+
+from ._journal import EventJournal
+from .resources._events import (
+    _DEFAULT_RECONNECT,
+    EventsClient,
+    GrantexEvent,
+    ReconnectPolicy,
+    StreamOptions,
+    Subscription,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_DEFAULT_WORKERS = 4
+_DEFAULT_MAX_QUEUE = 1000
+_DEFAULT_STOP_TIMEOUT = 10.0  # seconds
+_OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+_ALL_TYPES = "*"
+
+_logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[GrantexEvent], None]
+HandlerErrorHandler = Callable[[Exception, GrantexEvent], None]
+EventDropHandler = Callable[[GrantexEvent], None]
+
+
+class EventDispatcher:
+    """Routes streamed events to per-type handlers on a worker pool.
+
+    The stream is read on its own thread, which only places events in a
+    bounded queue; ``workers`` threads take events from the queue and call
+    every handler registered for the event's type (plus ``"*"`` handlers).
+    A slow handler therefore holds up a worker, not the connection.
+    Handlers may run concurrently and out of order; one that raises is
+    counted in ``failed`` and passed to ``on_error``. Stream errors (dropped
+    connections, undecodable events) are counted in ``failed`` too.
+    Exceptions raised by ``on_error`` or ``on_drop`` are logged and
+    otherwise ignored.
+
+    When ``max_queue`` events are waiting, ``overflow`` decides:
+
+    * ``"block"`` — the reader waits for space, pushing back on the server.
+    * ``"drop_oldest"`` — the oldest queued event is discarded (``on_drop``).
+    * ``"spill"`` — events go to an append-only file in ``spill_dir`` (a
+      temporary directory by default) and are read back in order once the
+      workers catch up, so nothing is lost and memory stays bounded.
+
+    With a ``journal`` (an :class:`~grantex.EventJournal`), each event is
+    recorded before it is queued and acknowledged once every handler has
+    run without raising. ``start()`` first replays events left
+    unacknowledged by a previous run, and events already in the journal
+    are not dispatched again, so processing is at-least-once across
+    restarts. Events dropped by ``drop_oldest`` or a failing handler stay
+    unacknowledged and are replayed on the next start.
+
+    Example::
+
+        dispatcher = EventDispatcher(client.events, workers=8, overflow="spill")
+
+        @dispatcher.on("grant.revoked")
+        def evict(event):
+            cache.pop(event.data["grantId"], None)
+
+        with dispatcher.start():
+            ...
+    """
+
+    def __init__(
+        self,
+        events: EventsClient,
+        *,
+        workers: int = _DEFAULT_WORKERS,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+        overflow: str = "block",  # 'block' | 'drop_oldest' | 'spill'
+        spill_dir: str | os.PathLike[str] | None = None,
+        reconnect: ReconnectPolicy | None = _DEFAULT_RECONNECT,
+        on_error: HandlerErrorHandler | None = None,
+        on_drop: EventDropHandler | None = None,
+        journal: EventJournal | None = None,
+    ) -> None:
+        if workers < 1 or max_queue < 1:
+            raise ValueError("workers and max_queue must be at least 1")
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(_OVERFLOW_POLICIES)}")
+        self._events = events
+        self._worker_count = workers
+        self._max_queue = max_queue
+        self._overflow = overflow
+        self._spill_dir = spill_dir
+        self._reconnect = reconnect
+        self._on_error = on_error
+        self._on_drop = on_drop
+        self._journal = journal
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self._queue: deque[GrantexEvent] = deque()
+        self._spill: _SpillFile | None = None
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._dispatched = 0
+        self._dropped = 0
+        self._spilled = 0
+        self._failed = 0
+        self._workers: list[threading.Thread] = []
+        self._subscription: Subscription | None = None
+
+    @property
+    def dispatched(self) -> int:
+        """Events whose handlers have all run."""
+        return self._dispatched
+
+    @property
+    def dropped(self) -> int:
+        """Events discarded by ``drop_oldest`` or after ``stop()``."""
+        return self._dropped
+
+    @property
+    def spilled(self) -> int:
+        """Events that were written to the spill file."""
+        return self._spilled
+
+    @property
+    def failed(self) -> int:
+        """Handler calls that raised, plus errors reported by the stream."""
+        return self._failed
+
+    @property
+    def pending(self) -> int:
+        """Events queued in memory or on disk, or being handled."""
+        with self._cond:
+            spilled = self._spill.pending if self._spill is not None else 0
+            return len(self._queue) + spilled + self._in_flight
+
+    @property
+    def subscription(self) -> Subscription | None:
+        """The stream subscription feeding the dispatcher, once started."""
+        return self._subscription
+
+    def on(
+        self, event_type: str, handler: EventHandler | None = None
+    ) -> Callable[[EventHandler], EventHandler]:
+        """Register *handler* for *event_type* (``"*"`` for every event).
+
+        Usable directly or as a decorator; returns a decorator either way.
+        """
+
+        def register(fn: EventHandler) -> EventHandler:
+            with self._cond:
+                self._handlers.setdefault(event_type, []).append(fn)
+            return fn
+
+        if handler is not None:
+            register(handler)
+        return register
+
+    def start(self, options: StreamOptions | None = None) -> EventDispatcher:
+        """Start the workers and subscribe to the event stream.
+
+        Without *options* the stream is filtered to the registered event
+        types (unless a ``"*"`` handler is registered). Unacknowledged
+        events in the journal are queued first.
+        """
+        if self._subscription is not None:
+            raise RuntimeError("dispatcher already started")
+        if options is None:
+            with self._cond:
+                types = sorted(self._handlers)
+            options = StreamOptions(types=None if _ALL_TYPES in types else types)
+        self._start_workers()
+        if self._journal is not None:
+            for event in self._journal.pending():
+                self._enqueue(event)
+        self._subscription = self._events.subscribe(
+            self._receive, options, on_error=self._stream_error, reconnect=self._reconnect
+        )
+        return self
+
+    def dispatch(self, event: GrantexEvent) -> bool:
+        """Queue *event* for the handlers, applying the overflow policy.
+
+        Called by the stream reader; also usable to feed events from
+        elsewhere. Returns ``False`` if the event was discarded. With a
+        journal, an event that was already journaled is skipped.
+        """
+        if self._journal is not None and not self._journal.append(event):
+            return True
+        return self._enqueue(event)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued event has been handled.
+
+        Returns ``False`` if *timeout* elapsed first.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._idle(), timeout)
+
+    def stop(self, timeout: float | None = _DEFAULT_STOP_TIMEOUT) -> bool:
+        """Unsubscribe, let the workers finish what is queued, and stop them.
+
+        Returns ``False`` if workers were still busy after *timeout*.
+        """
+        with self._cond:
+            # Closing first releases a reader blocked on a full queue.
+            self._closed = True
+            self._cond.notify_all()
+        if self._subscription is not None:
+            self._subscription.unsubscribe()
+        for worker in self._workers:
+            worker.join(timeout)
+        if any(worker.is_alive() for worker in self._workers):
+            return False
+        if self._spill is not None:
+            self._spill.close()
+        return True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def _receive(self, event: GrantexEvent) -> None:
+        self.dispatch(event)
+
+    def _stream_error(self, exc: Exception) -> None:
+        with self._cond:
+            self._failed += 1
+
+    def _enqueue(self, event: GrantexEvent) -> bool:
+        self._start_workers()
+        dropped: GrantexEvent | None = None
+        with self._cond:
+            if self._closed:
+                self._dropped += 1
+                dropped = event
+            elif self._spill is not None and self._spill.pending:
+                # Keep order: once spilling, new events queue behind the file.
+                self._spill_event(event)
+            elif len(self._queue) < self._max_queue:
+                self._queue.append(event)
+            elif self._overflow == "block":
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._queue) < self._max_queue
+                )
+                if self._closed:
+                    self._dropped += 1
+                    dropped = event
+                else:
+                    self._queue.append(event)
+            elif self._overflow == "drop_oldest":
+                dropped = self._queue.popleft()
+                self._dropped += 1
+                self._queue.append(event)
+            else:
+                self._spill_event(event)
+            self._cond.notify_all()
+        if dropped is not None and self._on_drop is not None:
+            try:
+                self._on_drop(dropped)
+            except Exception:
+                _logger.exception("EventDispatcher on_drop handler raised")
+        return dropped is not event
+
+    def _start_workers(self) -> None:
+        if self._workers:
+            return
+        with self._cond:
+            if self._workers:
+                return
+            for i in range(self._worker_count):
+                worker = threading.Thread(
+                    target=self._run, name=f"grantex-events-{i}", daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+
+    def _idle(self) -> bool:
+        spilled = self._spill.pending if self._spill is not None else 0
+        return not self._queue and not spilled and self._in_flight == 0
+
+    def _spill_event(self, event: GrantexEvent) -> None:
+        if self._spill is None:
+            self._spill = _SpillFile(self._spill_dir)
+        self._spill.append(event)
+        self._spilled += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed and not (
+                    self._spill is not None and self._spill.pending
+                ):
+                    self._cond.wait()
+                if not self._queue and self._spill is not None and self._spill.pending:
+                    self._queue.extend(self._spill.read(self._max_queue))
+                if not self._queue:
+                    return
+                event = self._queue.popleft()
+                handlers = self._handlers.get(event.type, []) + self._handlers.get(
+                    _ALL_TYPES, []
+                )
+                self._in_flight += 1
+                self._cond.notify_all()
+            failures = 0
+            try:
+                for handler in handlers:
+                    try:
+                        handler(event)
+                    except Exception as exc:  # noqa: BLE001
+                        failures += 1
+                        self._report_error(exc, event)
+                if self._journal is not None and not failures:
+                    self._journal.ack(event.id)
+            finally:
+                # Always settle the accounting, or flush() and stop() would hang
+                with self._cond:
+                    self._in_flight -= 1
+                    self._dispatched += 1
+                    self._failed += failures
+                    self._cond.notify_all()
+
+    def _report_error(self, exc: Exception, event: GrantexEvent) -> None:
+        if self._on_error is None:
+            return
+        try:
+            self._on_error(exc, event)
+        except Exception:
+            _logger.exception("EventDispatcher on_error handler raised")
+
+
+class _SpillFile:
+    """Append-only NDJSON overflow file, read back in FIFO order."""
+
+    def __init__(self, directory: str | os.PathLike[str] | None) -> None:
+        fd, self.path = tempfile.mkstemp(
+            prefix="grantex-events-", suffix=".ndjson", dir=directory
+        )
+        self._file: IO[bytes] = os.fdopen(fd, "w+b")
+        self._read_pos = 0
+        self.pending = 0
+
+    def append(self, event: GrantexEvent) -> None:
+        record = {
+            "id": event.id,
+            "type": event.type,
+            "createdAt": event.created_at,
+            "data": event.data,
+        }
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(json.dumps(record).encode("utf-8") + b"\n")
+        self.pending += 1
+
+    def read(self, limit: int) -> list[GrantexEvent]:
+        self._file.flush()
+        self._file.seek(self._read_pos)
+        events: list[GrantexEvent] = []
+        while len(events) < limit:
+            line = self._file.readline()
+            if not line:
+                break
+            events.append(GrantexEvent.from_dict(json.loads(line)))
+        self._read_pos = self._file.tell()
+        self.pending -= len(events)
+        if not self.pending:
+            # Fully drained: start over so the file doesn't grow forever.
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_pos = 0
+        return events
+
+    def close(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
@@ -44,3 +44,12 @@ class GrantexNetworkError(GrantexError):
     def __init__(self, message: str, cause: BaseException | None = None) -> None:
         super().__init__(message)
         self.cause = cause
+
+
+class GrantexEventError(GrantexError):
+    """Raised when a streamed event's payload cannot be decoded."""
+
+    def __init__(self, message: str, data: str, cause: BaseException | None = None) -> None:
+        super().__init__(message)
+        self.data = data
+        self.cause = cause
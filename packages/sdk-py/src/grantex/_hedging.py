@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+import httpx
+
+_DEFAULT_PERCENTILE = 0.95
+_DEFAULT_BUDGET_RATIO = 0.1
+_DEFAULT_WINDOW = 256
+_DEFAULT_MIN_SAMPLES = 20
+_MAX_BUDGET_TOKENS = 10.0
+
+
+class HedgingPolicy:
+    """When and how often :class:`~grantex._http.HttpClient` may hedge a read.
+
+    A hedged call sends the request, waits ``delay`` seconds and, if no
+    response has arrived, sends the same request again; whichever answers
+    first wins. Without a fixed ``delay`` the wait is the ``percentile`` of
+    recently observed latencies for the same route, so only the slow tail is
+    hedged. Hedging starts once ``min_samples`` latencies have been recorded.
+
+    Hedges draw from a shared budget: every hedgeable call earns
+    ``budget_ratio`` of a token and every hedge spends one, so extra load is
+    capped at roughly ``budget_ratio`` of hedgeable traffic.
+
+    Only idempotent reads opt in (``grants.get``, ``tokens.verify``,
+    ``budgets.balance``). The client is synchronous, so a losing request
+    that is already on the wire runs to completion and its response is
+    discarded.
+
+    Example::
+
+        client = Grantex(api_key="...", hedging=HedgingPolicy(percentile=0.9))
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: float | None = None,
+        percentile: float = _DEFAULT_PERCENTILE,
+        budget_ratio: float = _DEFAULT_BUDGET_RATIO,
+        window: int = _DEFAULT_WINDOW,
+        min_samples: int = _DEFAULT_MIN_SAMPLES,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget_ratio < 0:
+            raise ValueError("budget_ratio must not be negative")
+        self._delay = delay
+        self._percentile = percentile
+        self._budget_ratio = budget_ratio
+        self._window = window
+        self._min_samples = min_samples
+        self._latencies: dict[str, deque[float]] = {}
+        self._tokens = 0.0
+        self._hedges_sent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hedges_sent(self) -> int:
+        """Number of hedge requests issued so far."""
+        return self._hedges_sent
+
+    def hedge_delay(self, key: str) -> float | None:
+        """Seconds to wait before hedging *key*, or ``None`` to not hedge."""
+        if self._delay is not None:
+            return self._delay
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self._min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self._percentile))]
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def earn(self) -> None:
+        """Credit the budget for one hedgeable call."""
+        with self._lock:
+            self._tokens = min(_MAX_BUDGET_TOKENS, self._tokens + self._budget_ratio)
+
+    def try_spend(self) -> bool:
+        """Take one hedge from the budget if available."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self._hedges_sent += 1
+            return True
+
+
+def send_hedged(
+    executor: ThreadPoolExecutor,
+    send: Callable[[], httpx.Response],
+    policy: HedgingPolicy,
+    key: str,
+) -> httpx.Response:
+    """Run *send*, hedging it once per *policy*; return the first response."""
+    policy.earn()
+    started = time.monotonic()
+    delay = policy.hedge_delay(key)
+    primary = executor.submit(send)
+
+    if delay is not None:
+        done, _ = wait([primary], timeout=delay)
+        if not done and policy.try_spend():
+            return _first_response([primary, executor.submit(send)], policy, key, started)
+
+    response = primary.result()
+    policy.record_latency(key, time.monotonic() - started)
+    return response
+
+
+def _first_response(
+    futures: list[Future[httpx.Response]],
+    policy: HedgingPolicy,
+    key: str,
+    started: float,
+) -> httpx.Response:
+    pending = set(futures)
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            exc = future.exception()
+            if exc is not None:
+                error = exc
+                continue
+            for loser in pending:
+                _discard(loser)
+            policy.record_latency(key, time.monotonic() - started)
+            return future.result()
+    assert error is not None
+    raise error
+
+
+def _discard(future: Future[httpx.Response]) -> None:
+    if future.cancel():
+        return
+
+    def _close(done: Future[httpx.Response]) -> None:
+        if done.exception() is None:
+            done.result().close()
+
+    future.add_done_callback(_close)
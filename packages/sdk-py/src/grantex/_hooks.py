@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Callable
+
+from ._types import RateLimit
+
+_DEFAULT_WINDOW = 1024
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """An attempt is about to be sent (``attempt`` is 0 for the first try)."""
+
+    method: str
+    path: str
+    route: str
+    attempt: int
+
+
+@dataclass(frozen=True)
+class ResponseEvent:
+    """An HTTP response arrived, whatever its status.
+
+    ``elapsed`` is the time this attempt spent on the wire; ``total_elapsed``
+    runs from the start of the call and includes earlier attempts and
+    ``backoff`` (seconds slept between retries so far).
+    """
+
+    method: str
+    path: str
+    route: str
+    attempt: int
+    status_code: int
+    request_id: str | None
+    elapsed: float
+    total_elapsed: float
+    backoff: float
+    rate_limit: RateLimit | None
+
+
+@dataclass(frozen=True)
+class RetryEvent:
+    """The client will sleep ``delay`` seconds and try again.
+
+    ``status_code`` is set when a retryable response triggered the retry and
+    ``error`` when a timeout or connection error did.
+    """
+
+    method: str
+    path: str
+    route: str
+    attempt: int
+    delay: float
+    status_code: int | None
+    error: Exception | None
+
+
+@dataclass(frozen=True)
+class ErrorEvent:
+    """The call is about to raise ``error`` to the caller."""
+
+    method: str
+    path: str
+    route: str
+    attempt: int
+    error: Exception
+    request_id: str | None
+    total_elapsed: float
+
+
+@dataclass
+class RequestHooks:
+    """Callbacks fired by :class:`~grantex._http.HttpClient` around each call.
+
+    Every hook is optional and runs synchronously on the calling thread.
+    Exceptions raised by a hook propagate to the caller, so keep hooks cheap
+    and defensive.
+
+    Example::
+
+        hooks = RequestHooks(
+            on_retry=lambda e: log.warning("retrying %s in %.2fs", e.route, e.delay),
+        )
+        client = Grantex(api_key="...", hooks=hooks)
+    """
+
+    on_request: Callable[[RequestEvent], None] | None = None
+    on_response: Callable[[ResponseEvent], None] | None = None
+    on_retry: Callable[[RetryEvent], None] | None = None
+    on_error: Callable[[ErrorEvent], None] | None = None
+
+
+class HookDispatcher:
+    """Fans events out to any number of :class:`RequestHooks`."""
+
+    def __init__(self, hooks: Iterable[RequestHooks]) -> None:
+        hooks = list(hooks)
+        self._on_request = [h.on_request for h in hooks if h.on_request is not None]
+        self._on_response = [h.on_response for h in hooks if h.on_response is not None]
+        self._on_retry = [h.on_retry for h in hooks if h.on_retry is not None]
+        self._on_error = [h.on_error for h in hooks if h.on_error is not None]
+
+    def request(self, event: RequestEvent) -> None:
+        for hook in self._on_request:
+            hook(event)
+
+    def response(self, event: ResponseEvent) -> None:
+        for hook in self._on_response:
+            hook(event)
+
+    def retry(self, event: RetryEvent) -> None:
+        for hook in self._on_retry:
+            hook(event)
+
+    def error(self, event: ErrorEvent) -> None:
+        for hook in self._on_error:
+            hook(event)
+
+
+@dataclass(frozen=True)
+class RouteLatency:
+    route: str
+    count: int
+    errors: int
+    p50: float
+    p95: float
+    p99: float
+
+
+class LatencyRecorder:
+    """In-process per-route latency aggregator built on :class:`RequestHooks`.
+
+    Records the total wall time of every completed call (retries and backoff
+    included) under its ``"METHOD /v1/route/:id"`` key, keeping the last
+    ``window`` samples per route. Calls that end in an error count towards
+    ``errors`` as well.
+
+    Example::
+
+        latency = LatencyRecorder()
+        client = Grantex(api_key="...", hooks=latency.hooks)
+        ...
+        for row in latency.snapshot():
+            print(row.route, row.p50, row.p95, row.p99)
+    """
+
+    def __init__(self, window: int = _DEFAULT_WINDOW) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hooks = RequestHooks(on_response=self._on_response, on_error=self._on_error)
+
+    def record(self, route: str, seconds: float, *, error: bool = False) -> None:
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = self._samples[route] = deque(maxlen=self._window)
+            samples.append(seconds)
+            self._counts[route] = self._counts.get(route, 0) + 1
+            if error:
+                self._errors[route] = self._errors.get(route, 0) + 1
+
+    def route(self, route: str) -> RouteLatency | None:
+        """Percentiles for one route key, or ``None`` if nothing was recorded."""
+        with self._lock:
+            samples = self._samples.get(route)
+            if not samples:
+                return None
+            return self._summarize(route, sorted(samples))
+
+    def snapshot(self) -> list[RouteLatency]:
+        """Percentiles for every recorded route, sorted by route key."""
+        with self._lock:
+            return [
+                self._summarize(route, sorted(samples))
+                for route, samples in sorted(self._samples.items())
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._errors.clear()
+
+    def _summarize(self, route: str, ordered: Sequence[float]) -> RouteLatency:
+        return RouteLatency(
+            route=route,
+            count=self._counts[route],
+            errors=self._errors.get(route, 0),
+            p50=_percentile(ordered, 0.50),
+            p95=_percentile(ordered, 0.95),
+            p99=_percentile(ordered, 0.99),
+        )
+
+    def _on_response(self, event: ResponseEvent) -> None:
+        # Failed calls are recorded once, by _on_error, whether or not
+        # they were retried first.
+        if event.status_code < 400:
+            self.record(f"{event.method} {event.route}", event.total_elapsed)
+
+    def _on_error(self, event: ErrorEvent) -> None:
+        self.record(f"{event.method} {event.route}", event.total_elapsed, error=True)
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
 import random
+import re
+import threading
 import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 import httpx
 
-from ._errors import GrantexApiError, GrantexAuthError, GrantexNetworkError
+from ._cache import ResponseCache
+from ._circuit import CircuitBreaker
+from ._codec import JsonCodec, get_json_codec
+from ._compression import RequestCompression
+from ._errors import (
+    GrantexApiError,
+    GrantexAuthError,
+    GrantexError,
+    GrantexNetworkError,
+)
+from ._hedging import HedgingPolicy, send_hedged
+from ._hooks import (
+    ErrorEvent,
+    HookDispatcher,
+    RequestEvent,
+    RequestHooks,
+    ResponseEvent,
+    RetryEvent,
+)
 from ._types import RateLimit
 
 _SDK_VERSION = "0.3.14"
@@ -15,6 +39,16 @@ _DEFAULT_MAX_RETRIES = 3
 _RETRY_BASE_DELAY = 0.5  # seconds
 _RETRY_MAX_DELAY = 10.0  # seconds
 _RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+_HEDGE_MAX_WORKERS = 16
+_STATIC_SEGMENT_RE = re.compile(r"^(?:v\d+|[A-Za-z.-]+)$")
+
+# Absolute time.monotonic() deadline set by HttpClient.deadline() for every
+# call made inside the block (including page prefetches).
+_scoped_deadline: ContextVar[float | None] = ContextVar("grantex_deadline", default=None)
+
+# Retry count set by _retries() for every call made inside the block; it
+# overrides the client's max_retries.
+_scoped_max_retries: ContextVar[int | None] = ContextVar("grantex_max_retries", default=None)
 
 
 def _parse_rate_limit_headers(headers: httpx.Headers) -> RateLimit | None:
@@ -43,37 +77,248 @@ class HttpClient:
         api_key: str,
         timeout: float = _DEFAULT_TIMEOUT,
         max_retries: int = _DEFAULT_MAX_RETRIES,
+        cache: ResponseCache | None = None,
+        json_codec: str | JsonCodec = "auto",
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        compression: RequestCompression | None = None,
+        hooks: RequestHooks | Sequence[RequestHooks] | None = None,
+        deadline: float | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._deadline = deadline
         self._last_rate_limit: RateLimit | None = None
         self._max_retries = max_retries
-        self._client = httpx.Client(
-            headers={
-                "Authorization": f"Bearer {api_key.strip()}",
-                "User-Agent": f"grantex-python/{_SDK_VERSION}",
-                "Accept": "application/json",
-            },
-            timeout=timeout,
+        self._cache = cache
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_executor_lock = threading.Lock()
+        self._compression = compression
+        if isinstance(hooks, RequestHooks):
+            hooks = [hooks]
+        self._hooks = HookDispatcher(hooks) if hooks else None
+        self._codec = (
+            json_codec if isinstance(json_codec, JsonCodec) else get_json_codec(json_codec)
         )
+        default_headers = {
+            "User-Agent": f"grantex-python/{_SDK_VERSION}",
+            "Accept": "application/json",
+        }
+        # An empty key gives an anonymous client (signup); callers can still
+        # authenticate a single request by passing an Authorization header.
+        if api_key.strip():
+            default_headers["Authorization"] = f"Bearer {api_key.strip()}"
+        self._client = httpx.Client(headers=default_headers, timeout=timeout)
 
     @property
     def last_rate_limit(self) -> RateLimit | None:
         return self._last_rate_limit
 
-    def get(self, path: str, headers: dict[str, str] | None = None) -> Any:
-        return self._request("GET", path, headers=headers)
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self._codec
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        return self._circuit_breaker
+
+    @property
+    def compression(self) -> RequestCompression | None:
+        return self._compression
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """Cap the total wall time of every call made inside the block.
+
+        The budget is shared by all calls in the block, retries and backoff
+        included; a nested block can only shorten it.
+        """
+        expires_at = time.monotonic() + seconds
+        outer = _scoped_deadline.get()
+        token = _scoped_deadline.set(expires_at if outer is None else min(outer, expires_at))
+        try:
+            yield
+        finally:
+            _scoped_deadline.reset(token)
+
+    def get(
+        self,
+        path: str,
+        headers: dict[str, str] | None = None,
+        *,
+        hedge: bool = False,
+        deadline: float | None = None,
+    ) -> Any:
+        return self._request("GET", path, headers=headers, hedge=hedge, deadline=deadline)
+
+    def post(
+        self,
+        path: str,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        *,
+        hedge: bool = False,
+        deadline: float | None = None,
+    ) -> Any:
+        """POST *body*. Pass ``hedge=True`` only for read-only endpoints."""
+        return self._request(
+            "POST", path, body=body, headers=headers, hedge=hedge, deadline=deadline
+        )
 
-    def post(self, path: str, body: Any = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("POST", path, body=body, headers=headers)
+    def put(
+        self,
+        path: str,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        *,
+        deadline: float | None = None,
+    ) -> Any:
+        return self._request("PUT", path, body=body, headers=headers, deadline=deadline)
 
-    def put(self, path: str, body: Any = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("PUT", path, body=body, headers=headers)
+    def patch(
+        self,
+        path: str,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        *,
+        deadline: float | None = None,
+    ) -> Any:
+        return self._request("PATCH", path, body=body, headers=headers, deadline=deadline)
 
-    def patch(self, path: str, body: Any = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("PATCH", path, body=body, headers=headers)
+    def delete(
+        self,
+        path: str,
+        headers: dict[str, str] | None = None,
+        *,
+        deadline: float | None = None,
+    ) -> Any:
+        return self._request("DELETE", path, headers=headers, deadline=deadline)
 
-    def delete(self, path: str, headers: dict[str, str] | None = None) -> Any:
-        return self._request("DELETE", path, headers=headers)
+    @contextmanager
+    def stream(
+        self,
+        path: str,
+        headers: dict[str, str] | None = None,
+        *,
+        deadline: float | None = None,
+    ) -> Iterator[httpx.Response]:
+        """GET *path* without buffering the body; yields the open response.
+
+        Until the response headers arrive the call behaves like :meth:`get`:
+        the deadline, circuit breaker and request hooks apply, and failed
+        attempts are retried (timeouts, connection errors, 429/502/503/504).
+        Once the body is being read, errors propagate to the caller and the
+        deadline no longer applies. Error responses raise
+        ``GrantexApiError``/``GrantexAuthError``.
+        """
+        response = self._open_stream(path, headers, deadline)
+        try:
+            yield response
+        except httpx.TimeoutException as exc:
+            raise GrantexNetworkError(f"Request timed out: {exc}", cause=exc) from exc
+        except httpx.RequestError as exc:
+            raise GrantexNetworkError(f"Network error: {exc}", cause=exc) from exc
+        finally:
+            response.close()
+
+    def _open_stream(
+        self, path: str, headers: dict[str, str] | None, deadline: float | None
+    ) -> httpx.Response:
+        """Send a streaming GET and return it once successful headers arrive."""
+        url = f"{self._base_url}{path}"
+        breaker = self._circuit_breaker
+        route = _route_template(path)
+        circuit_key = f"GET {route}"
+        hooks = self._hooks
+        started = time.monotonic()
+        expires_at = _resolve_deadline(started, deadline if deadline is not None else self._deadline)
+        backoff = 0.0
+        delay = 0.0
+        attempt = 0
+        request_id: str | None = None
+        admitted = False
+
+        try:
+            for attempt in range(self._max_retries + 1):
+                if attempt > 0:
+                    time.sleep(delay)
+                    backoff += delay
+                if expires_at is not None and time.monotonic() >= expires_at:
+                    raise GrantexNetworkError(
+                        f"Deadline exceeded after {time.monotonic() - started:.3f}s "
+                        f"({attempt} attempt(s))"
+                    )
+                if breaker is not None:
+                    breaker.before_request(circuit_key)
+                    admitted = True
+                if hooks is not None:
+                    hooks.request(RequestEvent("GET", path, route, attempt))
+
+                kwargs = self._bounded({"headers": headers}, expires_at)
+                request = self._client.build_request("GET", url, **kwargs)
+                sent = time.monotonic()
+                try:
+                    response = self._client.send(request, stream=True)
+                except (httpx.TimeoutException, httpx.RequestError) as exc:
+                    if breaker is not None:
+                        breaker.record_failure(circuit_key)
+                        admitted = False
+                    kind = "Request timed out" if isinstance(exc, httpx.TimeoutException) else "Network error"
+                    error = GrantexNetworkError(f"{kind}: {exc}", cause=exc)
+                    if attempt < self._max_retries:
+                        delay = self._retry_delay(attempt)
+                        if _fits_budget(expires_at, delay, sent):
+                            if hooks is not None:
+                                hooks.retry(RetryEvent("GET", path, route, attempt, delay, None, exc))
+                            continue
+                    raise error from exc
+
+                if breaker is not None:
+                    if response.status_code >= 500:
+                        breaker.record_failure(circuit_key)
+                    else:
+                        breaker.record_success(circuit_key)
+                    admitted = False
+
+                request_id = response.headers.get("x-request-id")
+                self._last_rate_limit = _parse_rate_limit_headers(response.headers)
+                if hooks is not None:
+                    now = time.monotonic()
+                    hooks.response(ResponseEvent(
+                        "GET", path, route, attempt, response.status_code, request_id,
+                        now - sent, now - started, backoff, self._last_rate_limit,
+                    ))
+                if response.is_success:
+                    return response
+                try:
+                    response.read()
+                finally:
+                    response.close()
+                if response.status_code in _RETRYABLE_STATUS_CODES and attempt < self._max_retries:
+                    delay = self._retry_delay(attempt, _parse_retry_after(response.headers))
+                    if _fits_budget(expires_at, delay, sent):
+                        if hooks is not None:
+                            hooks.retry(RetryEvent(
+                                "GET", path, route, attempt, delay, response.status_code, None,
+                            ))
+                        continue
+                raise self._api_error(response)
+        except GrantexError as exc:
+            if hooks is not None:
+                hooks.error(ErrorEvent(
+                    "GET", path, route, attempt, exc, request_id, time.monotonic() - started,
+                ))
+            raise
+        finally:
+            if admitted and breaker is not None:
+                breaker.release(circuit_key)
+        raise AssertionError("unreachable")  # pragma: no cover
 
     def _request(
         self,
@@ -81,92 +326,261 @@ class HttpClient:
         path: str,
         body: Any = None,
         headers: dict[str, str] | None = None,
+        hedge: bool = False,
+        deadline: float | None = None,
     ) -> Any:
         url = f"{self._base_url}{path}"
+        max_retries = _scoped_max_retries.get()
+        if max_retries is None:
+            max_retries = self._max_retries
         kwargs: dict[str, Any] = {}
         if body is not None:
-            kwargs["json"] = body
-        if headers:
+            kwargs["content"] = self._codec.dumps(body)
+            kwargs["headers"] = {"Content-Type": "application/json", **(headers or {})}
+        elif headers:
             kwargs["headers"] = headers
 
-        last_error: Exception | None = None
+        identity_kwargs = kwargs
+        compressed = self._compress_body(kwargs)
+        if compressed is not None:
+            kwargs = compressed
+
+        # Only plain GETs are cached: per-call headers may change the
+        # representation (or the credentials) the server answers with.
+        cache_key = path if method == "GET" and self._cache is not None and not headers else None
+        cached = self._cache.get(cache_key) if self._cache is not None and cache_key else None
+        if cached is not None:
+            kwargs["headers"] = cached.conditional_headers()
+
+        breaker = self._circuit_breaker
+        route = _route_template(path)
+        circuit_key = f"{method} {route}"
+        hooks = self._hooks
+        started = time.monotonic()
+        expires_at = _resolve_deadline(started, deadline if deadline is not None else self._deadline)
+        backoff = 0.0
+        attempt = 0
+        request_id: str | None = None
 
-        for attempt in range(self._max_retries + 1):
-            if attempt > 0:
-                time.sleep(self._retry_delay(attempt - 1))
-
-            try:
-                response = self._client.request(method, url, **kwargs)
-            except httpx.TimeoutException as exc:
-                last_error = GrantexNetworkError(
-                    f"Request timed out: {exc}", cause=exc
-                )
-                if attempt < self._max_retries:
-                    continue
-                raise last_error from exc
-            except httpx.RequestError as exc:
-                last_error = GrantexNetworkError(
-                    f"Network error: {exc}", cause=exc
-                )
-                if attempt < self._max_retries:
-                    continue
-                raise last_error from exc
-
-            request_id: str | None = response.headers.get("x-request-id")
-            self._last_rate_limit = _parse_rate_limit_headers(response.headers)
-
-            if not response.is_success:
-                body_data: Any = None
+        last_error: Exception | None = None
+        delay = 0.0
+        # Set while this call holds an admission with no outcome recorded;
+        # an unrecorded half-open probe would block the route for good.
+        admitted = False
+
+        try:
+            for attempt in range(max_retries + 1):
+                if attempt > 0:
+                    time.sleep(delay)
+                    backoff += delay
+                # Before admission, so an expired call never takes a probe slot
+                if expires_at is not None and time.monotonic() >= expires_at:
+                    raise GrantexNetworkError(
+                        f"Deadline exceeded after {time.monotonic() - started:.3f}s "
+                        f"({attempt} attempt(s))"
+                    )
+                if breaker is not None:
+                    # Raises GrantexNetworkError while the route's circuit is open,
+                    # which also cuts short the retries of a call already in flight
+                    breaker.before_request(circuit_key)
+                    admitted = True
+                if hooks is not None:
+                    # A raising hook leaves the admission unrecorded; the
+                    # finally below hands a half-open probe back.
+                    hooks.request(RequestEvent(method, path, route, attempt))
+
+                sent = time.monotonic()
                 try:
-                    body_data = response.json()
-                except Exception:
-                    body_data = response.text or None
-
-                # Retry on transient status codes
-                if response.status_code in _RETRYABLE_STATUS_CODES and attempt < self._max_retries:
-                    retry_after = _parse_retry_after(response.headers)
-                    if retry_after is not None:
-                        self._pending_retry_after = retry_after
-                    continue
-
-                message = _extract_error_message(body_data, response.status_code)
-                error_code = _extract_error_code(body_data)
-
-                if response.status_code in (401, 403):
-                    raise GrantexAuthError(
-                        message, response.status_code, body_data, request_id, error_code,
-                        self._last_rate_limit,
+                    response = self._send(
+                        method, url, self._bounded(kwargs, expires_at), circuit_key if hedge else None
+                    )
+                    if response.status_code in (400, 415) and kwargs is not identity_kwargs:
+                        # The server may not decode our Content-Encoding (servers
+                        # without body decompression answer 400): resend the same
+                        # body uncompressed
+                        assert self._compression is not None
+                        refused = response.status_code
+                        kwargs = identity_kwargs
+                        response.close()
+                        if hooks is not None:
+                            hooks.request(RequestEvent(method, path, route, attempt))
+                        sent = time.monotonic()
+                        response = self._send(
+                            method, url, self._bounded(kwargs, expires_at),
+                            circuit_key if hedge else None,
+                        )
+                        # A 400 the plain body gets too is the request's own fault
+                        if refused == 415 or response.status_code != 400:
+                            self._compression.disable()
+                except httpx.TimeoutException as exc:
+                    if breaker is not None:
+                        breaker.record_failure(circuit_key)
+                        admitted = False
+                    last_error = GrantexNetworkError(
+                        f"Request timed out: {exc}", cause=exc
+                    )
+                    if attempt < max_retries:
+                        delay = self._retry_delay(attempt)
+                        if _fits_budget(expires_at, delay, sent):
+                            if hooks is not None:
+                                hooks.retry(RetryEvent(method, path, route, attempt, delay, None, exc))
+                            continue
+                    raise last_error from exc
+                except httpx.RequestError as exc:
+                    if breaker is not None:
+                        breaker.record_failure(circuit_key)
+                        admitted = False
+                    last_error = GrantexNetworkError(
+                        f"Network error: {exc}", cause=exc
+                    )
+                    if attempt < max_retries:
+                        delay = self._retry_delay(attempt)
+                        if _fits_budget(expires_at, delay, sent):
+                            if hooks is not None:
+                                hooks.retry(RetryEvent(method, path, route, attempt, delay, None, exc))
+                            continue
+                    raise last_error from exc
+
+                if breaker is not None:
+                    if response.status_code >= 500:
+                        breaker.record_failure(circuit_key)
+                    else:
+                        breaker.record_success(circuit_key)
+                    admitted = False
+
+                request_id = response.headers.get("x-request-id")
+                self._last_rate_limit = _parse_rate_limit_headers(response.headers)
+                if hooks is not None:
+                    now = time.monotonic()
+                    hooks.response(ResponseEvent(
+                        method, path, route, attempt, response.status_code, request_id,
+                        now - sent, now - started, backoff, self._last_rate_limit,
+                    ))
+
+                if response.status_code == 304 and cached is not None:
+                    if self._cache is not None and cache_key is not None:
+                        # Revalidated: restart the TTL, keeping any new validators
+                        self._cache.store(
+                            cache_key,
+                            cached.content,
+                            etag=response.headers.get("etag", cached.etag),
+                            last_modified=response.headers.get(
+                                "last-modified", cached.last_modified
+                            ),
+                        )
+                    return self._codec.loads(cached.content)
+
+                if not response.is_success:
+                    # Retry on transient status codes
+                    if response.status_code in _RETRYABLE_STATUS_CODES and attempt < max_retries:
+                        delay = self._retry_delay(attempt, _parse_retry_after(response.headers))
+                        if _fits_budget(expires_at, delay, sent):
+                            if hooks is not None:
+                                hooks.retry(RetryEvent(
+                                    method, path, route, attempt, delay, response.status_code, None,
+                                ))
+                            continue
+
+                    raise self._api_error(response)
+
+                if response.status_code == 204:
+                    return None
+
+                if self._cache is not None and cache_key is not None:
+                    self._cache.store(
+                        cache_key,
+                        response.content,
+                        etag=response.headers.get("etag"),
+                        last_modified=response.headers.get("last-modified"),
                     )
-                raise GrantexApiError(
-                    message, response.status_code, body_data, request_id, error_code,
-                    self._last_rate_limit,
-                )
-
-            if response.status_code == 204:
-                return None
 
-            return response.json()
+                return self._codec.loads(response.content)
+        except GrantexError as exc:
+            if hooks is not None:
+                hooks.error(ErrorEvent(
+                    method, path, route, attempt, exc, request_id, time.monotonic() - started,
+                ))
+            raise
+        finally:
+            if admitted and breaker is not None:
+                breaker.release(circuit_key)
 
         # Should not reach here, but satisfy type checkers
         if last_error is not None:
             raise last_error
         return None  # pragma: no cover
 
-    _pending_retry_after: float | None = None
+    def _api_error(self, response: httpx.Response) -> GrantexApiError:
+        body_data: Any = None
+        try:
+            body_data = self._codec.loads(response.content)
+        except Exception:
+            body_data = response.text or None
+
+        message = _extract_error_message(body_data, response.status_code)
+        error_code = _extract_error_code(body_data)
+        request_id = response.headers.get("x-request-id")
+        error_type = GrantexAuthError if response.status_code in (401, 403) else GrantexApiError
+        return error_type(
+            message, response.status_code, body_data, request_id, error_code,
+            self._last_rate_limit,
+        )
 
-    def _retry_delay(self, attempt: int) -> float:
+    def _bounded(self, kwargs: dict[str, Any], expires_at: float | None) -> dict[str, Any]:
+        """Shrink the per-attempt timeout so it ends no later than the deadline."""
+        if expires_at is None:
+            return kwargs
+        remaining = expires_at - time.monotonic()
+        return {**kwargs, "timeout": max(0.0, min(self._timeout, remaining))}
+
+    def _compress_body(self, kwargs: dict[str, Any]) -> dict[str, Any] | None:
+        if self._compression is None or "content" not in kwargs:
+            return None
+        encoded = self._compression.compress(kwargs["content"])
+        if encoded is None:
+            return None
+        return {
+            "content": encoded,
+            "headers": {**kwargs["headers"], "Content-Encoding": self._compression.encoding},
+        }
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+        hedge_key: str | None,
+    ) -> httpx.Response:
+        if self._hedging is None or hedge_key is None:
+            return self._client.request(method, url, **kwargs)
+        return send_hedged(
+            self._get_hedge_executor(),
+            lambda: self._client.request(method, url, **kwargs),
+            self._hedging,
+            hedge_key,
+        )
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=_HEDGE_MAX_WORKERS, thread_name_prefix="grantex-hedge"
+                )
+            return self._hedge_executor
+
+    def _retry_delay(self, attempt: int, retry_after: float | None = None) -> float:
         """Calculate retry delay with exponential backoff and jitter."""
         # If a Retry-After header was parsed, use it
-        if self._pending_retry_after is not None:
-            delay = self._pending_retry_after
-            self._pending_retry_after = None
-            return min(delay, _RETRY_MAX_DELAY)
+        if retry_after is not None:
+            return min(retry_after, _RETRY_MAX_DELAY)
         # Exponential backoff with jitter
         exponential = _RETRY_BASE_DELAY * (2 ** attempt)
         jitter = random.random() * _RETRY_BASE_DELAY
         return float(min(exponential + jitter, _RETRY_MAX_DELAY))
 
     def close(self) -> None:
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
         self._client.close()
 
     def __enter__(self) -> HttpClient:
@@ -176,6 +590,47 @@ class HttpClient:
         self.close()
 
 
+@contextmanager
+def _retries(count: int) -> Iterator[None]:
+    """Make every request sent inside the block retry at most *count* times."""
+    token = _scoped_max_retries.set(count)
+    try:
+        yield
+    finally:
+        _scoped_max_retries.reset(token)
+
+
+def _resolve_deadline(started: float, budget: float | None) -> float | None:
+    """Earliest of the per-call/client budget and any enclosing deadline() block."""
+    scoped = _scoped_deadline.get()
+    if budget is None:
+        return scoped
+    expires_at = started + budget
+    return expires_at if scoped is None else min(scoped, expires_at)
+
+
+def _fits_budget(expires_at: float | None, delay: float, sent: float) -> bool:
+    """Whether sleeping *delay* and repeating an attempt as slow as the last
+    one (sent at *sent*) would still finish before the deadline."""
+    if expires_at is None:
+        return True
+    now = time.monotonic()
+    return now + delay + (now - sent) < expires_at
+
+
+def _route_template(path: str) -> str:
+    """Collapse identifier segments so ``/v1/grants/grnt_01`` maps to ``/v1/grants/:id``.
+
+    A segment is kept verbatim when it is an API version (``v1``) or made of
+    letters, dots and hyphens only; anything else is treated as an ID.
+    """
+    bare_path = path.split("?", 1)[0]
+    return "/".join(
+        segment if not segment or _STATIC_SEGMENT_RE.match(segment) else ":id"
+        for segment in bare_path.split("/")
+    )
+
+
 def _parse_retry_after(headers: httpx.Headers) -> float | None:
     """Parse Retry-After header value into seconds."""
     value = headers.get("retry-after")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Union
+
+from .resources._events import GrantexEvent
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_DEFAULT_KEEP_ACKED = 1000
+_DEFAULT_COMPACT_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id   TEXT NOT NULL UNIQUE,
+    type       TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    acked      INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS events_acked ON events (acked, seq);
+"""
+
+JournalPath = Union[str, "os.PathLike[str]"]
+
+
+class EventJournal:
+    """Durable SQLite record of received events and their acknowledgements.
+
+    ``append()`` commits an event before it is handed to any handler and
+    reports whether its id was new, so redelivered events are recognised;
+    ``ack()`` marks it processed. After a restart ``pending()`` returns the
+    events that were received but never acknowledged, oldest first, for
+    replay. Acknowledged events are deleted every ``compact_every`` acks,
+    except the newest ``keep_acked``, which are kept to recognise events
+    the server sends again.
+
+    The journal covers events the process received; the server does not
+    replay events published while no consumer was connected.
+
+    Safe to share between threads. Pass it to
+    :class:`~grantex.EventDispatcher` to journal, acknowledge, and replay
+    automatically.
+
+    Example::
+
+        with EventJournal("events.db") as journal:
+            dispatcher = EventDispatcher(client.events, journal=journal)
+            ...
+    """
+
+    def __init__(
+        self,
+        path: JournalPath,
+        *,
+        keep_acked: int = _DEFAULT_KEEP_ACKED,
+        compact_every: int = _DEFAULT_COMPACT_EVERY,
+    ) -> None:
+        if keep_acked < 0 or compact_every < 1:
+            raise ValueError("keep_acked must be >= 0 and compact_every >= 1")
+        self._keep_acked = keep_acked
+        self._compact_every = compact_every
+        self._acks_since_compact = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The underlying SQLite connection, for ad-hoc SQL."""
+        return self._conn
+
+    @property
+    def unacked(self) -> int:
+        """Events recorded but not yet acknowledged."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM events WHERE acked = 0"
+            ).fetchone()
+        return int(row[0])
+
+    def append(self, event: GrantexEvent) -> bool:
+        """Record *event*; returns ``False`` if its id was already journaled."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO events (event_id, type, created_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                (event.id, event.type, event.created_at, json.dumps(event.data)),
+            )
+        return cursor.rowcount > 0
+
+    def ack(self, event_id: str) -> None:
+        """Mark the event *event_id* as processed."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE events SET acked = 1 WHERE event_id = ?", (event_id,)
+                )
+            self._acks_since_compact += 1
+            if self._acks_since_compact >= self._compact_every:
+                self._compact()
+
+    def pending(self) -> list[GrantexEvent]:
+        """Unacknowledged events, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT event_id, type, created_at, data FROM events "
+                "WHERE acked = 0 ORDER BY seq"
+            ).fetchall()
+        return [
+            GrantexEvent(id=row[0], type=row[1], created_at=row[2], data=json.loads(row[3]))
+            for row in rows
+        ]
+
+    def compact(self) -> int:
+        """Delete acknowledged events beyond ``keep_acked``; returns how many."""
+        with self._lock:
+            return self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _compact(self) -> int:
+        self._acks_since_compact = 0
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM events WHERE acked = 1 AND seq NOT IN ("
+                "SELECT seq FROM events WHERE acked = 1 ORDER BY seq DESC LIMIT ?)",
+                (self._keep_acked,),
+            )
+        return cursor.rowcount
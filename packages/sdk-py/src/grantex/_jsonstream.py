@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+
+# Structural bytes outside strings, and the bytes that end or escape a string.
+_STRUCTURAL_RE = re.compile(rb'["\[\]{},:]')
+_STRING_END_RE = re.compile(rb'["\\]')
+
+
+def iter_ndjson(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield each non-blank line of a newline-delimited JSON byte stream."""
+    pending = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator[bytes]:
+    """Yield the raw JSON of each object in the top-level ``key`` array.
+
+    Scans a JSON object such as ``{"total": 2, "entries": [{...}, {...}]}``
+    as it streams in and yields every element of ``entries`` as soon as it
+    is complete, so memory is bounded by the largest element rather than the
+    document. Everything outside that array is skipped, as are scalar
+    elements (export arrays only hold objects).
+    """
+    return _ArrayScanner(key.encode("utf-8")).scan(chunks)
+
+
+class _ArrayScanner:
+    def __init__(self, key: bytes) -> None:
+        self._key = b'"' + key + b'"'
+        self._buf = b""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_key = b""
+        self._expect_target = False
+        self._in_target = False
+        self._item_start: int | None = None
+
+    def scan(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            self._buf += chunk
+            yield from self._advance()
+            self._compact()
+
+    def _advance(self) -> Iterator[bytes]:
+        buf = self._buf
+        while True:
+            if self._in_string:
+                match = _STRING_END_RE.search(buf, self._pos)
+                if match is None:
+                    self._pos = len(buf)
+                    return
+                if match.group() == b"\\":
+                    if match.end() >= len(buf):
+                        # The escaped byte has not arrived yet
+                        self._pos = match.start()
+                        return
+                    self._pos = match.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = match.end()
+                if self._depth == 1:
+                    self._last_key = buf[self._string_start:self._pos]
+                continue
+
+            match = _STRUCTURAL_RE.search(buf, self._pos)
+            if match is None:
+                self._pos = len(buf)
+                return
+            token = match.group()
+            self._pos = match.end()
+
+            if token == b'"':
+                self._in_string = True
+                self._string_start = match.start()
+            elif token == b":":
+                if self._depth == 1:
+                    self._expect_target = self._last_key == self._key
+            elif token == b",":
+                if self._depth == 1:
+                    self._expect_target = False
+            elif token in (b"{", b"["):
+                if self._expect_target and token == b"[" and self._depth == 1:
+                    self._in_target = True
+                    self._expect_target = False
+                elif self._in_target and self._depth == 2:
+                    self._item_start = match.start()
+                self._depth += 1
+            else:  # "}" or "]"
+                self._depth -= 1
+                if self._item_start is not None and self._depth == 2:
+                    yield buf[self._item_start:self._pos]
+                    self._item_start = None
+                elif self._in_target and self._depth == 1:
+                    self._in_target = False
+
+    def _compact(self) -> None:
+        # Drop consumed bytes that no pending item or string still needs.
+        keep_from = self._pos
+        if self._item_start is not None:
+            keep_from = min(keep_from, self._item_start)
+        if self._in_string:
+            keep_from = min(keep_from, self._string_start)
+        if keep_from <= 0:
+            return
+        self._buf = self._buf[keep_from:]
+        self._pos -= keep_from
+        self._string_start -= keep_from
+        if self._item_start is not None:
+            self._item_start -= keep_from
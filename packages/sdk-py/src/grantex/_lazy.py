@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, Callable, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class LazySequence(Sequence[T]):
+    """Read-only sequence that builds model objects from JSON rows on access.
+
+    Large list responses keep their decoded JSON rows and only turn a row
+    into its dataclass (``AuditEntry``, ``Grant``, ...) when it is indexed or
+    iterated; each object is built at most once. Counting rows or reading a
+    couple of raw fields through :attr:`rows` never materializes anything.
+
+    Compares equal to any sequence (tuple, list) holding equal items. It is
+    not a ``tuple``, so ``dataclasses.asdict()`` copies it as is rather than
+    converting its items to dicts.
+    """
+
+    __slots__ = ("_factory", "_items", "_rows")
+
+    def __init__(
+        self,
+        rows: Sequence[dict[str, Any]],
+        factory: Callable[[dict[str, Any]], T],
+    ) -> None:
+        self._rows = rows
+        self._factory = factory
+        self._items: list[T | None] = [None] * len(rows)
+
+    @property
+    def rows(self) -> Sequence[dict[str, Any]]:
+        """The decoded JSON rows backing this sequence (camelCase keys)."""
+        return self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazySequence[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | LazySequence[T]:
+        if isinstance(index, slice):
+            return LazySequence(self._rows[index], self._factory)
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._factory(self._rows[index])
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self._rows)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazySequence) and other._factory == self._factory:
+            return self._rows == other._rows
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"LazySequence(<{len(self._rows)} rows>)"
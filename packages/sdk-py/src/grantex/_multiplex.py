@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional
+
+from .resources._events import (
+    _DEFAULT_RECONNECT,
+    ErrorHandler,
+    EventHandler,
+    EventsClient,
+    GrantexEvent,
+    ReconnectPolicy,
+    StreamOptions,
+    Subscription,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_DEFAULT_DEDUPE_WINDOW = 1024
+
+# None means "every event type".
+_Filter = Optional[tuple[str, ...]]
+
+
+class SharedSubscription:
+    """Handle returned by :meth:`SharedEventStream.subscribe`."""
+
+    def __init__(
+        self,
+        stream: SharedEventStream,
+        handler: EventHandler,
+        types: frozenset[str] | None,
+    ) -> None:
+        self._stream = stream
+        self._handler = handler
+        self._types = types
+        self._active = True
+
+    @property
+    def types(self) -> frozenset[str] | None:
+        """Event types delivered to this subscriber (``None`` for all)."""
+        return self._types
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def wants(self, event_type: str) -> bool:
+        return self._types is None or event_type in self._types
+
+    def unsubscribe(self) -> None:
+        """Stop delivery to this subscriber."""
+        self._stream._remove(self)
+
+
+class _Upstream:
+    def __init__(self, types: _Filter) -> None:
+        self.types = types
+        self.subscription: Subscription | None = None
+
+
+class SharedEventStream:
+    """One upstream event stream shared by many in-process subscribers.
+
+    Every ``subscribe()`` call registers a handler for some event types on
+    the same ``/v1/events/stream`` connection, which is filtered to the
+    union of the types currently wanted. Events are fanned out on the
+    reader thread to each matching subscriber; a handler that raises is
+    reported to ``on_error`` and does not affect the others. Hand slow work
+    to an :class:`~grantex.EventDispatcher` (``dispatcher.dispatch`` is a
+    valid handler).
+
+    When subscribers come and go and the union changes, a new connection
+    with the new filter is opened and the old one is closed once the new
+    one delivers its first event, so no event is missed in between;
+    events seen on both are delivered once. At most two connections are
+    open at a time, and none while there are no subscribers.
+
+    Example::
+
+        shared = SharedEventStream(client.events)
+        revocations = shared.subscribe(on_revoked, types=["grant.revoked"])
+        budgets = shared.subscribe(on_budget, types=["budget.threshold"])
+    """
+
+    def __init__(
+        self,
+        events: EventsClient,
+        *,
+        reconnect: ReconnectPolicy | None = _DEFAULT_RECONNECT,
+        on_error: ErrorHandler | None = None,
+        dedupe_window: int = _DEFAULT_DEDUPE_WINDOW,
+    ) -> None:
+        if dedupe_window < 1:
+            raise ValueError("dedupe_window must be at least 1")
+        self._events = events
+        self._reconnect = reconnect
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._subscribers: list[SharedSubscription] = []
+        self._live: _Upstream | None = None
+        self._pending: _Upstream | None = None
+        self._closed = False
+        self._recent: deque[str] = deque(maxlen=dedupe_window)
+        self._recent_ids: set[str] = set()
+        self._delivered = 0
+
+    @property
+    def upstream_types(self) -> _Filter:
+        """Filter of the connection being established or in use (``None`` for all)."""
+        with self._lock:
+            upstream = self._pending or self._live
+            return upstream.types if upstream is not None else None
+
+    @property
+    def connections(self) -> int:
+        """Upstream connections currently held (0, 1, or 2 while switching)."""
+        with self._lock:
+            return sum(1 for u in (self._live, self._pending) if u is not None)
+
+    @property
+    def delivered(self) -> int:
+        """Handler calls made so far."""
+        return self._delivered
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        types: Sequence[str] | None = None,
+    ) -> SharedSubscription:
+        """Deliver events of *types* (all types if ``None``) to *handler*."""
+        sub = SharedSubscription(self, handler, frozenset(types) if types is not None else None)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("shared event stream is closed")
+            self._subscribers.append(sub)
+            stale = self._resync()
+        _stop(stale)
+        return sub
+
+    def close(self) -> None:
+        """Drop every subscriber and close the upstream connection."""
+        with self._lock:
+            self._closed = True
+            for sub in self._subscribers:
+                sub._active = False
+            self._subscribers.clear()
+            stale = self._resync()
+        _stop(stale)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _remove(self, sub: SharedSubscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+            sub._active = False
+            stale = self._resync()
+        _stop(stale)
+
+    def _desired(self) -> _Filter:
+        types: set[str] = set()
+        for sub in self._subscribers:
+            if sub.types is None:
+                return None
+            types |= sub.types
+        return tuple(sorted(types))
+
+    def _resync(self) -> list[_Upstream]:
+        """Align upstream connections with the subscribers; returns ones to stop.
+
+        Called with the lock held; stopping happens outside it.
+        """
+        if not self._subscribers:
+            stale = [u for u in (self._live, self._pending) if u is not None]
+            self._live = self._pending = None
+            return stale
+        desired = self._desired()
+        if self._pending is not None and self._pending.types == desired:
+            return []
+        stale = []
+        if self._pending is not None:
+            # Never delivered anything, so it can go straight away.
+            stale.append(self._pending)
+            self._pending = None
+        if self._live is not None and self._live.types == desired:
+            return stale
+        upstream = self._open(desired)
+        if self._live is None:
+            self._live = upstream
+        else:
+            self._pending = upstream
+        return stale
+
+    def _open(self, types: _Filter) -> _Upstream:
+        upstream = _Upstream(types)
+        options = StreamOptions(types=list(types) if types is not None else None)
+        upstream.subscription = self._events.subscribe(
+            lambda event: self._fan_out(upstream, event),
+            options,
+            on_error=self._on_error,
+            reconnect=self._reconnect,
+        )
+        return upstream
+
+    def _fan_out(self, upstream: _Upstream, event: GrantexEvent) -> None:
+        stale: list[_Upstream] = []
+        targets: list[SharedSubscription] = []
+        with self._lock:
+            if upstream is self._pending:
+                # The new filter is live: retire the old connection.
+                if self._live is not None:
+                    stale.append(self._live)
+                self._live, self._pending = upstream, None
+            if upstream is self._live and event.id not in self._recent_ids:
+                if len(self._recent) == self._recent.maxlen:
+                    self._recent_ids.discard(self._recent[0])
+                self._recent.append(event.id)
+                self._recent_ids.add(event.id)
+                targets = [sub for sub in self._subscribers if sub.wants(event.type)]
+                self._delivered += len(targets)
+        _stop(stale)
+        for sub in targets:
+            try:
+                sub._handler(event)
+            except Exception as exc:  # noqa: BLE001
+                if self._on_error is not None:
+                    self._on_error(exc)
+
+
+def _stop(upstreams: list[_Upstream]) -> None:
+    # Don't wait: the reader thread may be blocked until the next event or
+    # keepalive, and can't deliver anything once it's no longer current.
+    for upstream in upstreams:
+        if upstream.subscription is not None:
+            upstream.subscription.unsubscribe(timeout=0)
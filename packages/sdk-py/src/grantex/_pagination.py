@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_DEFAULT_PAGE_SIZE = 100
+
+# A page fetcher takes a cursor (page number or start index) and returns the
+# page's items together with the cursor of the next page, or None at the end.
+PageFetcher = Callable[[int], tuple[Sequence[T], Optional[int]]]
+
+
+def iter_pages(
+    fetch_page: PageFetcher[T],
+    start: int,
+    *,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Yield every item across pages, fetching page N+1 while N is consumed.
+
+    With ``prefetch`` enabled the next page is requested on a single
+    background thread as soon as the current one arrives, so network time
+    overlaps with the caller's processing. Closing the generator early
+    abandons any in-flight prefetch.
+
+    Iteration also stops if the server returns the same page twice, which is
+    what an endpoint that ignores paging parameters looks like.
+    """
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="grantex-prefetch")
+        if prefetch
+        else None
+    )
+    try:
+        items, next_cursor = fetch_page(start)
+        previous: Sequence[T] | None = None
+        while True:
+            if previous is not None and items == previous:
+                return
+            pending: Future[tuple[Sequence[T], int | None]] | None = None
+            if executor is not None and next_cursor is not None:
+                # Run in the caller's context so a client.deadline() block
+                # also bounds the prefetch
+                pending = executor.submit(
+                    contextvars.copy_context().run, fetch_page, next_cursor
+                )
+            yield from items
+            if next_cursor is None:
+                return
+            previous = items
+            if pending is not None:
+                items, next_cursor = pending.result()
+            else:
+                items, next_cursor = fetch_page(next_cursor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def next_page(page: int, count: int, page_size: int) -> int | None:
+    """Page-number cursor: a full page means there may be another one."""
+    return page + 1 if count == page_size else None
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, MutableMapping
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ._hooks import LatencyRecorder
+from ._webhook import WebhookVerifier
+from .resources._events import GrantexEvent
+
+_DEFAULT_CONCURRENCY = 8
+_DEFAULT_MAX_QUEUE = 1000
+_DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+_DEFAULT_DRAIN_TIMEOUT = 10.0  # seconds
+_ALL_TYPES = "*"
+
+_logger = logging.getLogger(__name__)
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+AsyncEventHandler = Callable[[GrantexEvent], Awaitable[None]]
+HandlerErrorHandler = Callable[[Exception, GrantexEvent], None]
+
+
+@dataclass
+class _Registration:
+    handler: AsyncEventHandler
+    limit: int | None
+    semaphore: asyncio.Semaphore | None = None
+
+
+class WebhookReceiver:
+    """ASGI app that accepts Grantex webhook deliveries and handles them later.
+
+    Each ``POST`` is checked against the raw body with a
+    :class:`~grantex.WebhookVerifier` (``X-Grantex-Signature-V2`` and
+    ``X-Grantex-Timestamp``), parsed into a :class:`~grantex.GrantexStreamEvent`,
+    put on an asyncio queue, and answered ``202`` straight away, so slow
+    handlers never cause the sender to time out and retry. Failed checks
+    get ``401``, malformed bodies ``400``, bodies over ``max_body_bytes``
+    ``413``, and a full queue ``503`` so the sender retries later.
+
+    ``concurrency`` tasks take events off the queue and await every handler
+    registered for the event's type (plus ``"*"`` handlers); ``on(...,
+    concurrency=n)`` further limits a single handler. Handler time per event
+    type is recorded in :attr:`latency`, a :class:`~grantex.LatencyRecorder`.
+    A handler that raises is counted in :attr:`failed` and passed to
+    ``on_error``; exceptions raised by ``on_error`` are logged and ignored.
+
+    Workers start with the ASGI lifespan, or on the first delivery when the
+    app is mounted in a framework that does not forward lifespan events;
+    call :meth:`aclose` on shutdown in that case.
+
+    Example::
+
+        receiver = WebhookReceiver(WebhookVerifier(secrets=[secret]))
+
+        @receiver.on("grant.revoked")
+        async def evict(event):
+            await cache.delete(event.data["grantId"])
+
+        app.mount("/webhooks/grantex", receiver)
+    """
+
+    def __init__(
+        self,
+        verifier: WebhookVerifier,
+        *,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+        max_body_bytes: int = _DEFAULT_MAX_BODY_BYTES,
+        latency: LatencyRecorder | None = None,
+        on_error: HandlerErrorHandler | None = None,
+    ) -> None:
+        if concurrency < 1 or max_queue < 1:
+            raise ValueError("concurrency and max_queue must be at least 1")
+        self._verifier = verifier
+        self._concurrency = concurrency
+        self._max_queue = max_queue
+        self._max_body_bytes = max_body_bytes
+        self._on_error = on_error
+        self.latency = latency if latency is not None else LatencyRecorder()
+        self._handlers: dict[str, list[_Registration]] = {}
+        self._queue: asyncio.Queue[GrantexEvent] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._received = 0
+        self._rejected = 0
+        self._failed = 0
+
+    @property
+    def received(self) -> int:
+        """Deliveries accepted and queued."""
+        return self._received
+
+    @property
+    def rejected(self) -> int:
+        """Deliveries refused (bad signature or body, or a full queue)."""
+        return self._rejected
+
+    @property
+    def failed(self) -> int:
+        """Handler calls that raised."""
+        return self._failed
+
+    @property
+    def pending(self) -> int:
+        """Events queued but not yet taken by a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def on(
+        self,
+        event_type: str,
+        handler: AsyncEventHandler | None = None,
+        *,
+        concurrency: int | None = None,
+    ) -> Callable[[AsyncEventHandler], AsyncEventHandler]:
+        """Register async *handler* for *event_type* (``"*"`` for every event).
+
+        *concurrency* caps how many calls of this handler run at once.
+        Usable directly or as a decorator; returns a decorator either way.
+        """
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        def register(fn: AsyncEventHandler) -> AsyncEventHandler:
+            self._handlers.setdefault(event_type, []).append(_Registration(fn, concurrency))
+            return fn
+
+        if handler is not None:
+            register(handler)
+        return register
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self, timeout: float | None = _DEFAULT_DRAIN_TIMEOUT) -> bool:
+        """Finish queued events, then stop the workers.
+
+        Returns ``False`` if events were still queued after *timeout*.
+        """
+        drained = True
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                drained = False
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        return drained
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            await _respond(send, 405, [(b"allow", b"POST")])
+            return
+        body = await _read_body(receive, self._max_body_bytes)
+        if body is None:
+            self._rejected += 1
+            await _respond(send, 413)
+            return
+        headers = dict(scope["headers"])
+        signature = headers.get(b"x-grantex-signature-v2", b"").decode("latin-1")
+        timestamp = headers.get(b"x-grantex-timestamp", b"").decode("latin-1")
+        if not self._verifier.verify(body, signature, timestamp):
+            self._rejected += 1
+            await _respond(send, 401)
+            return
+        try:
+            event = GrantexEvent.from_dict(json.loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._rejected += 1
+            await _respond(send, 400)
+            return
+        queue = self._start()
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._rejected += 1
+            await _respond(send, 503, [(b"retry-after", b"1")])
+            return
+        self._received += 1
+        await _respond(send, 202)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _start(self) -> asyncio.Queue[GrantexEvent]:
+        # Created on first use so they bind to the server's running loop.
+        if self._queue is None:
+            self._queue = asyncio.Queue(self._max_queue)
+            for registrations in self._handlers.values():
+                for registration in registrations:
+                    registration.semaphore = None
+            self._workers = [
+                asyncio.ensure_future(self._run(self._queue))
+                for _ in range(self._concurrency)
+            ]
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[GrantexEvent]) -> None:
+        while True:
+            event = await queue.get()
+            try:
+                await self._handle(event)
+            finally:
+                queue.task_done()
+
+    async def _handle(self, event: GrantexEvent) -> None:
+        registrations = self._handlers.get(event.type, []) + self._handlers.get(
+            _ALL_TYPES, []
+        )
+        started = time.monotonic()
+        failures = 0
+        try:
+            for registration in registrations:
+                if registration.limit is not None and registration.semaphore is None:
+                    registration.semaphore = asyncio.Semaphore(registration.limit)
+                try:
+                    if registration.semaphore is not None:
+                        async with registration.semaphore:
+                            await registration.handler(event)
+                    else:
+                        await registration.handler(event)
+                except Exception as exc:  # noqa: BLE001
+                    failures += 1
+                    self._report_error(exc, event)
+        finally:
+            # Also on cancellation, so aclose() leaves the counters consistent
+            self._failed += failures
+            self.latency.record(event.type, time.monotonic() - started, error=failures > 0)
+
+    def _report_error(self, exc: Exception, event: GrantexEvent) -> None:
+        if self._on_error is None:
+            return
+        try:
+            self._on_error(exc, event)
+        except Exception:
+            _logger.exception("WebhookReceiver on_error handler raised")
+
+
+async def _read_body(receive: Receive, limit: int) -> bytes | None:
+    chunks: list[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _respond(
+    send: Send, status: int, headers: list[tuple[bytes, bytes]] | None = None
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-length", b"0"), *(headers or [])],
+        }
+    )
+    await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from ._errors import GrantexTokenError
+from ._types import VerifiedGrant
+from .resources._events import (
+    _DEFAULT_RECONNECT,
+    ErrorHandler,
+    EventsClient,
+    GrantexEvent,
+    ReconnectPolicy,
+    StreamOptions,
+    Subscription,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+REVOCATION_EVENT_TYPES = ("grant.revoked", "anomaly.auto_revoked")
+
+_DEFAULT_TTL = 24 * 60 * 60.0  # seconds
+_DEFAULT_MAX_ENTRIES = 100_000
+
+_GRANT = "grant"
+_TOKEN = "token"
+
+
+class RevocationCache:
+    """Local set of revoked grant and token ids, kept current by the event stream.
+
+    ``start()`` subscribes to ``grant.revoked`` and ``anomaly.auto_revoked``
+    and records each revoked grant id as it arrives, so tokens for those
+    grants are rejected by :func:`~grantex.verify_grant_token` and
+    :meth:`~grantex.Grantex.enforce` without an online check. A token is
+    rejected when its ``jti``, its grant, or its parent grant is revoked.
+    Because the server revokes descendants with their root, delegated
+    tokens more than one level below a revoked grant are not caught
+    locally.
+
+    The server sends no event for single-token revocation; call
+    :meth:`revoke_token` alongside ``client.tokens.revoke()``.
+
+    Entries are dropped after ``ttl`` seconds, or at ``expires_at`` when
+    given — a revoked grant whose tokens have all expired no longer needs
+    remembering — and the soonest-expiring entries are evicted beyond
+    ``max_entries``. Revocations published while the stream is
+    disconnected are not replayed; with ``fail_closed=True`` every check
+    fails while the stream is down.
+
+    Example::
+
+        revocations = client.watch_revocations()
+        result = client.enforce(token, "salesforce", "query")
+    """
+
+    def __init__(
+        self,
+        events: EventsClient | None = None,
+        *,
+        ttl: float = _DEFAULT_TTL,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        fail_closed: bool = False,
+        reconnect: ReconnectPolicy = _DEFAULT_RECONNECT,
+        on_error: ErrorHandler | None = None,
+    ) -> None:
+        if ttl <= 0 or max_entries < 1:
+            raise ValueError("ttl and max_entries must be positive")
+        self._events = events
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._fail_closed = fail_closed
+        self._reconnect = reconnect
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        # (kind, id) -> expiry in epoch seconds; the heap orders expiries for
+        # pruning and may hold superseded ones, which are skipped.
+        self._entries: dict[tuple[str, str], float] = {}
+        self._expiries: list[tuple[float, str, str]] = []
+        self._subscription: Subscription | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._prune(time.time())
+            return len(self._entries)
+
+    @property
+    def subscription(self) -> Subscription | None:
+        """The stream subscription feeding the cache, once started."""
+        return self._subscription
+
+    @property
+    def connected(self) -> bool:
+        """Whether the revocation stream is currently connected."""
+        metrics = self._subscription.metrics if self._subscription is not None else None
+        return metrics is not None and metrics.connected
+
+    def start(self) -> RevocationCache:
+        """Subscribe to revocation events in the background."""
+        if self._events is None:
+            raise RuntimeError("RevocationCache was created without an EventsClient")
+        if self._subscription is not None:
+            raise RuntimeError("revocation cache already started")
+        self._subscription = self._events.subscribe(
+            self.handle_event,
+            StreamOptions(types=list(REVOCATION_EVENT_TYPES)),
+            on_error=self._on_error,
+            reconnect=self._reconnect,
+        )
+        return self
+
+    def stop(self) -> None:
+        """Stop listening for revocations; recorded entries are kept."""
+        if self._subscription is not None:
+            self._subscription.unsubscribe()
+            self._subscription = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def handle_event(self, event: GrantexEvent) -> None:
+        """Record the grants revoked by *event*; other events are ignored.
+
+        Usable as a handler on an existing stream, e.g. a
+        :class:`~grantex.SharedEventStream` subscription.
+        """
+        if event.type == "grant.revoked":
+            grant_ids: Any = [event.data.get("grantId")]
+        elif event.type == "anomaly.auto_revoked":
+            grant_ids = event.data.get("revokedGrants") or []
+        else:
+            return
+        for grant_id in grant_ids:
+            if isinstance(grant_id, str) and grant_id:
+                self.revoke_grant(grant_id)
+
+    def revoke_grant(self, grant_id: str, expires_at: float | None = None) -> None:
+        """Treat *grant_id* as revoked until *expires_at* (epoch seconds)."""
+        self._add(_GRANT, grant_id, expires_at)
+
+    def revoke_token(self, token_id: str, expires_at: float | None = None) -> None:
+        """Treat the token with ``jti`` *token_id* as revoked until *expires_at*."""
+        self._add(_TOKEN, token_id, expires_at)
+
+    def is_revoked(self, grant: VerifiedGrant) -> bool:
+        """Whether *grant*'s token, grant, or parent grant has been revoked."""
+        keys = [(_TOKEN, grant.token_id), (_GRANT, grant.grant_id)]
+        if grant.parent_grant_id is not None:
+            keys.append((_GRANT, grant.parent_grant_id))
+        now = time.time()
+        with self._lock:
+            return any(self._entries.get(key, 0.0) > now for key in keys)
+
+    def check(self, grant: VerifiedGrant) -> None:
+        """Raise :class:`GrantexTokenError` if *grant* must not be accepted."""
+        if self._fail_closed and not self.connected:
+            raise GrantexTokenError(
+                "Grant token rejected: revocation stream is not connected"
+            )
+        if self.is_revoked(grant):
+            raise GrantexTokenError(
+                f"Grant token has been revoked (grant {grant.grant_id})"
+            )
+
+    def _add(self, kind: str, key: str, expires_at: float | None) -> None:
+        now = time.time()
+        expiry = expires_at if expires_at is not None else now + self._ttl
+        with self._lock:
+            current = self._entries.get((kind, key))
+            if current is not None and current >= expiry:
+                return
+            self._entries[(kind, key)] = expiry
+            heapq.heappush(self._expiries, (expiry, kind, key))
+            self._prune(now)
+            while len(self._entries) > self._max_entries:
+                self._pop()
+
+    def _prune(self, now: float) -> None:
+        while self._expiries and self._expiries[0][0] <= now:
+            self._pop()
+        if len(self._expiries) > 2 * len(self._entries) + 64:
+            # Too many superseded expiries; rebuild from the live entries.
+            self._expiries = [(e, kind, key) for (kind, key), e in self._entries.items()]
+            heapq.heapify(self._expiries)
+
+    def _pop(self) -> None:
+        expiry, kind, key = heapq.heappop(self._expiries)
+        if self._entries.get((kind, key)) == expiry:
+            del self._entries[(kind, key)]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(frozen=True)
+class ServerSentEvent:
+    """One dispatched Server-Sent Event."""
+
+    data: str
+    event: str = "message"
+    id: str | None = None
+    retry: int | None = None
+
+
+class SSEDecoder:
+    """Incremental Server-Sent Events parser over raw bytes.
+
+    Implements the WHATWG ``text/event-stream`` rules: LF, CR and CRLF line
+    endings (also when split across chunks), multi-line ``data``, the
+    ``event``, ``id`` and ``retry`` fields, comments, and a leading BOM.
+    Each byte is scanned once, and only the unfinished last line is kept
+    between chunks, so the cost per event stays constant however much
+    arrives at once.
+
+    ``last_event_id`` persists across events as the spec requires, ready to
+    be sent as ``Last-Event-ID`` on reconnect; ``retry`` holds the latest
+    reconnection delay hint in milliseconds.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._scanned = 0
+        self._skip_lf = False
+        self._started = False
+        self._data: list[str] = []
+        self._event = ""
+        self.last_event_id: str | None = None
+        self.retry: int | None = None
+
+    def iter_events(self, chunks: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+        """Yield events from *chunks* as soon as each one is complete."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+    def feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Consume *chunk* and return the events it completed."""
+        if not chunk:
+            return []
+        buf = self._buf
+        buf += chunk
+        if not self._started:
+            if len(buf) < len(_BOM) and _BOM.startswith(bytes(buf)):
+                return []
+            if buf.startswith(_BOM):
+                del buf[: len(_BOM)]
+            self._started = True
+        if self._skip_lf and buf[:1] == b"\n":
+            del buf[:1]
+        self._skip_lf = False
+
+        events: list[ServerSentEvent] = []
+        start = 0
+        pos = self._scanned
+        end = len(buf)
+        # Next CR / LF at or after pos; each is searched for again only once
+        # passed, so a chunk without CRs isn't rescanned per line.
+        cr = lf = -1
+        while pos < end:
+            if cr < pos:
+                cr = buf.find(b"\r", pos)
+                if cr < 0:
+                    cr = end
+            if lf < pos:
+                lf = buf.find(b"\n", pos)
+                if lf < 0:
+                    lf = end
+            if cr == end and lf == end:
+                break
+            if lf < cr:
+                line_end, next_start = lf, lf + 1
+            elif cr + 1 < end:
+                line_end = cr
+                next_start = cr + 2 if buf[cr + 1] == 0x0A else cr + 1
+            else:
+                # CR is the last byte; a LF in the next chunk belongs to it.
+                line_end, next_start = cr, cr + 1
+                self._skip_lf = True
+            event = self._process_line(bytes(buf[start:line_end]))
+            if event is not None:
+                events.append(event)
+            start = pos = next_start
+        del buf[:start]
+        self._scanned = len(buf)
+        return events
+
+    def _process_line(self, raw: bytes) -> ServerSentEvent | None:
+        if not raw:
+            return self._dispatch()
+        line = raw.decode("utf-8", errors="replace")
+        if line.startswith(":"):
+            return None
+        field, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry" and value.isascii() and value.isdigit():
+            self.retry = int(value)
+        return None
+
+    def _dispatch(self) -> ServerSentEvent | None:
+        data, event = self._data, self._event
+        self._data, self._event = [], ""
+        if not data:
+            return None
+        return ServerSentEvent(
+            data="\n".join(data),
+            event=event or "message",
+            id=self.last_event_id,
+            retry=self.retry,
+        )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+from ._lazy import LazySequence
 
 # ─── Rate Limits ──────────────────────────────────────────────────────────────
 
@@ -395,6 +397,7 @@ class AuditEntry:
     prev_hash: str | None
     timestamp: str
     status: str
+    developer_id: str | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AuditEntry:
@@ -410,6 +413,7 @@ class AuditEntry:
             prev_hash=data.get("prevHash"),
             timestamp=data["timestamp"],
             status=data.get("status", "success"),
+            developer_id=data.get("developerId"),
         )
 
 
@@ -447,12 +451,12 @@ class ListAuditParams:
 
 @dataclass(frozen=True)
 class ListAuditResponse:
-    entries: tuple[AuditEntry, ...]
+    entries: Sequence[AuditEntry]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ListAuditResponse:
         return cls(
-            entries=tuple(AuditEntry.from_dict(e) for e in data.get("entries", [])),
+            entries=LazySequence(data.get("entries", []), AuditEntry.from_dict),
         )
 
 
@@ -802,14 +806,14 @@ class ComplianceExportAuditParams:
 class ComplianceGrantsExport:
     generated_at: str
     total: int
-    grants: tuple[Grant, ...]
+    grants: Sequence[Grant]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ComplianceGrantsExport":
         return cls(
             generated_at=data["generatedAt"],
             total=data["total"],
-            grants=tuple(Grant.from_dict(g) for g in data.get("grants", [])),
+            grants=LazySequence(data.get("grants", []), Grant.from_dict),
         )
 
 
@@ -817,14 +821,14 @@ class ComplianceGrantsExport:
 class ComplianceAuditExport:
     generated_at: str
     total: int
-    entries: tuple[AuditEntry, ...]
+    entries: Sequence[AuditEntry]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ComplianceAuditExport":
         return cls(
             generated_at=data["generatedAt"],
             total=data["total"],
-            entries=tuple(AuditEntry.from_dict(e) for e in data.get("entries", [])),
+            entries=LazySequence(data.get("entries", []), AuditEntry.from_dict),
         )
 
 
@@ -911,6 +915,7 @@ class ChainIntegrity:
     valid: bool
     checked_entries: int
     first_broken_at: str | None
+    reason: str | None = None  # 'link' | 'content'
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ChainIntegrity":
@@ -918,6 +923,7 @@ class ChainIntegrity:
             valid=data["valid"],
             checked_entries=data["checkedEntries"],
             first_broken_at=data.get("firstBrokenAt"),
+            reason=data.get("reason"),
         )
 
 
@@ -944,8 +950,8 @@ class EvidencePackMeta:
 class EvidencePack:
     meta: EvidencePackMeta
     summary: dict[str, Any]
-    grants: tuple[Grant, ...]
-    audit_entries: tuple[AuditEntry, ...]
+    grants: Sequence[Grant]
+    audit_entries: Sequence[AuditEntry]
     policies: tuple[Policy, ...]
     chain_integrity: ChainIntegrity
 
@@ -954,8 +960,8 @@ class EvidencePack:
         return cls(
             meta=EvidencePackMeta.from_dict(data["meta"]),
             summary=data["summary"],
-            grants=tuple(Grant.from_dict(g) for g in data.get("grants", [])),
-            audit_entries=tuple(AuditEntry.from_dict(e) for e in data.get("auditEntries", [])),
+            grants=LazySequence(data.get("grants", []), Grant.from_dict),
+            audit_entries=LazySequence(data.get("auditEntries", []), AuditEntry.from_dict),
             policies=tuple(Policy.from_dict(p) for p in data.get("policies", [])),
             chain_integrity=ChainIntegrity.from_dict(data["chainIntegrity"]),
         )
@@ -1857,6 +1863,8 @@ class ListCredentialsParams:
     grant_id: str | None = None
     principal_id: str | None = None
     status: str | None = None
+    page: int | None = None
+    page_size: int | None = None
 
     def to_query(self) -> dict[str, str]:
         result: dict[str, str] = {}
@@ -1866,6 +1874,10 @@ class ListCredentialsParams:
             result["principalId"] = self.principal_id
         if self.status is not None:
             result["status"] = self.status
+        if self.page is not None:
+            result["page"] = str(self.page)
+        if self.page_size is not None:
+            result["pageSize"] = str(self.page_size)
         return result
 
 
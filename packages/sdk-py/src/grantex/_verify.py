@@ -7,6 +7,7 @@ import jwt
 from jwt.algorithms import RSAAlgorithm
 
 from ._errors import GrantexTokenError
+from ._revocation import RevocationCache
 from ._types import GrantTokenPayload, VerifiedGrant, VerifyGrantTokenOptions
 
 
@@ -17,14 +18,18 @@ _PRODUCTION_ISSUER = "https://grantex.dev"
 def verify_grant_token(
     token: str,
     options: VerifyGrantTokenOptions,
+    *,
+    revocations: RevocationCache | None = None,
 ) -> VerifiedGrant:
     """Verify a Grantex grant token locally using remotely retrieved JWKS.
 
     Algorithm is fixed to RS256 per SPEC §11 and cannot be overridden.
+    With *revocations*, tokens whose grant has been revoked are rejected
+    from the local :class:`RevocationCache` without an online check.
 
     Raises:
-        GrantexTokenError: if the token is invalid, expired, tampered, or
-            missing required scopes.
+        GrantexTokenError: if the token is invalid, expired, tampered,
+            missing required scopes, or revoked.
     """
     try:
         header = jwt.get_unverified_header(token)
@@ -82,7 +87,10 @@ def verify_grant_token(
                 f"Grant token is missing required scopes: {', '.join(missing)}"
             )
 
-    return _payload_to_verified_grant(payload)
+    grant = _payload_to_verified_grant(payload)
+    if revocations is not None:
+        revocations.check(grant)
+    return grant
 
 
 def _derive_issuer_from_jwks_uri(jwks_uri: str) -> str:
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import hmac
 import re
+import threading
 import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
 _DEFAULT_TOLERANCE_SECONDS = 300
+_DEFAULT_REPLAY_ENTRIES = 100_000
 _TIMESTAMP_RE = re.compile(r"^\d{1,15}$")
+_SIGNATURE_RE = re.compile(r"sha256=[0-9a-f]{64}")
 
 
 def verify_webhook_signature(
@@ -42,6 +48,7 @@ def verify_webhook(
     timestamp: str,
     secret: str,
     tolerance_seconds: int = _DEFAULT_TOLERANCE_SECONDS,
+    replay_store: ReplayStore | None = None,
 ) -> bool:
     """Verify a timestamped webhook delivery.
 
@@ -61,17 +68,15 @@ def verify_webhook(
         tolerance_seconds: How old a delivery may be. Deliveries dated this far
                            into the future are refused too, so a forged clock
                            cannot buy an unbounded window.
+        replay_store:      Optional :class:`ReplayStore`; a delivery whose
+                           signature it has already seen is refused.
 
     Returns:
         True if the signature is valid and the delivery is fresh, else False.
     """
     if not isinstance(signature, str) or not signature:
         return False
-    if not isinstance(timestamp, str) or not _TIMESTAMP_RE.match(timestamp):
-        return False
-
-    age_seconds = int(time.time()) - int(timestamp)
-    if abs(age_seconds) > tolerance_seconds:
+    if not _is_fresh(timestamp, tolerance_seconds, time.time()):
         return False
 
     if isinstance(payload, str):
@@ -79,4 +84,192 @@ def verify_webhook(
 
     signed = timestamp.encode() + b"." + payload
     expected = "sha256=" + hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
-    return hmac.compare_digest(signature, expected)
+    if not hmac.compare_digest(signature, expected):
+        return False
+    # Key on the computed signature, never the header as received.
+    return replay_store is None or replay_store.add(
+        expected, int(timestamp) + tolerance_seconds
+    )
+
+
+@dataclass(frozen=True)
+class WebhookDelivery:
+    """A stored webhook delivery, for :meth:`WebhookVerifier.verify_many`.
+
+    ``received_at`` (epoch seconds) is when the delivery arrived; freshness
+    is judged against it instead of the current time, so archived
+    deliveries can be re-verified later.
+    """
+
+    payload: str | bytes
+    signature: str
+    timestamp: str
+    received_at: float | None = None
+
+
+class WebhookVerifier:
+    """Verifies timestamped webhook deliveries against one or more secrets.
+
+    Equivalent to calling :func:`verify_webhook` once per secret, but the
+    keyed HMAC state for each secret is built once and copied per delivery,
+    and the signature header is decoded once rather than per secret. A
+    delivery is accepted if any secret matches, so keep both the old and
+    the new secret here while rotating. With a ``replay_store``,
+    :meth:`verify` also refuses a delivery it has already accepted.
+
+    Example::
+
+        verifier = WebhookVerifier(secrets=[new_secret, old_secret])
+        if not verifier.verify(body, headers["x-grantex-signature-v2"],
+                               headers["x-grantex-timestamp"]):
+            return 401
+    """
+
+    def __init__(
+        self,
+        secrets: Sequence[str],
+        *,
+        tolerance_seconds: int = _DEFAULT_TOLERANCE_SECONDS,
+        replay_store: ReplayStore | None = None,
+    ) -> None:
+        if isinstance(secrets, str) or not secrets:
+            raise ValueError("secrets must be a non-empty list of webhook secrets")
+        self._macs = [
+            hmac.new(secret.encode(), digestmod=hashlib.sha256) for secret in secrets
+        ]
+        self._tolerance_seconds = tolerance_seconds
+        self._replay_store = replay_store
+
+    def verify(
+        self,
+        payload: str | bytes,
+        signature: str,
+        timestamp: str,
+    ) -> bool:
+        """Whether the delivery is fresh, signed with any configured secret,
+        and not a replay."""
+        if not self._verify(payload, signature, timestamp, time.time()):
+            return False
+        return self._replay_store is None or self._replay_store.add(
+            _replay_key(signature), int(timestamp) + self._tolerance_seconds
+        )
+
+    def verify_many(self, deliveries: Iterable[WebhookDelivery]) -> list[bool]:
+        """Verify a batch of deliveries, e.g. when replaying an archive.
+
+        The replay store is not consulted: re-checking stored deliveries is
+        the point.
+        """
+        now = time.time()
+        return [
+            self._verify(
+                d.payload,
+                d.signature,
+                d.timestamp,
+                d.received_at if d.received_at is not None else now,
+            )
+            for d in deliveries
+        ]
+
+    def _verify(
+        self,
+        payload: str | bytes,
+        signature: str,
+        timestamp: str,
+        now: float,
+    ) -> bool:
+        # Only the exact form Grantex sends, as verify_webhook's string
+        # compare requires; fromhex alone would accept other spellings.
+        if not isinstance(signature, str) or not _SIGNATURE_RE.fullmatch(signature):
+            return False
+        if not _is_fresh(timestamp, self._tolerance_seconds, now):
+            return False
+        expected = bytes.fromhex(signature[len("sha256="):])
+        if isinstance(payload, str):
+            payload = payload.encode()
+        matched = False
+        for base in self._macs:
+            mac = base.copy()
+            mac.update(timestamp.encode())
+            mac.update(b".")
+            mac.update(payload)
+            # No early exit: the time taken doesn't reveal which secret matched.
+            matched |= hmac.compare_digest(mac.digest(), expected)
+        return matched
+
+
+class ReplayStore:
+    """Remembers accepted webhook signatures until their deliveries go stale.
+
+    A delivery stays valid until ``timestamp + tolerance_seconds``, so its
+    signature only needs remembering until then. ``add()`` records a
+    signature with that expiry (epoch seconds) and returns ``False`` if it
+    is already recorded and unexpired, in O(1) amortized time. Entries are
+    grouped by expiry second and a whole second's worth is dropped as soon
+    as the clock passes it. Beyond ``max_entries`` the entries closest to
+    expiry are evicted first.
+
+    To share replay state between processes, subclass and override
+    :meth:`add` with an atomic set-if-absent on your store (for example
+    Redis ``SET key 1 NX EXAT expires_at``).
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_REPLAY_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._expiry: dict[str, int] = {}
+        self._buckets: dict[int, list[str]] = {}
+        self._seconds: list[int] = []  # heap of bucket keys
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(int(time.time()))
+            return len(self._expiry)
+
+    def add(self, key: str, expires_at: int) -> bool:
+        """Record *key* until *expires_at*; ``False`` if it is already recorded."""
+        now = int(time.time())
+        with self._lock:
+            self._expire(now)
+            if key in self._expiry:
+                return False
+            if expires_at < now:
+                return True
+            self._expiry[key] = expires_at
+            bucket = self._buckets.get(expires_at)
+            if bucket is None:
+                bucket = self._buckets[expires_at] = []
+                heapq.heappush(self._seconds, expires_at)
+            bucket.append(key)
+            while len(self._expiry) > self._max_entries:
+                self._evict_one()
+            return True
+
+    def _expire(self, now: int) -> None:
+        # An entry is live through its expiry second, matching the
+        # inclusive tolerance check.
+        while self._seconds and self._seconds[0] < now:
+            for key in self._buckets.pop(heapq.heappop(self._seconds)):
+                del self._expiry[key]
+
+    def _evict_one(self) -> None:
+        second = self._seconds[0]
+        bucket = self._buckets[second]
+        del self._expiry[bucket.pop()]
+        if not bucket:
+            heapq.heappop(self._seconds)
+            del self._buckets[second]
+
+
+def _replay_key(signature: str) -> str:
+    # One key per digest however the hex was spelled, so a re-encoded
+    # header cannot slip past the replay store.
+    return "sha256=" + bytes.fromhex(signature[len("sha256="):]).hex()
+
+
+def _is_fresh(timestamp: str, tolerance_seconds: int, now: float) -> bool:
+    if not isinstance(timestamp, str) or not _TIMESTAMP_RE.match(timestamp):
+        return False
+    return abs(int(now) - int(timestamp)) <= tolerance_seconds
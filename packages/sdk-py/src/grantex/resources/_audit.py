@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Iterator, Sequence
+from typing import Any
 from urllib.parse import urlencode
 
+from .._audit_mirror import _DEFAULT_BATCH_SIZE as _DEFAULT_MIRROR_BATCH_SIZE
+from .._audit_mirror import AuditMirror, MirrorPath
+from .._batching import (
+    _DEFAULT_BATCH_SIZE,
+    _DEFAULT_FLUSH_INTERVAL,
+    _DEFAULT_MAX_QUEUE,
+    _DEFAULT_MAX_RETRIES,
+    BatchingAuditLogger,
+    DropHandler,
+)
 from .._http import HttpClient
+from .._pagination import _DEFAULT_PAGE_SIZE, iter_pages, next_page
 from .._types import AuditEntry, ListAuditParams, ListAuditResponse, LogAuditParams
-from typing import Any
+from ._compliance import ComplianceClient
 
 
 class AuditClient:
@@ -34,12 +48,66 @@ class AuditClient:
         data = self._http.post("/v1/audit/log", params.to_dict())
         return AuditEntry.from_dict(data)
 
+    def batching(
+        self,
+        *,
+        max_queue: int = _DEFAULT_MAX_QUEUE,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        on_drop: DropHandler | None = None,
+    ) -> BatchingAuditLogger:
+        """Return a :class:`BatchingAuditLogger` that sends entries in the background."""
+        return BatchingAuditLogger(
+            self,
+            max_queue=max_queue,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_retries=max_retries,
+            on_drop=on_drop,
+        )
+
+    def mirror(
+        self,
+        path: MirrorPath,
+        *,
+        batch_size: int = _DEFAULT_MIRROR_BATCH_SIZE,
+    ) -> AuditMirror:
+        """Open (or create) a local SQLite :class:`AuditMirror` at *path*."""
+        return AuditMirror(ComplianceClient(self._http), path, batch_size=batch_size)
+
     def list(self, params: ListAuditParams | None = None) -> ListAuditResponse:
         qs = _build_query(params.to_dict() if params else {})
         path = f"/v1/audit/entries?{qs}" if qs else "/v1/audit/entries"
         data = self._http.get(path)
         return ListAuditResponse.from_dict(data)
 
+    def iter_entries(
+        self,
+        params: ListAuditParams | None = None,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[AuditEntry]:
+        """Iterate over every audit entry matching *params*, page by page.
+
+        ``params.page`` (if set) is the first page fetched and
+        ``params.page_size`` overrides *page_size*. With *prefetch* the next
+        page is fetched in the background while the current one is consumed.
+
+        The API currently ignores ``page``/``pageSize`` here and returns
+        every match in one response, so a background fetch would only
+        download the same rows again; *prefetch* is therefore off by default.
+        """
+        base = params or ListAuditParams()
+        size = base.page_size or page_size
+
+        def fetch(page: int) -> tuple[Sequence[AuditEntry], int | None]:
+            entries = self.list(dataclasses.replace(base, page=page, page_size=size)).entries
+            return entries, next_page(page, len(entries), size)
+
+        return iter_pages(fetch, base.page or 1, prefetch=prefetch)
+
     def get(self, entry_id: str) -> AuditEntry:
         data = self._http.get(f"/v1/audit/{entry_id}")
         return AuditEntry.from_dict(data)
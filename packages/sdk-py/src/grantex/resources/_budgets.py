@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from .._http import HttpClient
+from .._pagination import _DEFAULT_PAGE_SIZE, iter_pages
 from .._types import (
     AllocateBudgetParams,
     BudgetAllocation,
+    BudgetTransaction,
     BudgetTransactionsResponse,
     DebitBudgetParams,
     DebitBudgetResponse,
@@ -28,7 +31,7 @@ class BudgetsClient:
 
     def balance(self, grant_id: str) -> BudgetAllocation:
         """Get the current budget balance for a grant."""
-        data = self._http.get(f"/v1/budget/balance/{grant_id}")
+        data = self._http.get(f"/v1/budget/balance/{grant_id}", hedge=True)
         return BudgetAllocation.from_dict(data)
 
     def transactions(
@@ -54,3 +57,23 @@ class BudgetsClient:
         url = f"/v1/budget/transactions/{grant_id}{('?' + qs) if qs else ''}"
         data = self._http.get(url)
         return BudgetTransactionsResponse.from_dict(data)
+
+    def iter_transactions(
+        self,
+        grant_id: str,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[BudgetTransaction]:
+        """Iterate over every budget transaction for a grant, page by page.
+
+        The next page is fetched in the background while the current one is
+        consumed unless *prefetch* is ``False``.
+        """
+
+        def fetch(page: int) -> tuple[tuple[BudgetTransaction, ...], int | None]:
+            result = self.transactions(grant_id, page=page, page_size=page_size)
+            more = bool(result.transactions) and page * page_size < result.total
+            return result.transactions, page + 1 if more else None
+
+        return iter_pages(fetch, 1, prefetch=prefetch)
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Iterator
+
 from .._http import HttpClient
+from .._pagination import _DEFAULT_PAGE_SIZE, iter_pages, next_page
 from .._types import (
-    VerifiableCredentialRecord,
     ListCredentialsParams,
     ListCredentialsResponse,
-    VCVerificationResult,
     SDJWTPresentParams,
     SDJWTPresentResult,
+    VCVerificationResult,
+    VerifiableCredentialRecord,
 )
 
 
@@ -32,6 +36,31 @@ class CredentialsClient:
         data = self._http.get(path)
         return ListCredentialsResponse.from_dict(data)
 
+    def iter_credentials(
+        self,
+        params: ListCredentialsParams | None = None,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[VerifiableCredentialRecord]:
+        """Iterate over every credential matching *params*, page by page.
+
+        ``params.page`` (if set) is the first page fetched and
+        ``params.page_size`` overrides *page_size*. The next page is fetched
+        in the background while the current one is consumed unless
+        *prefetch* is ``False``.
+        """
+        base = params or ListCredentialsParams()
+        size = base.page_size or page_size
+
+        def fetch(page: int) -> tuple[tuple[VerifiableCredentialRecord, ...], int | None]:
+            credentials = self.list(
+                dataclasses.replace(base, page=page, page_size=size)
+            ).credentials
+            return credentials, next_page(page, len(credentials), size)
+
+        return iter_pages(fetch, base.page or 1, prefetch=prefetch)
+
     def verify(self, vc_jwt: str) -> VCVerificationResult:
         data = self._http.post("/v1/credentials/verify", {"credential": vc_jwt})
         return VCVerificationResult.from_dict(data)
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Iterator, Optional, Sequence
+import asyncio
 import json
+import logging
+import random
 import threading
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable
 
 import httpx
 
+from .._errors import GrantexEventError, GrantexNetworkError
+from .._sse import ServerSentEvent, SSEDecoder
 
 EventHandler = Callable[["GrantexEvent"], None]
 ErrorHandler = Callable[[Exception], None]
 
+_logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class GrantexEvent:
@@ -20,7 +29,7 @@ class GrantexEvent:
     data: dict[str, Any]
 
     @classmethod
-    def from_dict(cls, d: dict[str, Any]) -> "GrantexEvent":
+    def from_dict(cls, d: dict[str, Any]) -> GrantexEvent:
         return cls(
             id=d["id"],
             type=d["type"],
@@ -31,25 +40,72 @@ class GrantexEvent:
 
 @dataclass(frozen=True)
 class StreamOptions:
-    types: Optional[Sequence[str]] = None
+    types: Sequence[str] | None = None
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """How a dropped event stream is re-established.
+
+    After a disconnect the stream waits ``initial_delay`` seconds, or the
+    server's ``retry:`` hint when it sent one, doubling per consecutive
+    failed attempt up to ``max_delay`` and spread by +/- ``jitter``. The
+    wait resets once a connection succeeds. ``max_attempts`` bounds the
+    consecutive failures before the last error is raised (``None`` retries
+    forever). ``401``/``403`` and other non-retryable ``4xx`` responses are
+    always raised.
+    """
+
+    initial_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: float = 0.2
+    max_attempts: int | None = None
+
+
+_DEFAULT_RECONNECT = ReconnectPolicy()
+
+
+@dataclass
+class StreamMetrics:
+    """Live counters for a reconnecting event stream."""
+
+    connects: int = 0
+    reconnects: int = 0
+    failed_attempts: int = 0
+    events: int = 0
+    invalid_events: int = 0
+    connected: bool = False
+    last_event_id: str | None = None
+    last_error: Exception | None = None
 
 
 class Subscription:
     """Handle returned by ``EventsClient.subscribe`` to control the background stream."""
 
-    def __init__(self, thread: threading.Thread, stop_event: threading.Event) -> None:
+    def __init__(
+        self,
+        thread: threading.Thread,
+        stop_event: threading.Event,
+        metrics: StreamMetrics | None = None,
+    ) -> None:
         self._thread = thread
         self._stop_event = stop_event
+        self._metrics = metrics
+
+    @property
+    def metrics(self) -> StreamMetrics | None:
+        """Connection counters when subscribed with ``reconnect``, else ``None``."""
+        return self._metrics
 
     @property
     def active(self) -> bool:
         """Return ``True`` if the subscription is still running."""
         return self._thread.is_alive()
 
-    def unsubscribe(self) -> None:
-        """Stop the background stream and wait for the thread to exit."""
+    def unsubscribe(self, timeout: float | None = 5) -> None:
+        """Stop the background stream and wait up to *timeout* seconds for the thread to exit."""
         self._stop_event.set()
-        self._thread.join(timeout=5)
+        self._thread.join(timeout=timeout)
 
 
 class EventsClient:
@@ -57,39 +113,234 @@ class EventsClient:
         self._base_url = base_url
         self._api_key = api_key
 
-    def stream(self, options: Optional[StreamOptions] = None) -> Iterator[GrantexEvent]:
-        """Connect to the SSE event stream. Yields GrantexEvent objects."""
-        params = {}
-        if options and options.types:
-            params["types"] = ",".join(options.types)
+    def stream(
+        self,
+        options: StreamOptions | None = None,
+        *,
+        on_error: ErrorHandler | None = None,
+        reconnect: ReconnectPolicy | None = None,
+        metrics: StreamMetrics | None = None,
+        strict: bool = False,
+    ) -> Iterator[GrantexEvent]:
+        """Connect to the SSE event stream. Yields GrantexEvent objects.
+
+        An event whose payload isn't a valid event is skipped: it is passed
+        to *on_error* as a :class:`GrantexEventError` (or logged, without
+        one) and counted in ``metrics.invalid_events``. With *strict* the
+        error is raised instead.
+
+        With *reconnect* the iterator survives dropped connections: it
+        reconnects as the :class:`ReconnectPolicy` describes, sending
+        ``Last-Event-ID`` so a server that keeps history can resume, and
+        updates *metrics* if given.
+        """
+        if reconnect is None:
+            return self._stream_once(options, _invalid_event_handler(on_error, metrics, strict))
+        metrics = metrics if metrics is not None else StreamMetrics()
+        return self._stream_reconnecting(
+            options,
+            _invalid_event_handler(on_error, metrics, strict),
+            reconnect,
+            metrics,
+            threading.Event(),
+        )
 
-        url = f"{self._base_url}/v1/events/stream"
+    def _stream_once(
+        self,
+        options: StreamOptions | None,
+        on_error: ErrorHandler | None,
+    ) -> Iterator[GrantexEvent]:
+        with self._connect(options, None) as response:
+            response.raise_for_status()
+            yield from _decode_events(response.iter_bytes(), SSEDecoder(), on_error)
+
+    def _stream_reconnecting(
+        self,
+        options: StreamOptions | None,
+        on_error: ErrorHandler | None,
+        policy: ReconnectPolicy,
+        metrics: StreamMetrics,
+        stop: threading.Event,
+    ) -> Iterator[GrantexEvent]:
+        retry_hint: float | None = None
+        failures = 0
+        while not stop.is_set():
+            decoder = SSEDecoder()
+            error: Exception
+            try:
+                with self._connect(options, metrics.last_event_id) as response:
+                    response.raise_for_status()
+                    metrics.connects += 1
+                    if metrics.connects > 1:
+                        metrics.reconnects += 1
+                    metrics.connected = True
+                    failures = 0
+                    for event in _decode_events(response.iter_bytes(), decoder, on_error):
+                        metrics.events += 1
+                        metrics.last_event_id = decoder.last_event_id or event.id
+                        yield event
+                        if stop.is_set():
+                            return
+                error = GrantexNetworkError("Event stream closed by the server")
+            except httpx.HTTPStatusError as exc:
+                if not _is_retryable(exc):
+                    raise
+                error = exc
+            except httpx.TransportError as exc:
+                error = exc
+            finally:
+                metrics.connected = False
+            if decoder.retry is not None:
+                retry_hint = decoder.retry / 1000
+            failures += 1
+            metrics.failed_attempts += 1
+            metrics.last_error = error
+            if policy.max_attempts is not None and failures > policy.max_attempts:
+                raise error
+            if stop.wait(_reconnect_delay(policy, retry_hint, failures)):
+                return
+
+    async def astream(
+        self,
+        options: StreamOptions | None = None,
+        *,
+        on_error: ErrorHandler | None = None,
+        reconnect: ReconnectPolicy | None = None,
+        metrics: StreamMetrics | None = None,
+        strict: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> AsyncIterator[GrantexEvent]:
+        """Async counterpart of :meth:`stream` for asyncio applications.
+
+        Reads the stream with ``httpx.AsyncClient`` inside the running event
+        loop, so no thread is needed per stream::
+
+            async for event in client.events.astream(reconnect=ReconnectPolicy()):
+                ...
+
+        Pass *http_client* to reuse your own ``AsyncClient``; otherwise one
+        is created for the stream and closed when it ends. The other
+        arguments behave as in :meth:`stream`.
+        """
+        if reconnect is not None and metrics is None:
+            metrics = StreamMetrics()
+        handler = _invalid_event_handler(on_error, metrics, strict)
+        if http_client is not None:
+            async for event in self._astream(options, handler, reconnect, metrics, http_client):
+                yield event
+            return
+        async with httpx.AsyncClient(timeout=None) as owned:
+            async for event in self._astream(options, handler, reconnect, metrics, owned):
+                yield event
+
+    async def _astream(
+        self,
+        options: StreamOptions | None,
+        on_error: ErrorHandler | None,
+        policy: ReconnectPolicy | None,
+        metrics: StreamMetrics | None,
+        http: httpx.AsyncClient,
+    ) -> AsyncIterator[GrantexEvent]:
+        if policy is None:
+            async with self._aconnect(http, options, None) as response:
+                response.raise_for_status()
+                decoder = SSEDecoder()
+                async for chunk in response.aiter_bytes():
+                    for sse in decoder.feed(chunk):
+                        event = _parse_event(sse, on_error)
+                        if event is not None:
+                            yield event
+            return
+
+        metrics = metrics if metrics is not None else StreamMetrics()
+        retry_hint: float | None = None
+        failures = 0
+        while True:
+            decoder = SSEDecoder()
+            error: Exception
+            try:
+                async with self._aconnect(http, options, metrics.last_event_id) as response:
+                    response.raise_for_status()
+                    metrics.connects += 1
+                    if metrics.connects > 1:
+                        metrics.reconnects += 1
+                    metrics.connected = True
+                    failures = 0
+                    async for chunk in response.aiter_bytes():
+                        for sse in decoder.feed(chunk):
+                            event = _parse_event(sse, on_error)
+                            if event is None:
+                                continue
+                            metrics.events += 1
+                            metrics.last_event_id = decoder.last_event_id or event.id
+                            yield event
+                error = GrantexNetworkError("Event stream closed by the server")
+            except httpx.HTTPStatusError as exc:
+                if not _is_retryable(exc):
+                    raise
+                error = exc
+            except httpx.TransportError as exc:
+                error = exc
+            finally:
+                metrics.connected = False
+            if decoder.retry is not None:
+                retry_hint = decoder.retry / 1000
+            failures += 1
+            metrics.failed_attempts += 1
+            metrics.last_error = error
+            if policy.max_attempts is not None and failures > policy.max_attempts:
+                raise error
+            await asyncio.sleep(_reconnect_delay(policy, retry_hint, failures))
+
+    @contextmanager
+    def _connect(
+        self,
+        options: StreamOptions | None,
+        last_event_id: str | None,
+    ) -> Iterator[httpx.Response]:
+        url, params, headers = self._request_args(options, last_event_id)
         with httpx.stream(
             "GET",
             url,
             params=params,
-            headers={"Authorization": f"Bearer {self._api_key}"},
+            headers=headers,
             timeout=None,
         ) as response:
-            response.raise_for_status()
-            buffer = ""
-            for chunk in response.iter_text():
-                buffer += chunk
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    if line.startswith("data: "):
-                        try:
-                            data = json.loads(line[6:])
-                            yield GrantexEvent.from_dict(data)
-                        except (json.JSONDecodeError, KeyError):
-                            pass
+            yield response
+
+    @asynccontextmanager
+    async def _aconnect(
+        self,
+        http: httpx.AsyncClient,
+        options: StreamOptions | None,
+        last_event_id: str | None,
+    ) -> AsyncIterator[httpx.Response]:
+        url, params, headers = self._request_args(options, last_event_id)
+        async with http.stream(
+            "GET", url, params=params, headers=headers, timeout=None
+        ) as response:
+            yield response
+
+    def _request_args(
+        self,
+        options: StreamOptions | None,
+        last_event_id: str | None,
+    ) -> tuple[str, dict[str, str], dict[str, str]]:
+        params = {}
+        if options and options.types:
+            params["types"] = ",".join(options.types)
+        headers = {"Authorization": f"Bearer {self._api_key}"}
+        if last_event_id is not None:
+            headers["Last-Event-ID"] = last_event_id
+        return f"{self._base_url}/v1/events/stream", params, headers
 
     def subscribe(
         self,
         handler: EventHandler,
-        options: Optional[StreamOptions] = None,
+        options: StreamOptions | None = None,
         *,
-        on_error: Optional[ErrorHandler] = None,
+        on_error: ErrorHandler | None = None,
+        reconnect: ReconnectPolicy | None = None,
     ) -> Subscription:
         """Subscribe to events with a callback handler.
 
@@ -103,12 +354,26 @@ class EventsClient:
             on_error: Optional callback invoked when the stream raises an
                 exception.  If not provided, errors are silently swallowed
                 and the stream stops.
+            reconnect: Optional :class:`ReconnectPolicy`.  When given, the
+                subscription reconnects after dropped connections instead
+                of stopping and :attr:`Subscription.metrics` reports
+                connection counters. Undecodable events are skipped and
+                passed to *on_error* as :class:`GrantexEventError` either
+                way.
         """
         stop = threading.Event()
+        metrics = StreamMetrics() if reconnect is not None else None
+
+        def _events() -> Iterator[GrantexEvent]:
+            if reconnect is None or metrics is None:
+                return self.stream(options, on_error=on_error)
+            return self._stream_reconnecting(
+                options, _invalid_event_handler(on_error, metrics, False), reconnect, metrics, stop
+            )
 
         def _run() -> None:
             try:
-                for event in self.stream(options):
+                for event in _events():
                     if stop.is_set():
                         break
                     handler(event)
@@ -118,4 +383,57 @@ class EventsClient:
 
         thread = threading.Thread(target=_run, daemon=True)
         thread.start()
-        return Subscription(thread=thread, stop_event=stop)
+        return Subscription(thread=thread, stop_event=stop, metrics=metrics)
+
+
+def _decode_events(
+    chunks: Iterable[bytes],
+    decoder: SSEDecoder,
+    on_error: ErrorHandler | None,
+) -> Iterator[GrantexEvent]:
+    for sse in decoder.iter_events(chunks):
+        event = _parse_event(sse, on_error)
+        if event is not None:
+            yield event
+
+
+def _parse_event(sse: ServerSentEvent, on_error: ErrorHandler | None) -> GrantexEvent | None:
+    try:
+        return GrantexEvent.from_dict(json.loads(sse.data))
+    except (ValueError, KeyError, TypeError) as exc:
+        error = GrantexEventError(f"Invalid event payload: {exc!r}", sse.data, cause=exc)
+        if on_error is None:
+            raise error from exc
+        on_error(error)
+        return None
+
+
+def _is_retryable(exc: httpx.HTTPStatusError) -> bool:
+    status = exc.response.status_code
+    return status == 429 or status >= 500
+
+
+def _reconnect_delay(policy: ReconnectPolicy, retry_hint: float | None, failures: int) -> float:
+    base = retry_hint if retry_hint is not None else policy.initial_delay
+    delay: float = min(policy.max_delay, base * 2.0 ** (failures - 1))
+    return delay * random.uniform(1 - policy.jitter, 1 + policy.jitter)
+
+
+def _invalid_event_handler(
+    on_error: ErrorHandler | None, metrics: StreamMetrics | None, strict: bool
+) -> ErrorHandler | None:
+    """Handler for undecodable events: ``None`` (raise) when *strict*,
+    otherwise one that counts the event and reports it to *on_error*, or
+    logs it when there is no *on_error*."""
+    if strict:
+        return None
+
+    def skip(error: Exception) -> None:
+        if metrics is not None:
+            metrics.invalid_events += 1
+        if on_error is not None:
+            on_error(error)
+        else:
+            _logger.warning("Skipped undecodable event: %s", error)
+
+    return skip
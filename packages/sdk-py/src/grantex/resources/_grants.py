@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Iterator
 from typing import Any, List
 from urllib.parse import urlencode
 
 from .._errors import GrantexTokenError
 from .._http import HttpClient
-from .._types import Grant, ListGrantsParams, ListGrantsResponse, VerifiedGrant, DelegateParams
+from .._pagination import _DEFAULT_PAGE_SIZE, iter_pages, next_page
+from .._types import (
+    DelegateParams,
+    Grant,
+    ListGrantsParams,
+    ListGrantsResponse,
+    VerifiedGrant,
+)
 from .._verify import _build_payload, _payload_to_verified_grant
 
 
@@ -14,7 +23,7 @@ class GrantsClient:
         self._http = http
 
     def get(self, grant_id: str) -> Grant:
-        data = self._http.get(f"/v1/grants/{grant_id}")
+        data = self._http.get(f"/v1/grants/{grant_id}", hedge=True)
         return Grant.from_dict(data)
 
     def list(self, params: ListGrantsParams | None = None) -> ListGrantsResponse:
@@ -23,6 +32,32 @@ class GrantsClient:
         data = self._http.get(path)
         return ListGrantsResponse.from_dict(data)
 
+    def iter_grants(
+        self,
+        params: ListGrantsParams | None = None,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Grant]:
+        """Iterate over every grant matching *params*, page by page.
+
+        ``params.page`` (if set) is the first page fetched and
+        ``params.page_size`` overrides *page_size*. With *prefetch* the next
+        page is fetched in the background while the current one is consumed.
+
+        The API currently ignores ``page``/``pageSize`` here and returns
+        every match in one response, so a background fetch would only
+        download the same rows again; *prefetch* is therefore off by default.
+        """
+        base = params or ListGrantsParams()
+        size = base.page_size or page_size
+
+        def fetch(page: int) -> tuple[tuple[Grant, ...], int | None]:
+            grants = self.list(dataclasses.replace(base, page=page, page_size=size)).grants
+            return grants, next_page(page, len(grants), size)
+
+        return iter_pages(fetch, base.page or 1, prefetch=prefetch)
+
     def revoke(self, grant_id: str) -> None:
         self._http.delete(f"/v1/grants/{grant_id}")
 
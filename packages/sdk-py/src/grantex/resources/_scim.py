@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from .._http import HttpClient
+from .._pagination import _DEFAULT_PAGE_SIZE, iter_pages
 from .._types import (
     CreateScimUserParams,
     ListScimTokensResponse,
@@ -53,6 +55,26 @@ class ScimClient:
         data = self._http.get(path)
         return ScimListResponse.from_dict(data)
 
+    def iter_users(
+        self,
+        *,
+        count: int = _DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[ScimUser]:
+        """Iterate over every provisioned user, *count* users per request.
+
+        The next page is fetched in the background while the current one is
+        consumed unless *prefetch* is ``False``.
+        """
+
+        def fetch(start_index: int) -> tuple[tuple[ScimUser, ...], int | None]:
+            result = self.list_users(start_index=start_index, count=count)
+            next_index = start_index + len(result.resources)
+            more = bool(result.resources) and next_index <= result.total_results
+            return result.resources, next_index if more else None
+
+        return iter_pages(fetch, 1, prefetch=prefetch)
+
     def get_user(self, user_id: str) -> ScimUser:
         """Get a single provisioned user by ID."""
         data = self._http.get(f"/scim/v2/Users/{user_id}")
@@ -17,7 +17,7 @@ class TokensClient:
         return ExchangeTokenResponse.from_dict(data)
 
     def verify(self, token: str) -> VerifyTokenResponse:
-        data = self._http.post("/v1/tokens/verify", {"token": token})
+        data = self._http.post("/v1/tokens/verify", {"token": token}, hedge=True)
         return VerifyTokenResponse.from_dict(data)
 
     def revoke(self, token_id: str) -> None:
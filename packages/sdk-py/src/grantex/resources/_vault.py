@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
-
-import httpx
-
+from .._errors import GrantexApiError
 from .._http import HttpClient
 from .._types import (
     ExchangeCredentialParams,
@@ -17,9 +14,8 @@ from .._types import (
 
 
 class VaultClient:
-    def __init__(self, http: HttpClient, base_url: str) -> None:
+    def __init__(self, http: HttpClient) -> None:
         self._http = http
-        self._base_url = base_url.rstrip("/")
 
     def store(self, params: StoreCredentialParams) -> StoreCredentialResponse:
         """Store an encrypted credential in the vault (upserts on principal+service)."""
@@ -57,25 +53,14 @@ class VaultClient:
 
         Uses the grant token (not the API key) as the Bearer token.
         """
-        url = f"{self._base_url}/v1/vault/credentials/exchange"
-        response = httpx.post(
-            url,
-            json=params.to_dict(),
-            headers={
-                "Authorization": f"Bearer {grant_token}",
-                "Accept": "application/json",
-            },
-        )
-        if not response.is_success:
-            body: dict[str, Any] | None = None
-            try:
-                body = response.json()
-            except Exception:
-                pass
-            message = (
-                body["message"]
-                if isinstance(body, dict) and isinstance(body.get("message"), str)
-                else f"HTTP {response.status_code}"
+        # Per-request bearer override: same pooled connection and retry
+        # policy as every other call, authenticated by the grant token.
+        try:
+            data = self._http.post(
+                "/v1/vault/credentials/exchange",
+                params.to_dict(),
+                headers={"Authorization": f"Bearer {grant_token}"},
             )
-            raise ValueError(message)
-        return ExchangeCredentialResponse.from_dict(response.json())
+        except GrantexApiError as exc:
+            raise ValueError(str(exc)) from exc
+        return ExchangeCredentialResponse.from_dict(data)
@@ -0,0 +1,164 @@
+"""Tests for local audit hash-chain verification."""
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import httpx
+import pytest
+import respx
+
+from grantex import AuditEntry, Grantex, compute_audit_hash, verify_audit_chain
+
+BASE_URL = "https://api.grantex.dev"
+
+# Reference hashes produced by the auth service's hash.ts for _REFERENCE.
+_METADATA = {
+    "b": 1.5,
+    "a": [1, {"z": None, "y": "é"}],
+    "small": 0.00001,
+    "big": 1e21,
+    "\U0001F600": 1,
+    "￿": 2,
+}
+_CURRENT_HASH = "1148bf436a51f0de90731c3a44bdeb79630ed24840fb4456a1ef2b1f31bef219"
+_ERA_B_HASH = "20e8a2e7acbf8976c904c0541a58b5e538a0586679309477c09f7061123543f6"
+_ERA_A_HASH = "ab707030b15de65782a30853d21898331c7a5073b5929f1061e52aa3bbc25368"
+
+_REFERENCE = AuditEntry(
+    entry_id="audit_1",
+    agent_id="ag_1",
+    agent_did="did:grantex:ag_1",
+    grant_id="grnt_1",
+    principal_id="user_1",
+    developer_id="dev_1",
+    action="payment.initiated",
+    metadata=_METADATA,
+    hash=_CURRENT_HASH,
+    prev_hash=None,
+    timestamp="2026-01-01T00:00:00.000Z",
+    status="success",
+)
+
+
+def _chain(length: int) -> list[AuditEntry]:
+    entries: list[AuditEntry] = []
+    prev_hash: str | None = None
+    for i in range(length):
+        entry = AuditEntry(
+            entry_id=f"audit_{i}",
+            agent_id="ag_1",
+            agent_did="did:grantex:ag_1",
+            grant_id="grnt_1",
+            principal_id="user_1",
+            developer_id="dev_1",
+            action="email.send",
+            metadata={"seq": i, "to": "a@example.com"},
+            hash="",
+            prev_hash=prev_hash,
+            timestamp=f"2026-01-01T00:00:{i % 60:02d}.000Z",
+            status="success",
+        )
+        entry = dataclasses.replace(entry, hash=compute_audit_hash(entry))
+        entries.append(entry)
+        prev_hash = entry.hash
+    return entries
+
+
+def test_compute_audit_hash_matches_server() -> None:
+    assert compute_audit_hash(_REFERENCE) == _CURRENT_HASH
+
+
+@pytest.mark.parametrize("stored", [_CURRENT_HASH, _ERA_B_HASH, _ERA_A_HASH])
+def test_every_server_hash_layout_verifies(stored: str) -> None:
+    result = verify_audit_chain([dataclasses.replace(_REFERENCE, hash=stored)], workers=0)
+
+    assert result.valid is True
+    assert result.checked_entries == 1
+
+
+def test_intact_chain_is_valid() -> None:
+    result = verify_audit_chain(_chain(25), workers=0, chunk_size=4)
+
+    assert (result.valid, result.checked_entries, result.first_broken_at) == (True, 25, None)
+
+
+def test_tampered_content_is_reported() -> None:
+    entries = _chain(25)
+    entries[13] = dataclasses.replace(entries[13], status="failure")
+
+    result = verify_audit_chain(entries, workers=0, chunk_size=4)
+
+    assert (result.valid, result.checked_entries) == (False, 13)
+    assert (result.first_broken_at, result.reason) == ("audit_13", "content")
+
+
+def test_broken_link_is_reported() -> None:
+    entries = _chain(25)
+    del entries[9]
+
+    result = verify_audit_chain(entries, workers=0, chunk_size=4)
+
+    assert (result.checked_entries, result.first_broken_at, result.reason) == (
+        9,
+        "audit_10",
+        "link",
+    )
+
+
+def test_earliest_break_wins() -> None:
+    entries = _chain(25)
+    entries[5] = dataclasses.replace(entries[5], action="email.delete")
+    del entries[20]
+
+    result = verify_audit_chain(entries, workers=0, chunk_size=4)
+
+    assert (result.first_broken_at, result.reason) == ("audit_5", "content")
+
+
+def test_process_pool_finds_same_break() -> None:
+    entries = _chain(40)
+    entries[31] = dataclasses.replace(entries[31], metadata={"seq": 0})
+
+    result = verify_audit_chain(entries, workers=2, chunk_size=5)
+
+    assert (result.checked_entries, result.first_broken_at, result.reason) == (
+        31,
+        "audit_31",
+        "content",
+    )
+
+
+def test_developer_id_is_required() -> None:
+    with pytest.raises(ValueError, match="developer_id"):
+        verify_audit_chain([dataclasses.replace(_REFERENCE, developer_id=None)], workers=0)
+
+
+@respx.mock
+def test_verify_audit_export_streams_and_verifies() -> None:
+    rows = [
+        {
+            "entryId": e.entry_id,
+            "agentId": e.agent_id,
+            "agentDid": e.agent_did,
+            "grantId": e.grant_id,
+            "principalId": e.principal_id,
+            "developerId": e.developer_id,
+            "action": e.action,
+            "metadata": e.metadata,
+            "hash": e.hash,
+            "prevHash": e.prev_hash,
+            "timestamp": e.timestamp,
+            "status": e.status,
+        }
+        for e in _chain(6)
+    ]
+    doc = {"generatedAt": "2026-01-01T00:00:00Z", "total": 6, "entries": rows}
+    respx.get(f"{BASE_URL}/v1/compliance/export/audit").mock(
+        return_value=httpx.Response(200, content=json.dumps(doc).encode())
+    )
+
+    result = Grantex(api_key="test-key").compliance.verify_audit_export(workers=0)
+
+    assert result.valid is True
+    assert result.checked_entries == 6
@@ -0,0 +1,140 @@
+"""Tests for the local SQLite AuditMirror."""
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from grantex import (
+    AuditEntry,
+    AuditMirror,
+    Grantex,
+    GrantexNetworkError,
+    ListAuditParams,
+    compute_audit_hash,
+    verify_audit_chain,
+)
+from tests.conftest import MOCK_AUDIT_ENTRY
+
+BASE_URL = "https://api.grantex.dev"
+EXPORT_URL = f"{BASE_URL}/v1/compliance/export/audit"
+
+
+def _entry(i: int, **overrides: object) -> dict:
+    return {
+        **MOCK_AUDIT_ENTRY,
+        "entryId": f"audit_{i:03d}",
+        "developerId": "dev_01",
+        "agentId": "ag_a" if i % 2 == 0 else "ag_b",
+        "metadata": {"seq": i, "nested": {"z": 1, "a": 2}},
+        "timestamp": f"2026-01-01T00:00:{i:02d}.000Z",
+        **overrides,
+    }
+
+
+def _export(entries: list[dict]) -> httpx.Response:
+    doc = {"generatedAt": "2026-01-02T00:00:00Z", "total": len(entries), "entries": entries}
+    return httpx.Response(200, content=json.dumps(doc).encode())
+
+
+@pytest.fixture
+def mirror(tmp_path: Path) -> AuditMirror:
+    return Grantex(api_key="test-key").audit.mirror(tmp_path / "audit.db", batch_size=3)
+
+
+@respx.mock
+def test_sync_is_incremental_from_watermark(mirror: AuditMirror) -> None:
+    route = respx.get(EXPORT_URL).mock(
+        side_effect=[
+            _export([_entry(i) for i in range(5)]),
+            # The export's since filter is inclusive, so the newest entry repeats.
+            _export([_entry(i) for i in range(4, 8)]),
+        ]
+    )
+
+    assert mirror.watermark is None
+    assert mirror.sync() == 5
+    assert mirror.watermark == "2026-01-01T00:00:04.000Z"
+    assert "since" not in route.calls[0].request.url.params
+
+    assert mirror.sync() == 3
+    assert route.calls[1].request.url.params["since"] == "2026-01-01T00:00:04.000Z"
+    assert mirror.count() == 8
+    mirror.close()
+
+
+@respx.mock
+def test_queries_filter_and_page_locally(mirror: AuditMirror) -> None:
+    respx.get(EXPORT_URL).mock(return_value=_export([_entry(i) for i in range(10)]))
+    mirror.sync()
+
+    params = ListAuditParams(agent_id="ag_a", since="2026-01-01T00:00:03Z")
+    ids = [e.entry_id for e in mirror.entries(params)]
+    assert ids == ["audit_004", "audit_006", "audit_008"]
+    assert mirror.count(params) == 3
+
+    page = ListAuditParams(agent_id="ag_a", page=2, page_size=2)
+    assert [e.entry_id for e in mirror.entries(page)] == ["audit_004", "audit_006"]
+
+    entry = next(mirror.entries(ListAuditParams(action="payment.initiated")))
+    assert entry.metadata == {"seq": 0, "nested": {"z": 1, "a": 2}}
+    assert list(entry.metadata["nested"]) == ["z", "a"]
+    mirror.close()
+
+
+@respx.mock
+def test_failed_sync_keeps_committed_batches(mirror: AuditMirror) -> None:
+    body = json.dumps(
+        {"total": 7, "entries": [_entry(i) for i in range(7)]}
+    ).encode()
+    # The connection drops after the first four entries have arrived.
+    cut = body.index(b'{"entryId": "audit_004"')
+
+    def chunks() -> Iterator[bytes]:
+        yield body[:cut]
+        raise httpx.ReadError("connection reset")
+
+    respx.get(EXPORT_URL).mock(return_value=httpx.Response(200, content=chunks()))
+
+    with pytest.raises(GrantexNetworkError):
+        mirror.sync()
+
+    # Only whole batches (batch_size=3) were committed with their watermark.
+    assert mirror.count() == 3
+    assert mirror.watermark == "2026-01-01T00:00:02.000Z"
+    mirror.close()
+
+
+@respx.mock
+def test_mirror_feeds_chain_verification(tmp_path: Path) -> None:
+    rows: list[dict] = []
+    prev: str | None = None
+    for i in range(4):
+        row = _entry(i, prevHash=prev)
+        entry = AuditEntry.from_dict(row)
+        row["hash"] = compute_audit_hash(entry)
+        rows.append(row)
+        prev = row["hash"]
+    respx.get(EXPORT_URL).mock(return_value=_export(rows))
+
+    with Grantex(api_key="test-key").audit.mirror(tmp_path / "audit.db") as mirror:
+        mirror.sync()
+        result = verify_audit_chain(mirror.entries(), workers=0)
+
+    assert (result.valid, result.checked_entries) == (True, 4)
+
+
+def test_indexes_exist(mirror: AuditMirror) -> None:
+    names = {
+        row[0]
+        for row in mirror.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'audit_entries'"
+        )
+    }
+    for column in ("timestamp", "agent_id", "grant_id", "principal_id", "action"):
+        assert f"audit_entries_{column}" in names
+    mirror.close()
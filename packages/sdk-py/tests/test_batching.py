@@ -0,0 +1,189 @@
+"""Tests for the background BatchingAuditLogger."""
+from __future__ import annotations
+
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from grantex import BatchingAuditLogger, Grantex, GrantexApiError, LogAuditParams
+from tests.conftest import MOCK_AUDIT_ENTRY
+
+BASE_URL = "https://api.grantex.dev"
+
+_ENTRY = {
+    "agent_id": "ag_01",
+    "agent_did": "did:grantex:ag_01",
+    "grant_id": "grnt_01",
+    "principal_id": "user_01",
+    "action": "email.send",
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("grantex._http.time.sleep", lambda _: None)
+    monkeypatch.setattr("grantex._batching.time.sleep", lambda _: None)
+
+
+@pytest.fixture
+def client() -> Grantex:
+    return Grantex(api_key="test-key", max_retries=0)
+
+
+@respx.mock
+def test_entries_are_sent_in_order_on_flush(client: Grantex) -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        return_value=httpx.Response(201, json=MOCK_AUDIT_ENTRY)
+    )
+    logger = client.audit.batching(flush_interval=60.0)
+
+    for i in range(5):
+        assert logger.log(**{**_ENTRY, "action": f"action_{i}"}) is True
+    assert logger.flush(timeout=5.0)
+
+    actions = [json.loads(call.request.content)["action"] for call in route.calls]
+    assert actions == [f"action_{i}" for i in range(5)]
+    assert logger.sent == 5
+    assert logger.pending == 0
+    logger.close()
+
+
+@respx.mock
+def test_full_batch_triggers_send_without_flush(client: Grantex) -> None:
+    sent = threading.Event()
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 3:
+            sent.set()
+        return httpx.Response(201, json=MOCK_AUDIT_ENTRY)
+
+    respx.post(f"{BASE_URL}/v1/audit/log").mock(side_effect=handler)
+    logger = client.audit.batching(batch_size=3, flush_interval=60.0)
+
+    for _ in range(3):
+        logger.log(**_ENTRY)
+
+    assert sent.wait(timeout=5.0)
+    logger.close()
+
+
+@respx.mock
+def test_full_queue_drops_and_reports(client: Grantex) -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        return_value=httpx.Response(201, json=MOCK_AUDIT_ENTRY)
+    )
+    drops: list[tuple[LogAuditParams, Exception | None]] = []
+    # The worker waits for a full batch or the interval, so the queue fills up.
+    logger = BatchingAuditLogger(
+        client.audit, max_queue=2, flush_interval=60.0, on_drop=lambda p, e: drops.append((p, e))
+    )
+
+    results = [logger.log(**{**_ENTRY, "action": f"action_{i}"}) for i in range(4)]
+
+    assert results == [True, True, False, False]
+    assert logger.dropped == 2
+    assert [(p.action, e) for p, e in drops] == [("action_2", None), ("action_3", None)]
+    logger.close()
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_transient_errors_are_retried(client: Grantex) -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        side_effect=[
+            httpx.Response(429, json={"message": "slow down"}),
+            httpx.ConnectError("refused"),
+            httpx.Response(201, json=MOCK_AUDIT_ENTRY),
+        ]
+    )
+    logger = client.audit.batching(max_retries=3)
+
+    logger.log(**_ENTRY)
+    assert logger.flush(timeout=5.0)
+
+    assert route.call_count == 3
+    assert logger.sent == 1
+    assert logger.failed == 0
+    logger.close()
+
+
+@respx.mock
+def test_permanent_errors_are_reported_not_retried(client: Grantex) -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        return_value=httpx.Response(400, json={"message": "action is required"})
+    )
+    drops: list[Exception | None] = []
+    logger = client.audit.batching(on_drop=lambda _, e: drops.append(e))
+
+    logger.log(**_ENTRY)
+    assert logger.flush(timeout=5.0)
+
+    assert route.call_count == 1
+    assert logger.failed == 1
+    assert isinstance(drops[0], GrantexApiError)
+    logger.close()
+
+
+@respx.mock
+def test_close_flushes_and_rejects_new_entries(client: Grantex) -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        return_value=httpx.Response(201, json=MOCK_AUDIT_ENTRY)
+    )
+    with client.audit.batching(flush_interval=60.0) as logger:
+        logger.log(**_ENTRY)
+        logger.log(**_ENTRY)
+
+    assert route.call_count == 2
+    assert logger.log(**_ENTRY) is False
+    assert logger.dropped == 1
+
+
+def test_invalid_sizes_rejected(client: Grantex) -> None:
+    with pytest.raises(ValueError):
+        BatchingAuditLogger(client.audit, batch_size=0)
+
+
+@respx.mock
+def test_client_retries_do_not_stack_under_batch_retries() -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        return_value=httpx.Response(503, json={"message": "unavailable"})
+    )
+    client = Grantex(api_key="test-key", max_retries=3)
+    logger = client.audit.batching(max_retries=1)
+
+    logger.log(**_ENTRY)
+    assert logger.flush(timeout=5.0)
+
+    assert route.call_count == 2
+    assert logger.failed == 1
+    logger.close()
+
+
+@respx.mock
+def test_raising_on_drop_does_not_stop_the_worker(
+    client: Grantex, caplog: pytest.LogCaptureFixture
+) -> None:
+    route = respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        side_effect=[
+            httpx.Response(400, json={"message": "action is required"}),
+            httpx.Response(201, json=MOCK_AUDIT_ENTRY),
+        ]
+    )
+
+    def on_drop(params: LogAuditParams, error: Exception | None) -> None:
+        raise RuntimeError("alerting is down")
+
+    logger = client.audit.batching(flush_interval=60.0, on_drop=on_drop)
+    logger.log(**_ENTRY)
+    logger.log(**_ENTRY)
+
+    assert logger.flush(timeout=5.0)
+    assert route.call_count == 2
+    assert (logger.sent, logger.failed) == (1, 1)
+    assert "on_drop handler raised" in caplog.text
+    assert logger.close()
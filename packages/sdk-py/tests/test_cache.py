@@ -0,0 +1,196 @@
+"""Tests for the conditional-GET response cache."""
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from grantex import Grantex, ResponseCache
+from grantex._http import HttpClient
+
+MOCK_POLICIES = {
+    "policies": [
+        {
+            "id": "pol_01",
+            "name": "deny-weekends",
+            "effect": "deny",
+            "priority": 10,
+            "agentId": None,
+            "principalId": None,
+            "scopes": None,
+            "timeOfDayStart": None,
+            "timeOfDayEnd": None,
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-01T00:00:00Z",
+        }
+    ],
+    "total": 1,
+}
+
+
+@respx.mock
+def test_304_serves_cached_body() -> None:
+    route = respx.get("https://api.grantex.dev/v1/policies").mock(
+        side_effect=[
+            httpx.Response(200, json=MOCK_POLICIES, headers={"etag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+    client = Grantex(api_key="test-key", cache=ResponseCache())
+
+    first = client.policies.list()
+    second = client.policies.list()
+
+    assert first == second
+    assert second.policies[0].id == "pol_01"
+    assert "if-none-match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+
+
+@respx.mock
+def test_last_modified_sent_as_if_modified_since() -> None:
+    route = respx.get("https://api.grantex.dev/v1/webhooks").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"webhooks": []},
+                headers={"last-modified": "Wed, 01 Jan 2026 00:00:00 GMT"},
+            ),
+            httpx.Response(304),
+        ]
+    )
+    client = Grantex(api_key="test-key", cache=ResponseCache())
+
+    client.webhooks.list()
+    client.webhooks.list()
+
+    assert (
+        route.calls[1].request.headers["if-modified-since"]
+        == "Wed, 01 Jan 2026 00:00:00 GMT"
+    )
+
+
+@respx.mock
+def test_changed_resource_replaces_cached_body() -> None:
+    respx.get("https://api.grantex.dev/v1/agents").mock(
+        side_effect=[
+            httpx.Response(200, json={"agents": []}, headers={"etag": '"v1"'}),
+            httpx.Response(
+                200,
+                json={"agents": [], "total": 0},
+                headers={"etag": '"v2"'},
+            ),
+        ]
+    )
+    cache = ResponseCache()
+    client = HttpClient("https://api.grantex.dev", "test-key", cache=cache)
+
+    client.get("/v1/agents")
+    assert client.get("/v1/agents") == {"agents": [], "total": 0}
+    entry = cache.get("/v1/agents")
+    assert entry is not None
+    assert entry.etag == '"v2"'
+
+
+@respx.mock
+def test_responses_without_validators_are_not_stored() -> None:
+    respx.get("https://api.grantex.dev/v1/domains").mock(
+        return_value=httpx.Response(200, json={"domains": []})
+    )
+    cache = ResponseCache()
+    client = Grantex(api_key="test-key", cache=cache)
+
+    client.domains.list()
+
+    assert len(cache) == 0
+
+
+@respx.mock
+def test_calls_with_custom_headers_bypass_cache() -> None:
+    route = respx.get("https://api.grantex.dev/v1/agents").mock(
+        return_value=httpx.Response(200, json={"agents": []}, headers={"etag": '"v1"'})
+    )
+    cache = ResponseCache()
+    client = HttpClient("https://api.grantex.dev", "test-key", cache=cache)
+
+    client.get("/v1/agents", headers={"X-Trace": "1"})
+    client.get("/v1/agents", headers={"X-Trace": "1"})
+
+    assert len(cache) == 0
+    assert "if-none-match" not in route.calls[1].request.headers
+
+
+def test_path_ttls_use_longest_prefix() -> None:
+    cache = ResponseCache(ttl=300, path_ttls={"/v1": 60, "/v1/policies": 10})
+    assert cache.ttl_for("/v1/policies?page=2") == 10
+    assert cache.ttl_for("/v1/agents") == 60
+    assert cache.ttl_for("/.well-known/grantex-commerce") == 300
+
+
+def test_zero_ttl_disables_caching_for_prefix() -> None:
+    cache = ResponseCache(path_ttls={"/v1/domains": 0})
+    cache.store("/v1/domains", b"{}", etag='"v1"', last_modified=None)
+    assert cache.get("/v1/domains") is None
+
+
+def test_expired_entries_are_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("grantex._cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=30)
+    cache.store("/v1/agents", b"{}", etag='"v1"', last_modified=None)
+
+    now[0] += 29
+    assert cache.get("/v1/agents") is not None
+    now[0] += 2
+    assert cache.get("/v1/agents") is None
+    assert len(cache) == 0
+
+
+@respx.mock
+def test_304_restarts_the_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("grantex._cache.time.monotonic", lambda: now[0])
+    route = respx.get("https://api.grantex.dev/v1/agents").mock(
+        side_effect=[
+            httpx.Response(200, json={"agents": []}, headers={"etag": '"v1"'}),
+            httpx.Response(304),
+            httpx.Response(304),
+        ]
+    )
+    client = HttpClient("https://api.grantex.dev", "test-key", cache=ResponseCache(ttl=30))
+
+    client.get("/v1/agents")
+    now[0] += 20
+    client.get("/v1/agents")
+    now[0] += 20
+    assert client.get("/v1/agents") == {"agents": []}
+    assert route.calls[2].request.headers["if-none-match"] == '"v1"'
+
+
+def test_lru_eviction_is_bounded() -> None:
+    cache = ResponseCache(max_entries=2)
+    cache.store("/a", b"{}", etag='"a"', last_modified=None)
+    cache.store("/b", b"{}", etag='"b"', last_modified=None)
+    cache.get("/a")  # /a becomes most recently used
+    cache.store("/c", b"{}", etag='"c"', last_modified=None)
+
+    assert cache.get("/b") is None
+    assert cache.get("/a") is not None
+    assert cache.get("/c") is not None
+
+
+def test_invalidate_by_prefix() -> None:
+    cache = ResponseCache()
+    cache.store("/v1/policies", b"{}", etag='"a"', last_modified=None)
+    cache.store("/v1/policies/pol_01", b"{}", etag='"b"', last_modified=None)
+    cache.store("/v1/agents", b"{}", etag='"c"', last_modified=None)
+
+    cache.invalidate("/v1/policies")
+
+    assert len(cache) == 1
+    assert cache.get("/v1/agents") is not None
+
+
+def test_max_entries_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
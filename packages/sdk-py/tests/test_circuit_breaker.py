@@ -0,0 +1,189 @@
+"""Tests for the per-route circuit breaker."""
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from grantex import CircuitBreaker, Grantex, GrantexApiError, GrantexNetworkError
+from grantex._http import HttpClient, _route_template
+
+BASE_URL = "https://api.grantex.dev"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("grantex._http.time.sleep", lambda _s: None)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr("grantex._circuit.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_route_template_collapses_ids() -> None:
+    assert _route_template("/v1/grants/grant_01HXYZ") == "/v1/grants/:id"
+    assert _route_template("/v1/audit/entries?page=2") == "/v1/audit/entries"
+    assert _route_template("/scim/v2/Users/u-1") == "/scim/v2/Users/:id"
+    assert _route_template("/.well-known/grantex-commerce") == "/.well-known/grantex-commerce"
+
+
+def test_opens_after_consecutive_failures(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    breaker.record_failure("GET /x")
+    assert breaker.state("GET /x") == "closed"
+    breaker.record_failure("GET /x")
+    assert breaker.state("GET /x") == "open"
+    with pytest.raises(GrantexNetworkError, match="Circuit open for GET /x"):
+        breaker.before_request("GET /x")
+
+
+def test_success_resets_failure_count(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure("GET /x")
+    breaker.record_success("GET /x")
+    breaker.record_failure("GET /x")
+    assert breaker.state("GET /x") == "closed"
+
+
+def test_half_open_probe_closes_on_success(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure("GET /x")
+    clock[0] += 10
+    assert breaker.state("GET /x") == "half_open"
+
+    breaker.before_request("GET /x")  # the probe is admitted
+    with pytest.raises(GrantexNetworkError, match="probe already in flight"):
+        breaker.before_request("GET /x")
+
+    breaker.record_success("GET /x")
+    assert breaker.state("GET /x") == "closed"
+    breaker.before_request("GET /x")
+
+
+def test_half_open_probe_failure_reopens(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+    for _ in range(3):
+        breaker.record_failure("GET /x")
+    clock[0] += 10
+    breaker.before_request("GET /x")
+    breaker.record_failure("GET /x")
+    assert breaker.state("GET /x") == "open"
+    clock[0] += 5
+    with pytest.raises(GrantexNetworkError):
+        breaker.before_request("GET /x")
+
+
+def test_circuits_are_independent_per_key(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure("GET /v1/grants/:id")
+    breaker.before_request("POST /v1/grants/:id")
+    breaker.before_request("GET /v1/agents")
+
+
+def test_invalid_thresholds() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(half_open_max_calls=0)
+
+
+@respx.mock
+def test_open_circuit_cuts_retry_loop_short(clock: list[float]) -> None:
+    route = respx.get(f"{BASE_URL}/v1/grants/grant_01").mock(
+        return_value=httpx.Response(503, json={"message": "unavailable"})
+    )
+    breaker = CircuitBreaker(failure_threshold=2)
+    client = HttpClient(BASE_URL, "test-key", max_retries=5, circuit_breaker=breaker)
+
+    with pytest.raises(GrantexNetworkError, match="Circuit open"):
+        client.get("/v1/grants/grant_01")
+    assert route.call_count == 2
+
+    # Further calls to any grant fail without touching the network
+    with pytest.raises(GrantexNetworkError):
+        client.get("/v1/grants/grant_02")
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_network_errors_count_as_failures(clock: list[float]) -> None:
+    respx.get(f"{BASE_URL}/v1/agents").mock(side_effect=httpx.ConnectError("refused"))
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, circuit_breaker=breaker)
+
+    with pytest.raises(GrantexNetworkError, match="Network error"):
+        client.get("/v1/agents")
+    assert breaker.state("GET /v1/agents") == "open"
+
+
+@respx.mock
+def test_client_errors_do_not_trip_the_breaker(clock: list[float]) -> None:
+    respx.get(f"{BASE_URL}/v1/agents/missing").mock(
+        return_value=httpx.Response(404, json={"message": "not found"})
+    )
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = Grantex(api_key="test-key", max_retries=0, circuit_breaker=breaker)
+
+    for _ in range(3):
+        with pytest.raises(GrantexApiError):
+            client.agents.get("missing")
+    assert breaker.state("GET /v1/agents/:id") == "closed"
+
+
+@respx.mock
+def test_probe_recovers_the_route(clock: list[float]) -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(
+        side_effect=[
+            httpx.Response(502),
+            httpx.Response(200, json={"agents": []}),
+        ]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, circuit_breaker=breaker)
+
+    with pytest.raises(GrantexApiError):
+        client.get("/v1/agents")
+    with pytest.raises(GrantexNetworkError):
+        client.get("/v1/agents")
+
+    clock[0] += 5
+    assert client.get("/v1/agents") == {"agents": []}
+    assert breaker.state("GET /v1/agents") == "closed"
+    assert route.call_count == 2
+
+
+def test_release_returns_an_abandoned_probe(clock: list[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    breaker.record_failure("GET /x")
+    clock[0] += 5
+    breaker.before_request("GET /x")
+    with pytest.raises(GrantexNetworkError, match="probe already in flight"):
+        breaker.before_request("GET /x")
+    breaker.release("GET /x")
+    breaker.before_request("GET /x")
+    assert breaker.state("GET /x") == "half_open"
+
+
+@respx.mock
+def test_unexpected_error_does_not_wedge_the_probe(clock: list[float]) -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(
+        side_effect=[
+            httpx.Response(503),
+            RuntimeError("interrupted"),
+            httpx.Response(200, json={"agents": []}),
+        ]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, circuit_breaker=breaker)
+
+    with pytest.raises(GrantexApiError):
+        client.get("/v1/agents")
+    clock[0] += 5
+    with pytest.raises(RuntimeError):
+        client.get("/v1/agents")
+    assert client.get("/v1/agents") == {"agents": []}
+    assert breaker.state("GET /v1/agents") == "closed"
+    assert route.call_count == 3
@@ -0,0 +1,112 @@
+"""Tests for the pluggable JSON codec."""
+from __future__ import annotations
+
+import json
+import sys
+
+import httpx
+import pytest
+import respx
+
+from grantex import GrantexApiError, JsonCodec, get_json_codec
+from grantex._http import HttpClient
+
+
+def test_stdlib_codec_matches_httpx_wire_format() -> None:
+    codec = get_json_codec("stdlib")
+    assert codec.dumps({"name": "café", "n": [1, 2]}) == '{"name":"café","n":[1,2]}'.encode()
+    assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_stdlib_codec_rejects_nan() -> None:
+    with pytest.raises(ValueError):
+        get_json_codec("stdlib").dumps({"x": float("nan")})
+
+
+def test_orjson_codec_round_trips() -> None:
+    pytest.importorskip("orjson")
+    codec = get_json_codec("orjson")
+    assert codec.name == "orjson"
+    assert codec.loads(codec.dumps({"a": "ü", 1: True})) == {"a": "ü", "1": True}
+
+
+def test_auto_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert get_json_codec("auto").name == "stdlib"
+
+
+def test_auto_prefers_orjson() -> None:
+    pytest.importorskip("orjson")
+    assert get_json_codec().name == "orjson"
+
+
+def test_unknown_codec_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_json_codec("yaml")
+
+
+def test_missing_backend_raises_import_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    with pytest.raises(ImportError):
+        get_json_codec("msgspec")
+
+
+def _recording_codec(calls: list[str]) -> JsonCodec:
+    def dumps(obj: object) -> bytes:
+        calls.append("dumps")
+        return json.dumps(obj).encode()
+
+    def loads(data: bytes | str) -> object:
+        calls.append("loads")
+        return json.loads(data)
+
+    return JsonCodec("recording", dumps=dumps, loads=loads)
+
+
+@respx.mock
+def test_client_uses_codec_for_request_and_response() -> None:
+    route = respx.post("https://api.grantex.dev/v1/policies").mock(
+        return_value=httpx.Response(201, json={"id": "pol_01"})
+    )
+    calls: list[str] = []
+    client = HttpClient("https://api.grantex.dev", "test-key", json_codec=_recording_codec(calls))
+
+    result = client.post("/v1/policies", {"name": "p"}, headers={"Idempotency-Key": "k1"})
+
+    assert result == {"id": "pol_01"}
+    assert calls == ["dumps", "loads"]
+    request = route.calls[0].request
+    assert json.loads(request.content) == {"name": "p"}
+    assert request.headers["content-type"] == "application/json"
+    assert request.headers["idempotency-key"] == "k1"
+
+
+@respx.mock
+def test_client_uses_codec_for_error_bodies() -> None:
+    respx.get("https://api.grantex.dev/v1/agents/a1").mock(
+        return_value=httpx.Response(404, json={"message": "Agent not found", "code": "NOT_FOUND"})
+    )
+    calls: list[str] = []
+    client = HttpClient(
+        "https://api.grantex.dev", "test-key", max_retries=0, json_codec=_recording_codec(calls)
+    )
+
+    with pytest.raises(GrantexApiError) as exc_info:
+        client.get("/v1/agents/a1")
+
+    assert exc_info.value.code == "NOT_FOUND"
+    assert calls == ["loads"]
+
+
+@respx.mock
+def test_non_json_error_body_falls_back_to_text() -> None:
+    respx.get("https://api.grantex.dev/v1/agents").mock(
+        return_value=httpx.Response(500, text="upstream exploded")
+    )
+    client = HttpClient("https://api.grantex.dev", "test-key", max_retries=0)
+
+    with pytest.raises(GrantexApiError) as exc_info:
+        client.get("/v1/agents")
+
+    assert exc_info.value.body == "upstream exploded"
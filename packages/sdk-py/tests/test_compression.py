@@ -0,0 +1,142 @@
+"""Tests for opt-in request-body compression."""
+from __future__ import annotations
+
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+
+from grantex import Grantex, GrantexApiError, RequestCompression
+from grantex._http import HttpClient
+
+BASE_URL = "https://api.grantex.dev"
+
+_LARGE_BODY = {"products": [{"sku": f"sku_{i}", "name": "Widget"} for i in range(200)]}
+
+
+@respx.mock
+def test_large_body_is_gzipped() -> None:
+    route = respx.post(f"{BASE_URL}/v1/commerce/catalog/products/bulk").mock(
+        return_value=httpx.Response(200, json={"upserted": 200})
+    )
+    client = Grantex(api_key="test-key", compression=RequestCompression(threshold=512))
+
+    assert client.commerce.bulk_upsert_catalog_products(_LARGE_BODY) == {"upserted": 200}
+
+    request = route.calls[0].request
+    assert request.headers["content-encoding"] == "gzip"
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(gzip.decompress(request.content)) == _LARGE_BODY
+    client.close()
+
+
+@respx.mock
+def test_small_body_is_sent_uncompressed() -> None:
+    route = respx.post(f"{BASE_URL}/v1/agents").mock(
+        return_value=httpx.Response(201, json={"agentId": "ag_1"})
+    )
+    client = HttpClient(BASE_URL, "test-key", compression=RequestCompression(threshold=1024))
+
+    client.post("/v1/agents", {"name": "tiny"})
+
+    request = route.calls[0].request
+    assert "content-encoding" not in request.headers
+    assert json.loads(request.content) == {"name": "tiny"}
+    client.close()
+
+
+@respx.mock
+def test_415_falls_back_to_identity_and_disables_compression() -> None:
+    route = respx.post(f"{BASE_URL}/v1/commerce/catalog/products/bulk").mock(
+        side_effect=[
+            httpx.Response(415, json={"message": "Unsupported Media Type"}),
+            httpx.Response(200, json={"upserted": 200}),
+            httpx.Response(200, json={"upserted": 200}),
+        ]
+    )
+    compression = RequestCompression(threshold=0)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, compression=compression)
+
+    assert client.post("/v1/commerce/catalog/products/bulk", _LARGE_BODY) == {"upserted": 200}
+    assert compression.enabled is False
+    client.post("/v1/commerce/catalog/products/bulk", _LARGE_BODY)
+
+    first, retry, later = (call.request for call in route.calls)
+    assert first.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in retry.headers
+    assert json.loads(retry.content) == _LARGE_BODY
+    assert "content-encoding" not in later.headers
+    client.close()
+
+
+@respx.mock
+def test_400_for_compressed_body_falls_back_to_identity() -> None:
+    # A server without body decompression fails to parse the gzip bytes.
+    route = respx.post(f"{BASE_URL}/v1/commerce/catalog/products/bulk").mock(
+        side_effect=[
+            httpx.Response(400, json={"message": "Unexpected token", "code": "BAD_REQUEST"}),
+            httpx.Response(200, json={"upserted": 200}),
+        ]
+    )
+    compression = RequestCompression(threshold=0)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, compression=compression)
+
+    assert client.post("/v1/commerce/catalog/products/bulk", _LARGE_BODY) == {"upserted": 200}
+
+    first, retry = (call.request for call in route.calls)
+    assert first.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in retry.headers
+    assert compression.enabled is False
+    client.close()
+
+
+@respx.mock
+def test_400_for_both_encodings_is_raised_and_keeps_compression() -> None:
+    route = respx.post(f"{BASE_URL}/v1/commerce/catalog/products/bulk").mock(
+        return_value=httpx.Response(400, json={"message": "sku is required"})
+    )
+    compression = RequestCompression(threshold=0)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, compression=compression)
+
+    with pytest.raises(GrantexApiError) as exc_info:
+        client.post("/v1/commerce/catalog/products/bulk", _LARGE_BODY)
+
+    assert exc_info.value.status_code == 400
+    assert route.call_count == 2
+    assert compression.enabled is True
+    client.close()
+
+
+@respx.mock
+def test_get_requests_advertise_accept_encoding() -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(
+        return_value=httpx.Response(200, json={"agents": []})
+    )
+    client = HttpClient(BASE_URL, "test-key", compression=RequestCompression())
+
+    client.get("/v1/agents")
+
+    accepted = route.calls[0].request.headers["accept-encoding"].split(", ")
+    assert accepted[:2] == ["gzip", "deflate"]
+    client.close()
+
+
+def test_gzip_output_is_deterministic() -> None:
+    compression = RequestCompression(threshold=0)
+    payload = b'{"entries": []}' * 100
+    assert compression.compress(payload) == compression.compress(payload)
+
+
+def test_unknown_encoding_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        RequestCompression("br")
+
+
+def test_zstd_requires_zstandard(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ImportError, match="zstandard"):
+        RequestCompression("zstd")
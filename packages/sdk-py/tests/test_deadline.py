@@ -0,0 +1,152 @@
+"""Tests for total-deadline budgets across retries."""
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from grantex import CircuitBreaker, Grantex, GrantexApiError, GrantexNetworkError
+from grantex._http import HttpClient
+from tests.conftest import MOCK_GRANT
+
+BASE_URL = "https://api.grantex.dev"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr("grantex._http.time.monotonic", fake.monotonic)
+    monkeypatch.setattr("grantex._http.time.sleep", fake.sleep)
+    return fake
+
+
+@respx.mock
+def test_retry_skipped_when_backoff_exceeds_budget(clock: FakeClock) -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(
+        return_value=httpx.Response(503, headers={"retry-after": "5"}, json={"message": "busy"})
+    )
+    client = HttpClient(BASE_URL, "test-key", max_retries=3)
+
+    with pytest.raises(GrantexApiError) as excinfo:
+        client.get("/v1/agents", deadline=2.0)
+
+    assert excinfo.value.status_code == 503
+    assert route.call_count == 1
+    assert clock.sleeps == []
+    client.close()
+
+
+@respx.mock
+def test_retries_continue_while_budget_allows(clock: FakeClock) -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(
+        side_effect=[
+            httpx.Response(503, headers={"retry-after": "1"}),
+            httpx.Response(503, headers={"retry-after": "1"}),
+            httpx.Response(200, json={"agents": []}),
+        ]
+    )
+    client = HttpClient(BASE_URL, "test-key", max_retries=3, deadline=2.5)
+
+    assert client.get("/v1/agents") == {"agents": []}
+    assert route.call_count == 3
+    assert clock.sleeps == [1.0, 1.0]
+    client.close()
+
+
+@respx.mock
+def test_attempt_timeout_is_capped_by_remaining_budget(clock: FakeClock) -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(return_value=httpx.Response(200, json={}))
+    client = HttpClient(BASE_URL, "test-key", timeout=30.0)
+
+    client.get("/v1/agents", deadline=1.5)
+
+    timeout = route.calls.last.request.extensions["timeout"]
+    assert timeout["read"] == pytest.approx(1.5)
+    client.close()
+
+
+@respx.mock
+def test_scoped_deadline_is_shared_across_calls(clock: FakeClock) -> None:
+    def slow(request: httpx.Request) -> httpx.Response:
+        clock.now += 0.6
+        return httpx.Response(200, json=MOCK_GRANT)
+
+    route = respx.get(f"{BASE_URL}/v1/grants/grant_01HXYZ").mock(side_effect=slow)
+    client = Grantex(api_key="test-key")
+
+    with client.deadline(1.0):
+        client.grants.get("grant_01HXYZ")
+        client.grants.get("grant_01HXYZ")
+        with pytest.raises(GrantexNetworkError, match="Deadline exceeded"):
+            client.grants.get("grant_01HXYZ")
+
+    assert route.call_count == 2
+    client.grants.get("grant_01HXYZ")
+    assert route.call_count == 3
+    client.close()
+
+
+def test_nested_deadline_only_shortens(clock: FakeClock) -> None:
+    from grantex._http import _scoped_deadline
+
+    client = HttpClient(BASE_URL, "test-key")
+    with client.deadline(1.0):
+        with client.deadline(5.0):
+            assert _scoped_deadline.get() == clock.now + 1.0
+        with client.deadline(0.5):
+            assert _scoped_deadline.get() == clock.now + 0.5
+    assert _scoped_deadline.get() is None
+    client.close()
+
+
+@respx.mock
+def test_expired_deadline_does_not_take_the_half_open_probe(
+    clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("grantex._circuit.time.monotonic", clock.monotonic)
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200, json={"agents": []})]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, circuit_breaker=breaker)
+
+    with pytest.raises(GrantexApiError):
+        client.get("/v1/agents")
+    clock.now += 0.1
+    with client.deadline(0), pytest.raises(GrantexNetworkError, match="Deadline exceeded"):
+        client.get("/v1/agents")
+
+    assert client.get("/v1/agents") == {"agents": []}
+    assert breaker.state("GET /v1/agents") == "closed"
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_stream_respects_the_deadline(clock: FakeClock) -> None:
+    route = respx.get(f"{BASE_URL}/v1/compliance/export/audit").mock(
+        return_value=httpx.Response(503, headers={"retry-after": "5"}, json={"message": "busy"})
+    )
+    client = HttpClient(BASE_URL, "test-key", max_retries=3)
+
+    with pytest.raises(GrantexApiError) as excinfo, client.stream(
+        "/v1/compliance/export/audit", deadline=2.0
+    ):
+        pass
+
+    assert excinfo.value.status_code == 503
+    assert route.call_count == 1
+    assert clock.sleeps == []
+    client.close()
@@ -0,0 +1,236 @@
+"""Tests for EventDispatcher."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from grantex import EventDispatcher, GrantexStreamEvent
+from grantex.resources._events import EventsClient
+
+BASE_URL = "https://api.grantex.dev"
+
+
+def _event(i: int, type_: str = "grant.revoked") -> GrantexStreamEvent:
+    return GrantexStreamEvent(
+        id=f"evt_{i}", type=type_, created_at="2026-01-01T00:00:00Z", data={"n": i}
+    )
+
+
+@pytest.fixture
+def events() -> EventsClient:
+    return EventsClient(BASE_URL, "test-key")
+
+
+class _Gate:
+    """Handler that blocks until released, recording what it saw."""
+
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, event: GrantexStreamEvent) -> None:
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        self.seen.append(event.id)
+
+
+def test_routes_by_type_and_wildcard(events: EventsClient) -> None:
+    revoked: list[str] = []
+    everything: list[str] = []
+    errors: list[tuple[Exception, str]] = []
+    dispatcher = EventDispatcher(
+        events, workers=3, on_error=lambda exc, e: errors.append((exc, e.id))
+    )
+    dispatcher.on("grant.revoked", lambda e: revoked.append(e.id))
+    dispatcher.on("*")(lambda e: everything.append(e.id))
+
+    @dispatcher.on("token.issued")
+    def broken(event: GrantexStreamEvent) -> None:
+        raise RuntimeError("boom")
+
+    dispatcher.dispatch(_event(1))
+    dispatcher.dispatch(_event(2, "token.issued"))
+    dispatcher.dispatch(_event(3, "budget.threshold"))
+    assert dispatcher.flush(timeout=5)
+
+    assert revoked == ["evt_1"]
+    assert sorted(everything) == ["evt_1", "evt_2", "evt_3"]
+    assert [(str(exc), eid) for exc, eid in errors] == [("boom", "evt_2")]
+    assert (dispatcher.dispatched, dispatcher.failed) == (3, 1)
+    assert dispatcher.stop()
+
+
+def test_block_policy_holds_the_reader(events: EventsClient) -> None:
+    gate = _Gate()
+    dispatcher = EventDispatcher(events, workers=1, max_queue=1, overflow="block")
+    dispatcher.on("*", gate)
+
+    dispatcher.dispatch(_event(0))
+    assert gate.started.wait(timeout=5)
+    dispatcher.dispatch(_event(1))  # fills the queue
+
+    reader = threading.Thread(target=dispatcher.dispatch, args=(_event(2),))
+    reader.start()
+    reader.join(timeout=0.2)
+    assert reader.is_alive()
+
+    gate.release.set()
+    reader.join(timeout=5)
+    assert dispatcher.flush(timeout=5)
+    assert gate.seen == ["evt_0", "evt_1", "evt_2"]
+    assert dispatcher.dropped == 0
+    dispatcher.stop()
+
+
+def test_drop_oldest_policy(events: EventsClient) -> None:
+    gate = _Gate()
+    dropped: list[str] = []
+    dispatcher = EventDispatcher(
+        events,
+        workers=1,
+        max_queue=2,
+        overflow="drop_oldest",
+        on_drop=lambda e: dropped.append(e.id),
+    )
+    dispatcher.on("*", gate)
+
+    dispatcher.dispatch(_event(0))
+    assert gate.started.wait(timeout=5)
+    for i in range(1, 5):
+        assert dispatcher.dispatch(_event(i)) is True
+
+    gate.release.set()
+    assert dispatcher.flush(timeout=5)
+    assert gate.seen == ["evt_0", "evt_3", "evt_4"]
+    assert dropped == ["evt_1", "evt_2"]
+    assert dispatcher.dropped == 2
+    dispatcher.stop()
+
+
+def test_spill_policy_preserves_order(events: EventsClient, tmp_path: Path) -> None:
+    gate = _Gate()
+    dispatcher = EventDispatcher(
+        events, workers=1, max_queue=2, overflow="spill", spill_dir=tmp_path
+    )
+    dispatcher.on("*", gate)
+
+    dispatcher.dispatch(_event(0))
+    assert gate.started.wait(timeout=5)
+    for i in range(1, 10):
+        dispatcher.dispatch(_event(i))
+
+    assert dispatcher.spilled == 7
+    assert dispatcher.pending == 10
+    spill_files = list(tmp_path.iterdir())
+    assert len(spill_files) == 1
+    assert json.loads(spill_files[0].read_bytes().splitlines()[0])["id"] == "evt_3"
+
+    gate.release.set()
+    assert dispatcher.flush(timeout=5)
+    assert gate.seen == [f"evt_{i}" for i in range(10)]
+    assert dispatcher.stop()
+    assert os.listdir(tmp_path) == []
+
+
+@respx.mock
+def test_start_subscribes_to_registered_types(events: EventsClient) -> None:
+    body = b"".join(
+        b"data: "
+        + json.dumps(
+            {"id": f"evt_{i}", "type": "grant.revoked", "createdAt": "2026-01-01T00:00:00Z"}
+        ).encode()
+        + b"\n\n"
+        for i in range(3)
+    )
+    route = respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    seen: list[str] = []
+    done = threading.Event()
+
+    def handler(event: GrantexStreamEvent) -> None:
+        seen.append(event.id)
+        if len(seen) == 3:
+            done.set()
+
+    dispatcher = EventDispatcher(events, workers=1, reconnect=None)
+    dispatcher.on("grant.revoked", handler)
+    dispatcher.on("token.issued", lambda e: None)
+
+    with dispatcher.start():
+        assert done.wait(timeout=5)
+
+    assert seen == ["evt_0", "evt_1", "evt_2"]
+    assert route.calls.last.request.url.params["types"] == "grant.revoked,token.issued"
+
+
+def test_raising_on_error_does_not_stop_the_workers(
+    events: EventsClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    def on_error(exc: Exception, event: GrantexStreamEvent) -> None:
+        raise RuntimeError("alerting is down")
+
+    dispatcher = EventDispatcher(events, workers=1, on_error=on_error)
+
+    @dispatcher.on("*")
+    def broken(event: GrantexStreamEvent) -> None:
+        raise RuntimeError("boom")
+
+    dispatcher.dispatch(_event(1))
+    dispatcher.dispatch(_event(2))
+    assert dispatcher.flush(timeout=5)
+
+    assert (dispatcher.dispatched, dispatcher.failed) == (2, 2)
+    assert "on_error handler raised" in caplog.text
+    assert dispatcher.stop()
+
+
+@respx.mock
+def test_stream_errors_are_counted(events: EventsClient) -> None:
+    respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        return_value=httpx.Response(400, json={"message": "bad types"})
+    )
+    dispatcher = EventDispatcher(events, workers=1, reconnect=None)
+    dispatcher.on("grant.revoked", lambda e: None)
+
+    with dispatcher.start():
+        subscription = dispatcher.subscription
+        assert subscription is not None
+        deadline = time.monotonic() + 5
+        while subscription.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert dispatcher.failed == 1
+
+
+@respx.mock
+def test_undecodable_events_are_counted_without_reconnect(events: EventsClient) -> None:
+    respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        return_value=httpx.Response(200, content=b"data: not json\n\n")
+    )
+    dispatcher = EventDispatcher(events, workers=1, reconnect=None)
+    dispatcher.on("grant.revoked", lambda e: None)
+
+    with dispatcher.start():
+        subscription = dispatcher.subscription
+        assert subscription is not None
+        deadline = time.monotonic() + 5
+        while subscription.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert dispatcher.failed == 1
+
+
+def test_invalid_configuration(events: EventsClient) -> None:
+    with pytest.raises(ValueError):
+        EventDispatcher(events, overflow="discard")
+    with pytest.raises(ValueError):
+        EventDispatcher(events, workers=0)
@@ -100,7 +100,7 @@ class TestSubscribe:
         with patch.object(client, "stream", return_value=iter(events)) as mock_stream:
             sub = client.subscribe(lambda e: None, options=opts)
             sub._thread.join(timeout=2)
-            mock_stream.assert_called_once_with(opts)
+            mock_stream.assert_called_once_with(opts, on_error=None)
 
     def test_unsubscribe_stops_stream(self):
         """unsubscribe() should stop processing events mid-stream."""
@@ -134,7 +134,7 @@ class TestSubscribe:
         client = EventsClient("https://api.grantex.dev", "test-key")
         error_holder: list[Exception] = []
 
-        def failing_stream(options=None):
+        def failing_stream(options=None, on_error=None):
             raise ConnectionError("SSE connection lost")
 
         with patch.object(client, "stream", side_effect=failing_stream):
@@ -152,7 +152,7 @@ class TestSubscribe:
         """When stream() raises and no on_error is given, the error is silently swallowed."""
         client = EventsClient("https://api.grantex.dev", "test-key")
 
-        def failing_stream(options=None):
+        def failing_stream(options=None, on_error=None):
             raise RuntimeError("boom")
 
         with patch.object(client, "stream", side_effect=failing_stream):
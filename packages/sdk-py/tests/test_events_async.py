@@ -0,0 +1,95 @@
+"""Tests for EventsClient.astream."""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import respx
+
+from grantex import GrantexEventError, ReconnectPolicy, StreamMetrics, StreamOptions
+from grantex.resources._events import EventsClient, GrantexEvent
+
+BASE_URL = "https://api.grantex.dev"
+STREAM_URL = f"{BASE_URL}/v1/events/stream"
+
+
+def _sse(i: int) -> bytes:
+    body = {"id": f"evt_{i}", "type": "token.issued", "createdAt": "2026-01-01T00:00:00Z"}
+    return b"data: " + json.dumps(body).encode() + b"\r\n\r\n"
+
+
+async def _take(events: AsyncIterator[GrantexEvent], count: int) -> list[str]:
+    ids: list[str] = []
+    async for event in events:
+        ids.append(event.id)
+        if len(ids) == count:
+            break
+    return ids
+
+
+@respx.mock
+def test_astream_yields_events() -> None:
+    payload = _sse(1) + b": keepalive\r\n\r\n" + _sse(2)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for i in range(0, len(payload), 7):
+            yield payload[i:i + 7]
+
+    route = respx.get(STREAM_URL).mock(return_value=httpx.Response(200, content=chunks()))
+    client = EventsClient(BASE_URL, "test-key")
+
+    async def main() -> list[str]:
+        return [e.id async for e in client.astream(StreamOptions(types=["token.issued"]))]
+
+    assert asyncio.run(main()) == ["evt_1", "evt_2"]
+    request = route.calls.last.request
+    assert request.url.params["types"] == "token.issued"
+    assert request.headers["authorization"] == "Bearer test-key"
+
+
+@respx.mock
+def test_astream_reconnects_with_shared_client() -> None:
+    route = respx.get(STREAM_URL).mock(
+        side_effect=[
+            httpx.Response(200, content=_sse(1)),
+            httpx.ReadTimeout("idle"),
+            httpx.Response(200, content=_sse(2)),
+        ]
+    )
+    metrics = StreamMetrics()
+    client = EventsClient(BASE_URL, "test-key")
+
+    async def main() -> list[str]:
+        async with httpx.AsyncClient() as http:
+            events = client.astream(
+                reconnect=ReconnectPolicy(initial_delay=0.0),
+                metrics=metrics,
+                http_client=http,
+            )
+            return await _take(events, 2)
+
+    assert asyncio.run(main()) == ["evt_1", "evt_2"]
+    assert route.calls[2].request.headers["last-event-id"] == "evt_1"
+    assert (metrics.connects, metrics.reconnects, metrics.failed_attempts) == (2, 1, 2)
+
+
+@respx.mock
+def test_astream_invalid_payload() -> None:
+    respx.get(STREAM_URL).mock(
+        side_effect=lambda _: httpx.Response(200, content=b"data: [1]\n\n" + _sse(1))
+    )
+    client = EventsClient(BASE_URL, "test-key")
+
+    async def collect(**kwargs: object) -> list[str]:
+        return [e.id async for e in client.astream(**kwargs)]  # type: ignore[arg-type]
+
+    assert asyncio.run(collect()) == ["evt_1"]
+    with pytest.raises(GrantexEventError):
+        asyncio.run(collect(strict=True))
+
+    errors: list[Exception] = []
+    assert asyncio.run(collect(on_error=errors.append)) == ["evt_1"]
+    assert len(errors) == 1
@@ -0,0 +1,111 @@
+"""Tests for reconnecting event streams."""
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from grantex import GrantexStreamEvent, ReconnectPolicy, StreamMetrics
+from grantex.resources._events import EventsClient, _reconnect_delay
+
+BASE_URL = "https://api.grantex.dev"
+STREAM_URL = f"{BASE_URL}/v1/events/stream"
+FAST = ReconnectPolicy(initial_delay=0.0, jitter=0.0)
+
+
+def _sse(i: int, *, sse_id: str | None = None) -> bytes:
+    body = {"id": f"evt_{i}", "type": "grant.revoked", "createdAt": "2026-01-01T00:00:00Z"}
+    head = f"id: {sse_id}\n".encode() if sse_id else b""
+    return head + b"data: " + json.dumps(body).encode() + b"\n\n"
+
+
+@respx.mock
+def test_reconnects_with_last_event_id() -> None:
+    route = respx.get(STREAM_URL).mock(
+        side_effect=[
+            httpx.Response(200, content=_sse(1, sse_id="41") + _sse(2, sse_id="42")),
+            httpx.ConnectError("refused"),
+            httpx.Response(503),
+            httpx.Response(200, content=_sse(3)),
+        ]
+    )
+    metrics = StreamMetrics()
+    client = EventsClient(BASE_URL, "test-key")
+
+    events = client.stream(reconnect=FAST, metrics=metrics)
+    ids = [e.id for e in itertools.islice(events, 3)]
+
+    assert ids == ["evt_1", "evt_2", "evt_3"]
+    assert "last-event-id" not in route.calls[0].request.headers
+    assert [c.request.headers["last-event-id"] for c in route.calls[1:]] == ["42"] * 3
+    assert (metrics.connects, metrics.reconnects, metrics.failed_attempts) == (2, 1, 3)
+    assert metrics.events == 3
+    # The server sent no SSE id for evt_3, so the event's own id is kept.
+    assert metrics.last_event_id == "evt_3"
+
+
+@respx.mock
+def test_fatal_status_is_raised() -> None:
+    respx.get(STREAM_URL).mock(return_value=httpx.Response(401))
+    client = EventsClient(BASE_URL, "test-key")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        next(client.stream(reconnect=FAST))
+
+
+@respx.mock
+def test_max_attempts_raises_last_error() -> None:
+    route = respx.get(STREAM_URL).mock(side_effect=httpx.ConnectError("refused"))
+    client = EventsClient(BASE_URL, "test-key")
+    policy = ReconnectPolicy(initial_delay=0.0, max_attempts=2)
+
+    with pytest.raises(httpx.ConnectError):
+        next(client.stream(reconnect=policy))
+    assert route.call_count == 3
+
+
+def test_delay_backoff_jitter_and_retry_hint() -> None:
+    policy = ReconnectPolicy(initial_delay=1.0, max_delay=10.0, jitter=0.0)
+
+    assert [_reconnect_delay(policy, None, n) for n in (1, 2, 3, 5)] == [1.0, 2.0, 4.0, 10.0]
+    assert _reconnect_delay(policy, 0.25, 1) == 0.25
+
+    jittered = ReconnectPolicy(initial_delay=1.0, jitter=0.5)
+    for _ in range(50):
+        assert 0.5 <= _reconnect_delay(jittered, None, 1) <= 1.5
+
+
+@respx.mock
+def test_subscription_reconnects_and_skips_bad_events() -> None:
+    respx.get(STREAM_URL).mock(
+        side_effect=[
+            httpx.Response(200, content=b"retry: 1\n" + _sse(1) + b"data: nope\n\n"),
+            httpx.Response(200, content=_sse(2)),
+            httpx.Response(200, content=b""),
+        ]
+        + [httpx.Response(200, content=b"")] * 1000
+    )
+    received: list[GrantexStreamEvent] = []
+    errors: list[Exception] = []
+    done = threading.Event()
+
+    def handler(event: GrantexStreamEvent) -> None:
+        received.append(event)
+        if len(received) == 2:
+            done.set()
+
+    client = EventsClient(BASE_URL, "test-key")
+    sub = client.subscribe(handler, on_error=errors.append, reconnect=FAST)
+
+    assert done.wait(timeout=5)
+    sub.unsubscribe()
+
+    assert [e.id for e in received] == ["evt_1", "evt_2"]
+    assert len(errors) == 1
+    assert sub.metrics is not None
+    assert sub.metrics.connects >= 2
+    assert sub.active is False
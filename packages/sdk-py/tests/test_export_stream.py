@@ -0,0 +1,142 @@
+"""Tests for streaming compliance exports."""
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from grantex import Grantex, GrantexApiError
+from grantex._jsonstream import iter_array_items, iter_ndjson
+from grantex._types import ComplianceExportAuditParams
+from tests.conftest import MOCK_AUDIT_ENTRY, MOCK_GRANT
+
+BASE_URL = "https://api.grantex.dev"
+
+
+def _entries(count: int) -> list[dict]:
+    return [{**MOCK_AUDIT_ENTRY, "entryId": f"audit_{i}"} for i in range(count)]
+
+
+def _chunked(payload: bytes, size: int) -> list[bytes]:
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+@pytest.fixture
+def client() -> Grantex:
+    return Grantex(api_key="test-key")
+
+
+@respx.mock
+def test_iter_audit_export_streams_json_document(client: Grantex) -> None:
+    doc = {"generatedAt": "2026-01-01T00:00:00Z", "total": 3, "entries": _entries(3)}
+    route = respx.get(f"{BASE_URL}/v1/compliance/export/audit").mock(
+        return_value=httpx.Response(
+            200,
+            content=iter(_chunked(json.dumps(doc).encode(), 37)),
+            headers={"content-type": "application/json"},
+        )
+    )
+
+    ids = [e.entry_id for e in client.compliance.iter_audit_export()]
+
+    assert ids == ["audit_0", "audit_1", "audit_2"]
+    assert "application/x-ndjson" in route.calls.last.request.headers["accept"]
+
+
+@respx.mock
+def test_iter_grants_export_accepts_ndjson(client: Grantex) -> None:
+    lines = b"".join(
+        json.dumps({**MOCK_GRANT, "id": f"grant_{i}"}).encode() + b"\n" for i in range(4)
+    )
+    respx.get(f"{BASE_URL}/v1/compliance/export/grants").mock(
+        return_value=httpx.Response(
+            200,
+            content=iter(_chunked(lines, 50)),
+            headers={"content-type": "application/x-ndjson"},
+        )
+    )
+
+    grants = list(client.compliance.iter_grants_export())
+
+    assert [g.id for g in grants] == [f"grant_{i}" for i in range(4)]
+
+
+@respx.mock
+def test_write_audit_export_to_path(client: Grantex, tmp_path: Path) -> None:
+    doc = {"generatedAt": "2026-01-01T00:00:00Z", "total": 2, "entries": _entries(2)}
+    route = respx.get(f"{BASE_URL}/v1/compliance/export/audit").mock(
+        return_value=httpx.Response(200, content=json.dumps(doc, indent=2).encode())
+    )
+    dest = tmp_path / "audit.ndjson"
+
+    count = client.compliance.write_audit_export(
+        dest, ComplianceExportAuditParams(agent_id="ag_01")
+    )
+
+    assert count == 2
+    rows = [json.loads(line) for line in dest.read_bytes().splitlines()]
+    assert rows == doc["entries"]
+    assert route.calls.last.request.url.params["agentId"] == "ag_01"
+
+
+@respx.mock
+def test_write_grants_export_to_file_object(client: Grantex) -> None:
+    doc = {"generatedAt": "2026-01-01T00:00:00Z", "total": 1, "grants": [MOCK_GRANT]}
+    respx.get(f"{BASE_URL}/v1/compliance/export/grants").mock(
+        return_value=httpx.Response(200, json=doc)
+    )
+    buf = io.BytesIO()
+
+    assert client.compliance.write_grants_export(buf) == 1
+    assert json.loads(buf.getvalue()) == MOCK_GRANT
+
+
+@respx.mock
+def test_stream_retries_then_raises_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("grantex._http.time.sleep", lambda _: None)
+    route = respx.get(f"{BASE_URL}/v1/compliance/export/audit").mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.Response(403, json={"message": "Forbidden", "code": "FORBIDDEN"}),
+        ]
+    )
+    client = Grantex(api_key="test-key")
+
+    with pytest.raises(GrantexApiError, match="Forbidden") as excinfo:
+        list(client.compliance.iter_audit_export())
+
+    assert excinfo.value.status_code == 403
+    assert route.call_count == 2
+
+
+def test_array_scanner_handles_any_chunking() -> None:
+    tricky = [
+        {"id": 1, "note": 'quote " and brace } and bracket ]'},
+        {"id": 2, "nested": {"entries": [{"x": 1}], "list": [1, [2, 3]]}},
+        {"id": 3, "escape": "back\\slash é \n newline"},
+    ]
+    doc = {
+        "entriesCount": [{"decoy": True}],
+        "total": 3,
+        "entries": tricky,
+        "trailer": {"entries": [{"decoy": True}]},
+    }
+    payload = json.dumps(doc, ensure_ascii=False).encode()
+
+    for size in (1, 2, 5, 64, len(payload)):
+        items = [json.loads(raw) for raw in iter_array_items(_chunked(payload, size), "entries")]
+        assert items == tricky
+
+
+def test_array_scanner_empty_and_missing_arrays() -> None:
+    assert list(iter_array_items([b'{"total": 0, "entries": []}'], "entries")) == []
+    assert list(iter_array_items([b'{"message": "nothing"}'], "entries")) == []
+
+
+def test_ndjson_splitting() -> None:
+    chunks = [b'{"a": 1}\n{"b"', b": 2}\r\n\n", b'{"c": 3}']
+    assert [json.loads(line) for line in iter_ndjson(chunks)] == [{"a": 1}, {"b": 2}, {"c": 3}]
@@ -0,0 +1,134 @@
+"""Tests for hedged idempotent reads."""
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from grantex import Grantex, HedgingPolicy
+from grantex._http import HttpClient
+from tests.conftest import MOCK_GRANT
+
+BASE_URL = "https://api.grantex.dev"
+
+
+def _slow_then_fast(slow_seconds: float) -> object:
+    calls = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(request)
+            first = len(calls) == 1
+        if first:
+            time.sleep(slow_seconds)
+            return httpx.Response(200, json={**MOCK_GRANT, "status": "slow"})
+        return httpx.Response(200, json={**MOCK_GRANT, "status": "fast"})
+
+    return handler
+
+
+@respx.mock
+def test_hedge_wins_when_primary_is_slow() -> None:
+    respx.get(f"{BASE_URL}/v1/grants/grant_01HXYZ").mock(side_effect=_slow_then_fast(1.0))
+    policy = HedgingPolicy(delay=0.05, budget_ratio=1.0)
+    client = Grantex(api_key="test-key", hedging=policy)
+
+    started = time.monotonic()
+    grant = client.grants.get("grant_01HXYZ")
+
+    assert grant.status == "fast"
+    assert time.monotonic() - started < 0.8
+    assert policy.hedges_sent == 1
+    client.close()
+
+
+@respx.mock
+def test_fast_primary_is_not_hedged() -> None:
+    route = respx.get(f"{BASE_URL}/v1/budget/balance/grant_01").mock(
+        return_value=httpx.Response(200, json={"id": "b"})
+    )
+    policy = HedgingPolicy(delay=0.5, budget_ratio=1.0)
+    client = HttpClient(BASE_URL, "test-key", hedging=policy)
+
+    assert client.get("/v1/budget/balance/grant_01", hedge=True) == {"id": "b"}
+    assert route.call_count == 1
+    assert policy.hedges_sent == 0
+    client.close()
+
+
+@respx.mock
+def test_exhausted_budget_waits_for_primary() -> None:
+    route = respx.get(f"{BASE_URL}/v1/grants/grant_01HXYZ").mock(side_effect=_slow_then_fast(0.2))
+    policy = HedgingPolicy(delay=0.01, budget_ratio=0.1)
+    client = HttpClient(BASE_URL, "test-key", hedging=policy)
+
+    assert client.get("/v1/grants/grant_01HXYZ", hedge=True)["status"] == "slow"
+    assert route.call_count == 1
+    assert policy.hedges_sent == 0
+    client.close()
+
+
+@respx.mock
+def test_calls_without_hedge_flag_are_sent_once() -> None:
+    route = respx.get(f"{BASE_URL}/v1/agents").mock(side_effect=_slow_then_fast(0.2))
+    client = HttpClient(BASE_URL, "test-key", hedging=HedgingPolicy(delay=0.01, budget_ratio=1.0))
+
+    assert client.get("/v1/agents")["status"] == "slow"
+    assert route.call_count == 1
+    client.close()
+
+
+@respx.mock
+def test_tokens_verify_is_hedgeable() -> None:
+    route = respx.post(f"{BASE_URL}/v1/tokens/verify").mock(
+        return_value=httpx.Response(200, json={"valid": True})
+    )
+    client = Grantex(api_key="test-key", hedging=HedgingPolicy(delay=1.0))
+
+    assert client.tokens.verify("tok").valid is True
+    assert route.call_count == 1
+    client.close()
+
+
+@respx.mock
+def test_primary_error_is_raised_without_hedging() -> None:
+    respx.get(f"{BASE_URL}/v1/grants/grant_01").mock(side_effect=httpx.ConnectError("refused"))
+    client = HttpClient(
+        BASE_URL, "test-key", max_retries=0, hedging=HedgingPolicy(delay=1.0, budget_ratio=1.0)
+    )
+
+    with pytest.raises(Exception, match="Network error"):
+        client.get("/v1/grants/grant_01", hedge=True)
+    client.close()
+
+
+def test_adaptive_delay_uses_percentile_after_min_samples() -> None:
+    policy = HedgingPolicy(percentile=0.9, min_samples=10)
+    for i in range(9):
+        policy.record_latency("GET /v1/grants/:id", i / 100)
+    assert policy.hedge_delay("GET /v1/grants/:id") is None
+
+    policy.record_latency("GET /v1/grants/:id", 0.5)
+    assert policy.hedge_delay("GET /v1/grants/:id") == 0.5
+    assert policy.hedge_delay("GET /v1/agents") is None
+
+
+def test_budget_limits_hedge_rate() -> None:
+    policy = HedgingPolicy(budget_ratio=0.25)
+    granted = 0
+    for _ in range(100):
+        policy.earn()
+        if policy.try_spend():
+            granted += 1
+    assert granted == 25
+
+
+def test_invalid_policy_arguments() -> None:
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=1.0)
+    with pytest.raises(ValueError):
+        HedgingPolicy(budget_ratio=-0.1)
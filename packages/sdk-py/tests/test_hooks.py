@@ -0,0 +1,255 @@
+"""Tests for request lifecycle hooks and the latency recorder."""
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from grantex import (
+    CircuitBreaker,
+    ErrorEvent,
+    Grantex,
+    GrantexApiError,
+    GrantexNetworkError,
+    LatencyRecorder,
+    RequestCompression,
+    RequestEvent,
+    RequestHooks,
+    ResponseEvent,
+    RetryEvent,
+)
+from grantex._http import HttpClient
+from tests.conftest import MOCK_GRANT
+
+BASE_URL = "https://api.grantex.dev"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("grantex._http.time.sleep", lambda _: None)
+
+
+def _recording_hooks(events: list[Any]) -> RequestHooks:
+    return RequestHooks(
+        on_request=events.append,
+        on_response=events.append,
+        on_retry=events.append,
+        on_error=events.append,
+    )
+
+
+@respx.mock
+def test_successful_call_emits_request_and_response() -> None:
+    respx.get(f"{BASE_URL}/v1/grants/grant_01HXYZ").mock(
+        return_value=httpx.Response(
+            200,
+            json=MOCK_GRANT,
+            headers={
+                "x-request-id": "req_1",
+                "x-ratelimit-limit": "100",
+                "x-ratelimit-remaining": "99",
+                "x-ratelimit-reset": "1700000000",
+            },
+        )
+    )
+    events: list[Any] = []
+    client = Grantex(api_key="test-key", hooks=_recording_hooks(events))
+
+    client.grants.get("grant_01HXYZ")
+
+    request, response = events
+    assert request == RequestEvent("GET", "/v1/grants/grant_01HXYZ", "/v1/grants/:id", 0)
+    assert isinstance(response, ResponseEvent)
+    assert response.status_code == 200
+    assert response.request_id == "req_1"
+    assert response.rate_limit is not None and response.rate_limit.remaining == 99
+    assert 0 <= response.elapsed <= response.total_elapsed
+    assert response.backoff == 0.0
+
+
+@respx.mock
+def test_retries_report_delay_and_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    respx.get(f"{BASE_URL}/v1/agents").mock(
+        side_effect=[
+            httpx.ConnectError("refused"),
+            httpx.Response(503, headers={"retry-after": "2"}),
+            httpx.Response(200, json={"agents": []}),
+        ]
+    )
+    monkeypatch.setattr("grantex._http.random.random", lambda: 0.0)
+    events: list[Any] = []
+    client = HttpClient(BASE_URL, "test-key", hooks=_recording_hooks(events))
+
+    client.get("/v1/agents")
+
+    retries = [e for e in events if isinstance(e, RetryEvent)]
+    assert [(r.attempt, r.delay, r.status_code) for r in retries] == [(0, 0.5, None), (1, 2.0, 503)]
+    assert isinstance(retries[0].error, httpx.ConnectError)
+    assert [e.attempt for e in events if isinstance(e, RequestEvent)] == [0, 1, 2]
+    final = [e for e in events if isinstance(e, ResponseEvent)][-1]
+    assert final.status_code == 200
+    assert final.backoff == 2.5
+    client.close()
+
+
+@respx.mock
+def test_api_error_emits_error_event() -> None:
+    respx.get(f"{BASE_URL}/v1/grants/missing").mock(
+        return_value=httpx.Response(
+            404, json={"message": "Not found"}, headers={"x-request-id": "req_404"}
+        )
+    )
+    events: list[Any] = []
+    client = HttpClient(BASE_URL, "test-key", hooks=_recording_hooks(events))
+
+    with pytest.raises(GrantexApiError):
+        client.get("/v1/grants/missing")
+
+    error = events[-1]
+    assert isinstance(error, ErrorEvent)
+    assert isinstance(error.error, GrantexApiError)
+    assert error.request_id == "req_404"
+    assert error.route == "/v1/grants/missing"
+    client.close()
+
+
+def test_open_circuit_emits_error_event() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure("GET /v1/agents")
+    events: list[Any] = []
+    client = HttpClient(BASE_URL, "test-key", circuit_breaker=breaker, hooks=_recording_hooks(events))
+
+    with pytest.raises(GrantexNetworkError):
+        client.get("/v1/agents")
+
+    assert len(events) == 1
+    assert isinstance(events[0], ErrorEvent)
+    client.close()
+
+
+@respx.mock
+def test_multiple_hook_sets_all_fire() -> None:
+    respx.get(f"{BASE_URL}/v1/agents").mock(return_value=httpx.Response(200, json={}))
+    first: list[Any] = []
+    second: list[Any] = []
+    client = HttpClient(
+        BASE_URL,
+        "test-key",
+        hooks=[RequestHooks(on_response=first.append), RequestHooks(on_response=second.append)],
+    )
+
+    client.get("/v1/agents")
+
+    assert len(first) == len(second) == 1
+    client.close()
+
+
+@respx.mock
+def test_latency_recorder_aggregates_per_route() -> None:
+    respx.get(url__regex=rf"{BASE_URL}/v1/grants/grant_\d+").mock(
+        return_value=httpx.Response(200, json=MOCK_GRANT)
+    )
+    respx.get(f"{BASE_URL}/v1/grants/grant_bad").mock(
+        return_value=httpx.Response(500, json={"message": "boom"})
+    )
+    latency = LatencyRecorder()
+    client = HttpClient(BASE_URL, "test-key", max_retries=0, hooks=latency.hooks)
+
+    for i in range(5):
+        client.get(f"/v1/grants/grant_{i}")
+    with pytest.raises(GrantexApiError):
+        client.get("/v1/grants/grant_bad")
+
+    (row,) = latency.snapshot()
+    assert row.route == "GET /v1/grants/:id"
+    assert row.count == 6
+    assert row.errors == 1
+    assert row.p50 <= row.p95 <= row.p99
+    assert latency.route("GET /v1/agents") is None
+    client.close()
+
+
+def test_latency_recorder_percentiles() -> None:
+    latency = LatencyRecorder(window=100)
+    for ms in range(1, 101):
+        latency.record("GET /v1/agents", ms / 1000)
+
+    row = latency.route("GET /v1/agents")
+    assert row is not None
+    assert (row.p50, row.p95, row.p99) == (0.051, 0.096, 0.1)
+
+    latency.reset()
+    assert latency.snapshot() == []
+
+
+@respx.mock
+def test_raising_request_hook_does_not_wedge_half_open_probe(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("grantex._circuit.time.monotonic", lambda: now[0])
+    respx.get(f"{BASE_URL}/v1/agents").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200, json={"agents": []})]
+    )
+    fail = [False]
+
+    def on_request(event: RequestEvent) -> None:
+        if fail[0]:
+            raise RuntimeError("hook failed")
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5)
+    client = HttpClient(
+        BASE_URL, "test-key", max_retries=0, circuit_breaker=breaker,
+        hooks=RequestHooks(on_request=on_request),
+    )
+    with pytest.raises(GrantexApiError):
+        client.get("/v1/agents")
+    now[0] += 5
+    fail[0] = True
+    with pytest.raises(RuntimeError):
+        client.get("/v1/agents")
+    fail[0] = False
+    assert client.get("/v1/agents") == {"agents": []}
+    assert breaker.state("GET /v1/agents") == "closed"
+
+
+@respx.mock
+def test_uncompressed_resend_emits_request_event() -> None:
+    respx.post(f"{BASE_URL}/v1/audit/log").mock(
+        side_effect=[httpx.Response(415), httpx.Response(200, json={})]
+    )
+    events: list[Any] = []
+    client = HttpClient(
+        BASE_URL, "test-key", max_retries=0,
+        compression=RequestCompression(threshold=0),
+        hooks=_recording_hooks(events),
+    )
+    client.post("/v1/audit/log", {"action": "x" * 100})
+
+    kinds = [type(e).__name__ for e in events]
+    assert kinds == ["RequestEvent", "RequestEvent", "ResponseEvent"]
+    assert events[2].status_code == 200
+
+
+@respx.mock
+def test_stream_goes_through_hooks_and_breaker() -> None:
+    respx.get(f"{BASE_URL}/v1/compliance/export/audit").mock(
+        side_effect=[
+            httpx.Response(503, json={"message": "busy"}),
+            httpx.Response(200, content=b'{"entryId": "audit_1"}\n'),
+        ]
+    )
+    breaker = CircuitBreaker(failure_threshold=1)
+    events: list[Any] = []
+    client = HttpClient(
+        BASE_URL, "test-key", circuit_breaker=breaker, hooks=_recording_hooks(events)
+    )
+
+    # The 503 opens the circuit, so the retry is refused.
+    with pytest.raises(GrantexNetworkError), client.stream("/v1/compliance/export/audit"):
+        pass
+
+    assert [type(e) for e in events] == [RequestEvent, ResponseEvent, RetryEvent, ErrorEvent]
+    client.close()
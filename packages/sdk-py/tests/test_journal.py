@@ -0,0 +1,101 @@
+"""Tests for EventJournal and journaled EventDispatcher runs."""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from grantex import EventDispatcher, EventJournal, GrantexStreamEvent
+from grantex.resources._events import EventsClient
+
+BASE_URL = "https://api.grantex.dev"
+
+
+def _event(i: int, type_: str = "grant.revoked") -> GrantexStreamEvent:
+    return GrantexStreamEvent(
+        id=f"evt_{i}", type=type_, created_at="2026-01-01T00:00:00Z", data={"n": i}
+    )
+
+
+def test_append_ack_and_pending(tmp_path: Path) -> None:
+    with EventJournal(tmp_path / "events.db") as journal:
+        assert journal.append(_event(1)) is True
+        assert journal.append(_event(2)) is True
+        assert journal.append(_event(1)) is False
+        journal.ack("evt_1")
+        assert journal.unacked == 1
+
+    with EventJournal(tmp_path / "events.db") as journal:
+        assert journal.pending() == [_event(2)]
+
+
+def test_compaction_keeps_recent_acked_ids(tmp_path: Path) -> None:
+    with EventJournal(tmp_path / "events.db", keep_acked=2, compact_every=3) as journal:
+        for i in range(5):
+            journal.append(_event(i))
+        for i in range(3):
+            journal.ack(f"evt_{i}")  # the third ack compacts
+        rows = journal.connection.execute(
+            "SELECT event_id FROM events ORDER BY seq"
+        ).fetchall()
+        assert [r[0] for r in rows] == ["evt_1", "evt_2", "evt_3", "evt_4"]
+        assert journal.append(_event(2)) is False
+
+        journal.ack("evt_3")
+        assert journal.compact() == 1
+        assert [e.id for e in journal.pending()] == ["evt_4"]
+
+    with pytest.raises(ValueError):
+        EventJournal(tmp_path / "other.db", compact_every=0)
+
+
+@respx.mock
+def test_dispatcher_replays_unacked_events(tmp_path: Path) -> None:
+    path = tmp_path / "events.db"
+    events = EventsClient(BASE_URL, "test-key")
+
+    # First run: evt_1 fails, so it stays unacknowledged.
+    with EventJournal(path) as journal:
+        dispatcher = EventDispatcher(events, workers=1, journal=journal)
+
+        @dispatcher.on("*")
+        def flaky(event: GrantexStreamEvent) -> None:
+            if event.id == "evt_1":
+                raise RuntimeError("downstream unavailable")
+
+        dispatcher.dispatch(_event(0))
+        dispatcher.dispatch(_event(1))
+        assert dispatcher.flush(timeout=5)
+        assert dispatcher.stop()
+        assert journal.unacked == 1
+
+    # Second run: evt_1 is replayed before the stream delivers evt_1 (again) and evt_2.
+    body = b"".join(
+        b"data: "
+        + json.dumps({"id": f"evt_{i}", "type": "grant.revoked", "createdAt": "2026-01-01T00:00:00Z"}).encode()
+        + b"\n\n"
+        for i in (1, 2)
+    )
+    respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        return_value=httpx.Response(200, content=body)
+    )
+    seen: list[str] = []
+    done = threading.Event()
+
+    def handler(event: GrantexStreamEvent) -> None:
+        seen.append(event.id)
+        if event.id == "evt_2":
+            done.set()
+
+    with EventJournal(path) as journal:
+        dispatcher = EventDispatcher(events, workers=1, reconnect=None, journal=journal)
+        dispatcher.on("*", handler)
+        with dispatcher.start():
+            assert done.wait(timeout=5)
+            assert dispatcher.flush(timeout=5)
+        assert seen == ["evt_1", "evt_2"]
+        assert journal.unacked == 0
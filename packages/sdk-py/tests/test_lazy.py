@@ -0,0 +1,113 @@
+"""Tests for lazily materialized list responses."""
+from __future__ import annotations
+
+import dataclasses
+import json
+
+from grantex import LazySequence
+from grantex._types import (
+    AuditEntry,
+    ComplianceAuditExport,
+    EvidencePack,
+    Grant,
+    ListAuditResponse,
+)
+from tests.conftest import MOCK_AUDIT_ENTRY, MOCK_GRANT
+
+
+def _rows(count: int) -> list[dict]:
+    return [{**MOCK_AUDIT_ENTRY, "entryId": f"audit_{i}"} for i in range(count)]
+
+
+def _counting_factory(calls: list[str]):  # type: ignore[no-untyped-def]
+    def factory(row: dict) -> AuditEntry:
+        calls.append(row["entryId"])
+        return AuditEntry.from_dict(row)
+
+    return factory
+
+
+def test_len_does_not_materialize() -> None:
+    calls: list[str] = []
+    seq = LazySequence(_rows(1000), _counting_factory(calls))
+    assert len(seq) == 1000
+    assert seq.rows[10]["agentId"] == "ag_01HXYZ123abc"
+    assert calls == []
+
+
+def test_index_materializes_once() -> None:
+    calls: list[str] = []
+    seq = LazySequence(_rows(3), _counting_factory(calls))
+    first = seq[1]
+    again = seq[1]
+    assert first is again
+    assert first.entry_id == "audit_1"
+    assert seq[-1].entry_id == "audit_2"
+    assert calls == ["audit_1", "audit_2"]
+
+
+def test_iteration_and_slicing() -> None:
+    seq = LazySequence(_rows(4), AuditEntry.from_dict)
+    assert [e.entry_id for e in seq] == ["audit_0", "audit_1", "audit_2", "audit_3"]
+    tail = seq[2:]
+    assert isinstance(tail, LazySequence)
+    assert [e.entry_id for e in tail] == ["audit_2", "audit_3"]
+
+
+def test_equality_with_tuples_and_lists() -> None:
+    rows = _rows(2)
+    seq = LazySequence(rows, AuditEntry.from_dict)
+    expected = tuple(AuditEntry.from_dict(r) for r in rows)
+    assert seq == expected
+    assert seq == list(expected)
+    assert seq != expected[:1]
+    assert LazySequence([], AuditEntry.from_dict) == ()
+    assert seq == LazySequence(_rows(2), AuditEntry.from_dict)
+
+
+def test_equality_of_lazy_sequences_compares_rows() -> None:
+    seq = LazySequence(_rows(2), AuditEntry.from_dict)
+    other = LazySequence(_rows(2), AuditEntry.from_dict)
+    assert seq == other
+    assert seq._items == other._items == [None, None]
+
+
+def test_asdict_after_converting_to_tuple() -> None:
+    response = ListAuditResponse.from_dict({"entries": _rows(2)})
+    data = dataclasses.asdict(dataclasses.replace(response, entries=tuple(response.entries)))
+    assert json.loads(json.dumps(data))["entries"][1]["entry_id"] == "audit_1"
+
+
+def test_sequence_protocol_helpers() -> None:
+    seq = LazySequence(_rows(3), AuditEntry.from_dict)
+    target = AuditEntry.from_dict(_rows(3)[2])
+    assert target in seq
+    assert seq.index(target) == 2
+    assert seq.count(target) == 1
+
+
+def test_list_audit_response_is_lazy() -> None:
+    response = ListAuditResponse.from_dict({"entries": _rows(5)})
+    assert isinstance(response.entries, LazySequence)
+    assert len(response.entries) == 5
+    assert response.entries[4].entry_id == "audit_4"
+
+
+def test_compliance_export_and_evidence_pack_are_lazy() -> None:
+    export = ComplianceAuditExport.from_dict(
+        {"generatedAt": "2026-01-01T00:00:00Z", "total": 2, "entries": _rows(2)}
+    )
+    assert isinstance(export.entries, LazySequence)
+    assert export.entries[0].entry_id == "audit_0"
+
+    pack = EvidencePack.from_dict({
+        "meta": {"schemaVersion": "1.0", "generatedAt": "2026-01-01T00:00:00Z", "framework": "all"},
+        "summary": {},
+        "grants": [MOCK_GRANT],
+        "auditEntries": _rows(3),
+        "policies": [],
+        "chainIntegrity": {"valid": True, "checkedEntries": 3, "firstBrokenAt": None},
+    })
+    assert isinstance(pack.grants, LazySequence)
+    assert pack.grants[0] == Grant.from_dict(MOCK_GRANT)
+    assert len(pack.audit_entries) == 3
@@ -0,0 +1,128 @@
+"""Tests for SharedEventStream."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from grantex import GrantexStreamEvent, SharedEventStream, StreamOptions
+
+
+class _FakeUpstream:
+    def __init__(self, handler: Any, options: StreamOptions | None) -> None:
+        self.handler = handler
+        self.types = list(options.types) if options and options.types is not None else None
+        self.stopped = False
+
+    def unsubscribe(self, timeout: float | None = 5) -> None:
+        self.stopped = True
+
+    def push(self, i: int, type_: str) -> None:
+        self.handler(
+            GrantexStreamEvent(
+                id=f"evt_{i}", type=type_, created_at="2026-01-01T00:00:00Z", data={}
+            )
+        )
+
+
+class _FakeEvents:
+    """Stands in for EventsClient: each subscribe() is one upstream connection."""
+
+    def __init__(self) -> None:
+        self.upstreams: list[_FakeUpstream] = []
+
+    def subscribe(self, handler: Any, options: Any = None, **kwargs: Any) -> _FakeUpstream:
+        upstream = _FakeUpstream(handler, options)
+        self.upstreams.append(upstream)
+        return upstream
+
+    @property
+    def open(self) -> list[_FakeUpstream]:
+        return [u for u in self.upstreams if not u.stopped]
+
+
+@pytest.fixture
+def events() -> _FakeEvents:
+    return _FakeEvents()
+
+
+def test_one_connection_fans_out_by_type(events: _FakeEvents) -> None:
+    shared = SharedEventStream(events)  # type: ignore[arg-type]
+    revoked: list[str] = []
+    everything: list[str] = []
+
+    shared.subscribe(lambda e: revoked.append(e.id), ["grant.revoked"])
+    first = events.upstreams[0]
+    assert first.types == ["grant.revoked"]
+
+    shared.subscribe(lambda e: everything.append(e.id))
+    second = events.upstreams[1]
+    assert second.types is None
+    assert shared.connections == 2
+
+    # Until the new connection delivers, the old one keeps serving.
+    first.push(1, "grant.revoked")
+    second.push(1, "grant.revoked")  # duplicate from the overlap
+    second.push(2, "token.issued")
+    first.push(3, "grant.revoked")  # old connection is retired by now
+
+    assert first.stopped and not second.stopped
+    assert shared.connections == 1
+    assert revoked == ["evt_1"]
+    assert everything == ["evt_1", "evt_2"]
+
+
+def test_filter_narrows_and_closes_when_empty(events: _FakeEvents) -> None:
+    shared = SharedEventStream(events)  # type: ignore[arg-type]
+    a = shared.subscribe(lambda e: None, ["grant.revoked"])
+    b = shared.subscribe(lambda e: None, ["budget.threshold", "grant.revoked"])
+    assert shared.upstream_types == ("budget.threshold", "grant.revoked")
+
+    events.upstreams[1].push(1, "grant.revoked")
+    b.unsubscribe()
+    assert shared.upstream_types == ("grant.revoked",)
+    assert [u.types for u in events.open] == [
+        ["budget.threshold", "grant.revoked"],
+        ["grant.revoked"],
+    ]
+
+    a.unsubscribe()
+    assert events.open == []
+    assert shared.connections == 0
+    assert not a.active
+
+
+def test_unconfirmed_switch_is_replaced_not_stacked(events: _FakeEvents) -> None:
+    shared = SharedEventStream(events)  # type: ignore[arg-type]
+    shared.subscribe(lambda e: None, ["a"])
+    b = shared.subscribe(lambda e: None, ["b"])
+    assert len(events.open) == 2
+
+    b.unsubscribe()
+    # The pending ["a", "b"] connection goes; the live ["a"] one still fits.
+    assert [u.types for u in events.open] == [["a"]]
+
+    shared.subscribe(lambda e: None, ["c"])
+    shared.subscribe(lambda e: None, ["d"])
+    assert [u.types for u in events.open] == [["a"], ["a", "c", "d"]]
+
+
+def test_handler_errors_are_isolated(events: _FakeEvents) -> None:
+    errors: list[Exception] = []
+    shared = SharedEventStream(events, on_error=errors.append)  # type: ignore[arg-type]
+    seen: list[str] = []
+
+    def broken(event: GrantexStreamEvent) -> None:
+        raise RuntimeError("boom")
+
+    shared.subscribe(broken)
+    shared.subscribe(lambda e: seen.append(e.id))
+    events.upstreams[-1].push(1, "grant.created")
+
+    assert seen == ["evt_1"]
+    assert [str(e) for e in errors] == ["boom"]
+    assert shared.delivered == 2
+
+    shared.close()
+    with pytest.raises(RuntimeError):
+        shared.subscribe(lambda e: None)
@@ -0,0 +1,219 @@
+"""Tests for the auto-paginating iter_* helpers."""
+from __future__ import annotations
+
+import threading
+
+import httpx
+import pytest
+import respx
+
+from grantex import Grantex
+from grantex._pagination import iter_pages, next_page
+from grantex._types import ListAuditParams, ListCredentialsParams, ListGrantsParams
+from tests.conftest import MOCK_AUDIT_ENTRY, MOCK_GRANT
+
+BASE_URL = "https://api.grantex.dev"
+
+
+@pytest.fixture
+def client() -> Grantex:
+    return Grantex(api_key="test-key", max_retries=0)
+
+
+def _grants(start: int, count: int) -> list[dict]:
+    return [{**MOCK_GRANT, "id": f"grant_{i}"} for i in range(start, start + count)]
+
+
+def _entries(start: int, count: int) -> list[dict]:
+    return [{**MOCK_AUDIT_ENTRY, "entryId": f"audit_{i}"} for i in range(start, start + count)]
+
+
+# ── iter_pages ───────────────────────────────────────────────────────────────
+
+def test_iter_pages_walks_until_cursor_is_none() -> None:
+    pages = {1: ([1, 2], 2), 2: ([3, 4], 3), 3: ([5], None)}
+    assert list(iter_pages(lambda p: pages[p], 1)) == [1, 2, 3, 4, 5]
+
+
+def test_iter_pages_without_prefetch() -> None:
+    calls: list[int] = []
+
+    def fetch(page: int) -> tuple[list[int], int | None]:
+        calls.append(page)
+        return [page], page + 1 if page < 3 else None
+
+    gen = iter_pages(fetch, 1, prefetch=False)
+    assert next(gen) == 1
+    assert calls == [1]
+    assert list(gen) == [2, 3]
+
+
+def test_iter_pages_prefetches_next_page_while_consuming() -> None:
+    second_requested = threading.Event()
+
+    def fetch(page: int) -> tuple[list[int], int | None]:
+        if page == 2:
+            second_requested.set()
+            return [2], None
+        return [1], 2
+
+    gen = iter_pages(fetch, 1)
+    assert next(gen) == 1
+    # Page 2 is requested before the caller asks for the next item
+    assert second_requested.wait(timeout=2)
+    assert list(gen) == [2]
+
+
+def test_iter_pages_stops_on_repeated_page() -> None:
+    calls: list[int] = []
+
+    def fetch(page: int) -> tuple[list[int], int | None]:
+        calls.append(page)
+        return [1, 2], page + 1
+
+    assert list(iter_pages(fetch, 1, prefetch=False)) == [1, 2]
+    assert calls == [1, 2]
+
+
+def test_next_page() -> None:
+    assert next_page(1, 100, 100) == 2
+    assert next_page(1, 99, 100) is None
+    assert next_page(1, 250, 100) is None
+
+
+# ── Resource iterators ───────────────────────────────────────────────────────
+
+@respx.mock
+def test_iter_grants_walks_all_pages(client: Grantex) -> None:
+    route = respx.get(f"{BASE_URL}/v1/grants").mock(
+        side_effect=[
+            httpx.Response(200, json={"grants": _grants(0, 2)}),
+            httpx.Response(200, json={"grants": _grants(2, 1)}),
+        ]
+    )
+
+    ids = [g.id for g in client.grants.iter_grants(ListGrantsParams(status="active"), page_size=2)]
+
+    assert ids == ["grant_0", "grant_1", "grant_2"]
+    assert route.calls[0].request.url.params["page"] == "1"
+    assert route.calls[0].request.url.params["pageSize"] == "2"
+    assert route.calls[0].request.url.params["status"] == "active"
+    assert route.calls[1].request.url.params["page"] == "2"
+
+
+@respx.mock
+def test_iter_entries_walks_all_pages(client: Grantex) -> None:
+    route = respx.get(f"{BASE_URL}/v1/audit/entries").mock(
+        side_effect=[
+            httpx.Response(200, json={"entries": _entries(0, 3)}),
+            httpx.Response(200, json={"entries": _entries(3, 3)}),
+            httpx.Response(200, json={"entries": []}),
+        ]
+    )
+
+    entries = list(
+        client.audit.iter_entries(ListAuditParams(agent_id="ag_01", page_size=3), prefetch=False)
+    )
+
+    assert [e.entry_id for e in entries] == [f"audit_{i}" for i in range(6)]
+    assert route.call_count == 3
+    assert route.calls[2].request.url.params["page"] == "3"
+    assert route.calls[2].request.url.params["agentId"] == "ag_01"
+
+
+@respx.mock
+def test_iter_entries_stops_when_server_ignores_paging(client: Grantex) -> None:
+    route = respx.get(f"{BASE_URL}/v1/audit/entries").mock(
+        return_value=httpx.Response(200, json={"entries": _entries(0, 2)})
+    )
+
+    entries = list(client.audit.iter_entries(page_size=2))
+
+    assert len(entries) == 2
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_iter_grants_fetches_once_when_server_ignores_paging(client: Grantex) -> None:
+    # The server returns every match regardless of page/pageSize.
+    route = respx.get(f"{BASE_URL}/v1/grants").mock(
+        return_value=httpx.Response(200, json={"grants": _grants(0, 5)})
+    )
+
+    ids = [g.id for g in client.grants.iter_grants(page_size=2)]
+
+    assert ids == [f"grant_{i}" for i in range(5)]
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_iter_transactions_uses_total(client: Grantex) -> None:
+    def _tx(i: int) -> dict:
+        return {
+            "id": f"tx_{i}",
+            "grantId": "grant_01",
+            "allocationId": "alloc_01",
+            "amount": "1.00",
+            "description": "",
+            "createdAt": "2026-01-01T00:00:00Z",
+        }
+
+    route = respx.get(f"{BASE_URL}/v1/budget/transactions/grant_01").mock(
+        side_effect=[
+            httpx.Response(200, json={"transactions": [_tx(0), _tx(1)], "total": 3}),
+            httpx.Response(200, json={"transactions": [_tx(2)], "total": 3}),
+        ]
+    )
+
+    ids = [t.id for t in client.budgets.iter_transactions("grant_01", page_size=2)]
+
+    assert ids == ["tx_0", "tx_1", "tx_2"]
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_iter_users_advances_start_index(client: Grantex) -> None:
+    def _user(i: int) -> dict:
+        return {
+            "id": f"usr_{i}",
+            "userName": f"user{i}@example.com",
+            "meta": {
+                "resourceType": "User",
+                "created": "2026-01-01T00:00:00Z",
+                "lastModified": "2026-01-01T00:00:00Z",
+            },
+        }
+
+    route = respx.get(f"{BASE_URL}/scim/v2/Users").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"totalResults": 3, "startIndex": 1, "itemsPerPage": 2,
+                      "Resources": [_user(0), _user(1)]},
+            ),
+            httpx.Response(
+                200,
+                json={"totalResults": 3, "startIndex": 3, "itemsPerPage": 2,
+                      "Resources": [_user(2)]},
+            ),
+        ]
+    )
+
+    ids = [u.id for u in client.scim.iter_users(count=2)]
+
+    assert ids == ["usr_0", "usr_1", "usr_2"]
+    assert route.calls[1].request.url.params["startIndex"] == "3"
+    assert route.calls[1].request.url.params["count"] == "2"
+
+
+@respx.mock
+def test_iter_credentials_sends_page_params(client: Grantex) -> None:
+    route = respx.get(f"{BASE_URL}/v1/credentials").mock(
+        return_value=httpx.Response(200, json={"credentials": []})
+    )
+
+    assert list(client.credentials.iter_credentials(ListCredentialsParams(grant_id="g1"))) == []
+    params = route.calls[0].request.url.params
+    assert params["grantId"] == "g1"
+    assert params["page"] == "1"
+    assert params["pageSize"] == "100"
@@ -0,0 +1,181 @@
+"""Tests for the WebhookReceiver ASGI app."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from grantex import GrantexStreamEvent, WebhookReceiver, WebhookVerifier
+
+SECRET = "whsec_test"
+
+
+def _delivery(i: int, type_: str = "grant.revoked", secret: str = SECRET) -> dict[str, Any]:
+    body = json.dumps(
+        {"id": f"evt_{i}", "type": type_, "createdAt": "2026-01-01T00:00:00Z", "data": {"n": i}}
+    ).encode()
+    ts = str(int(time.time()))
+    sig = hmac.new(secret.encode(), ts.encode() + b"." + body, hashlib.sha256).hexdigest()
+    return {
+        "content": body,
+        "headers": {"X-Grantex-Signature-V2": f"sha256={sig}", "X-Grantex-Timestamp": ts},
+    }
+
+
+def _client(receiver: WebhookReceiver) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=receiver), base_url="http://receiver"
+    )
+
+
+def test_acknowledges_before_handlers_run() -> None:
+    receiver = WebhookReceiver(WebhookVerifier([SECRET]))
+    seen: list[str] = []
+    everything: list[str] = []
+
+    async def main() -> None:
+        release = asyncio.Event()
+
+        @receiver.on("grant.revoked")
+        async def evict(event: GrantexStreamEvent) -> None:
+            await release.wait()
+            seen.append(event.id)
+
+        receiver.on("*", lambda e: _append(everything, e))
+
+        async with _client(receiver) as client:
+            first = await client.post("/", **_delivery(1))
+            second = await client.post("/", **_delivery(2, "token.issued"))
+        assert (first.status_code, second.status_code) == (202, 202)
+        assert seen == []
+
+        release.set()
+        await receiver.join()
+        assert await receiver.aclose()
+
+    asyncio.run(main())
+    assert seen == ["evt_1"]
+    assert sorted(everything) == ["evt_1", "evt_2"]
+    assert receiver.received == 2
+    latency = receiver.latency.route("grant.revoked")
+    assert latency is not None and latency.count == 1
+
+
+async def _append(target: list[str], event: GrantexStreamEvent) -> None:
+    target.append(event.id)
+
+
+def test_rejects_bad_deliveries() -> None:
+    receiver = WebhookReceiver(WebhookVerifier([SECRET]), max_body_bytes=512)
+
+    async def main() -> list[int]:
+        forged = _delivery(1, secret="whsec_other")
+        not_json = _delivery(2)
+        not_json["content"] = b"not json"
+        async with _client(receiver) as client:
+            responses = [
+                await client.post("/", **forged),
+                await client.post("/", content=b"x" * 600),
+                await client.get("/"),
+            ]
+            # Re-sign the malformed body so only the parse fails.
+            ts = not_json["headers"]["X-Grantex-Timestamp"]
+            sig = hmac.new(SECRET.encode(), ts.encode() + b".not json", hashlib.sha256)
+            not_json["headers"]["X-Grantex-Signature-V2"] = "sha256=" + sig.hexdigest()
+            responses.append(await client.post("/", **not_json))
+        await receiver.aclose()
+        return [r.status_code for r in responses]
+
+    assert asyncio.run(main()) == [401, 413, 405, 400]
+    assert (receiver.received, receiver.rejected) == (0, 3)
+
+
+def test_full_queue_and_handler_limits() -> None:
+    errors: list[str] = []
+    receiver = WebhookReceiver(
+        WebhookVerifier([SECRET]),
+        concurrency=4,
+        max_queue=2,
+        on_error=lambda exc, e: errors.append(f"{e.id}: {exc}"),
+    )
+    running = 0
+    peak = 0
+
+    async def main() -> list[int]:
+        release = asyncio.Event()
+
+        @receiver.on("grant.revoked", concurrency=1)
+        async def serial(event: GrantexStreamEvent) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            if event.id == "evt_0":
+                raise RuntimeError("boom")
+
+        async with _client(receiver) as client:
+            codes = []
+            for i in range(8):
+                codes.append((await client.post("/", **_delivery(i))).status_code)
+                await asyncio.sleep(0)
+        release.set()
+        assert await receiver.aclose(timeout=5)
+        return codes
+
+    codes = asyncio.run(main())
+    # Four workers hold an event each and two more wait in the queue.
+    assert codes.count(202) == 6 and codes.count(503) == 2
+    assert peak == 1
+    assert errors == ["evt_0: boom"]
+    assert receiver.failed == 1
+
+
+def test_raising_on_error_still_counts_the_failure(caplog: pytest.LogCaptureFixture) -> None:
+    def on_error(exc: Exception, event: GrantexStreamEvent) -> None:
+        raise RuntimeError("alerting is down")
+
+    receiver = WebhookReceiver(WebhookVerifier([SECRET]), concurrency=1, on_error=on_error)
+
+    async def broken(event: GrantexStreamEvent) -> None:
+        raise RuntimeError("boom")
+
+    receiver.on("grant.revoked", broken)
+
+    async def main() -> None:
+        async with _client(receiver) as client:
+            for i in range(2):
+                assert (await client.post("/", **_delivery(i))).status_code == 202
+        assert await receiver.aclose(timeout=5)
+
+    asyncio.run(main())
+    assert receiver.failed == 2
+    latency = receiver.latency.route("grant.revoked")
+    assert latency is not None and latency.count == 2
+    assert "on_error handler raised" in caplog.text
+
+
+def test_lifespan_starts_and_drains() -> None:
+    receiver = WebhookReceiver(WebhookVerifier([SECRET]))
+
+    async def main() -> list[str]:
+        messages = asyncio.Queue()  # type: ignore[var-annotated]
+        sent: list[str] = []
+        for kind in ("lifespan.startup", "lifespan.shutdown"):
+            messages.put_nowait({"type": kind})
+
+        async def send(message: Any) -> None:
+            sent.append(message["type"])
+
+        await receiver({"type": "lifespan"}, messages.get, send)
+        return sent
+
+    assert asyncio.run(main()) == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    with pytest.raises(ValueError):
+        WebhookReceiver(WebhookVerifier([SECRET]), concurrency=0)
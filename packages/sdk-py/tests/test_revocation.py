@@ -0,0 +1,159 @@
+"""Tests for RevocationCache."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from grantex import (
+    Grantex,
+    GrantexStreamEvent,
+    GrantexTokenError,
+    Permission,
+    RevocationCache,
+    ToolManifest,
+    verify_grant_token,
+)
+from grantex._types import VerifiedGrant, VerifyGrantTokenOptions
+from grantex.resources._events import EventsClient
+from tests.conftest import MOCK_JWT_PAYLOAD
+
+BASE_URL = "https://api.grantex.dev"
+
+
+def _grant(
+    grant_id: str = "grnt_1",
+    token_id: str = "tok_1",
+    parent_grant_id: str | None = None,
+) -> VerifiedGrant:
+    return VerifiedGrant(
+        token_id=token_id,
+        grant_id=grant_id,
+        principal_id="user_1",
+        agent_did="did:grantex:ag_1",
+        developer_id="dev_1",
+        scopes=("tool:salesforce:read",),
+        issued_at=1709000000,
+        expires_at=9999999999,
+        parent_grant_id=parent_grant_id,
+    )
+
+
+def _event(type_: str, data: dict) -> GrantexStreamEvent:
+    return GrantexStreamEvent(
+        id="evt_1", type=type_, created_at="2026-01-01T00:00:00Z", data=data
+    )
+
+
+def test_events_revoke_grants_and_children() -> None:
+    cache = RevocationCache()
+    cache.handle_event(_event("grant.revoked", {"grantId": "grnt_1", "cascade": True}))
+    cache.handle_event(_event("anomaly.auto_revoked", {"revokedGrants": ["grnt_2", "grnt_3"]}))
+    cache.handle_event(_event("grant.created", {"grantId": "grnt_4"}))
+
+    assert len(cache) == 3
+    assert cache.is_revoked(_grant("grnt_1"))
+    assert cache.is_revoked(_grant("grnt_3"))
+    assert cache.is_revoked(_grant("grnt_child", parent_grant_id="grnt_1"))
+    assert not cache.is_revoked(_grant("grnt_4"))
+
+    cache.revoke_token("tok_9")
+    assert cache.is_revoked(_grant("grnt_4", token_id="tok_9"))
+    with pytest.raises(GrantexTokenError, match="revoked"):
+        cache.check(_grant("grnt_2"))
+
+
+def test_entries_expire_and_are_bounded() -> None:
+    cache = RevocationCache(max_entries=2)
+    cache.revoke_grant("grnt_old", expires_at=time.time() - 1)
+    assert not cache.is_revoked(_grant("grnt_old"))
+    assert len(cache) == 0
+
+    cache.revoke_grant("grnt_a", expires_at=time.time() + 10)
+    cache.revoke_grant("grnt_b", expires_at=time.time() + 30)
+    cache.revoke_grant("grnt_c", expires_at=time.time() + 20)
+    # The soonest-expiring entry makes room.
+    assert len(cache) == 2
+    assert not cache.is_revoked(_grant("grnt_a"))
+    assert cache.is_revoked(_grant("grnt_b")) and cache.is_revoked(_grant("grnt_c"))
+
+    with pytest.raises(ValueError):
+        RevocationCache(ttl=0)
+
+
+def test_fail_closed_while_disconnected() -> None:
+    cache = RevocationCache(EventsClient(BASE_URL, "test-key"), fail_closed=True)
+    with pytest.raises(GrantexTokenError, match="not connected"):
+        cache.check(_grant())
+
+
+def test_verify_grant_token_rejects_revoked(mocker: pytest.FixtureRequest) -> None:
+    mocker.patch(  # type: ignore[attr-defined]
+        "grantex._verify.jwt.get_unverified_header", return_value={"alg": "RS256"}
+    )
+    mocker.patch(  # type: ignore[attr-defined]
+        "grantex._verify._fetch_signing_key", return_value="mock-key"
+    )
+    mocker.patch(  # type: ignore[attr-defined]
+        "jwt.decode", return_value=MOCK_JWT_PAYLOAD
+    )
+    options = VerifyGrantTokenOptions(jwks_uri=f"{BASE_URL}/.well-known/jwks.json")
+    cache = RevocationCache()
+
+    assert verify_grant_token("a.b.c", options, revocations=cache).grant_id == MOCK_JWT_PAYLOAD["grnt"]
+    cache.revoke_grant(MOCK_JWT_PAYLOAD["grnt"])
+    with pytest.raises(GrantexTokenError, match="revoked"):
+        verify_grant_token("a.b.c", options, revocations=cache)
+
+
+@respx.mock
+def test_enforce_denies_after_revocation_event() -> None:
+    released = threading.Event()
+
+    def stream(request: httpx.Request) -> httpx.Response:
+        body = {
+            "id": "evt_1",
+            "type": "grant.revoked",
+            "createdAt": "2026-01-01T00:00:00Z",
+            "data": {"grantId": "grnt_1", "cascade": False},
+        }
+
+        def chunks():  # type: ignore[no-untyped-def]
+            yield b"data: " + json.dumps(body).encode() + b"\n\n"
+            released.wait(timeout=5)
+
+        return httpx.Response(200, content=chunks())
+
+    route = respx.get(f"{BASE_URL}/v1/events/stream").mock(side_effect=stream)
+    client = Grantex(api_key="test-key", base_url=BASE_URL)
+    client.load_manifest(
+        ToolManifest(connector="salesforce", tools={"query": Permission.READ})
+    )
+    cache = client.watch_revocations()
+    assert client.watch_revocations() is cache
+    try:
+        deadline = time.monotonic() + 5
+        while not cache.is_revoked(_grant()) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.is_revoked(_grant())
+        assert route.calls.last.request.url.params["types"] == (
+            "grant.revoked,anomaly.auto_revoked"
+        )
+
+        with patch("grantex._verify._fetch_signing_key"), patch(
+            "grantex._verify.jwt.get_unverified_header", return_value={"alg": "RS256"}
+        ), patch("grantex._verify.jwt.decode", return_value={
+            "jti": "tok_1", "sub": "user_1", "agt": "did:grantex:ag_1", "dev": "dev_1",
+            "scp": ["tool:salesforce:read"], "iat": 1, "exp": 9999999999, "grnt": "grnt_1",
+        }):
+            result = client.enforce("a.b.c", "salesforce", "query")
+        assert result.allowed is False
+        assert "revoked" in result.reason
+    finally:
+        released.set()
+        cache.stop()
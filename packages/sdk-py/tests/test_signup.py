@@ -6,6 +6,7 @@ import respx
 import httpx
 
 from grantex import Grantex, SignupParams
+from grantex._client import _signup_client
 
 MOCK_SIGNUP_RESPONSE = {
     "developerId": "dev_NEW01",
@@ -70,6 +71,19 @@ def test_signup_conflict_raises() -> None:
         Grantex.signup(SignupParams(name="Acme Corp", email="taken@acme.com"))
 
 
+@respx.mock
+def test_signup_is_anonymous_and_reuses_client() -> None:
+    route = respx.post("https://signup.api.dev/v1/signup").mock(
+        return_value=httpx.Response(201, json=MOCK_SIGNUP_RESPONSE)
+    )
+    Grantex.signup(SignupParams(name="Acme Corp"), base_url="https://signup.api.dev")
+    Grantex.signup(SignupParams(name="Acme Corp"), base_url="https://signup.api.dev/")
+
+    assert route.call_count == 2
+    assert "authorization" not in route.calls.last.request.headers
+    assert _signup_client("https://signup.api.dev") is _signup_client("https://signup.api.dev/")
+
+
 @respx.mock
 def test_rotate_key_happy_path(client: Grantex) -> None:
     respx.post("https://api.grantex.dev/v1/keys/rotate").mock(
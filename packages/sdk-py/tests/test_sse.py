@@ -0,0 +1,129 @@
+"""Tests for the incremental SSE decoder and EventsClient.stream."""
+from __future__ import annotations
+
+import json
+import logging
+
+import httpx
+import pytest
+import respx
+
+from grantex import GrantexEventError, StreamMetrics
+from grantex._sse import ServerSentEvent, SSEDecoder
+from grantex.resources._events import EventsClient
+
+BASE_URL = "https://api.grantex.dev"
+
+
+def _decode(payload: bytes, size: int) -> list[ServerSentEvent]:
+    chunks = [payload[i:i + size] for i in range(0, len(payload), size)]
+    return list(SSEDecoder().iter_events(chunks))
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_fields_and_line_endings(newline: bytes, size: int) -> None:
+    lines = [
+        b"\xef\xbb\xbf: comment",
+        b"event: grant.revoked",
+        b"id: 41",
+        b"retry: 2500",
+        b"data: first",
+        b"data:second",
+        b"",
+        b"data: {\"x\": \"\xc3\xa9\"}",
+        b"",
+        b"id",
+        b"data",
+        b"",
+    ]
+    events = _decode(newline.join(lines) + newline, size)
+
+    assert events == [
+        ServerSentEvent(data="first\nsecond", event="grant.revoked", id="41", retry=2500),
+        ServerSentEvent(data='{"x": "é"}', id="41", retry=2500),
+        ServerSentEvent(data="", id="", retry=2500),
+    ]
+
+
+def test_ignored_fields_and_incomplete_event() -> None:
+    decoder = SSEDecoder()
+    events = decoder.feed(
+        b"retry: soon\nid: a\0b\nunknown: x\ndata: one\n\nevent: only\n\ndata: partial"
+    )
+
+    assert events == [ServerSentEvent(data="one")]
+    assert (decoder.last_event_id, decoder.retry) == (None, None)
+    # An event without a terminating blank line is never dispatched.
+    assert decoder.feed(b"") == []
+
+
+def test_flood_in_one_chunk() -> None:
+    payload = b"".join(b"id: %d\ndata: {\"n\": %d}\n\n" % (i, i) for i in range(20000))
+
+    events = SSEDecoder().feed(payload)
+
+    assert len(events) == 20000
+    assert events[-1] == ServerSentEvent(data='{"n": 19999}', id="19999")
+
+
+def _event(i: int) -> bytes:
+    body = {"id": f"evt_{i}", "type": "grant.revoked", "createdAt": "2026-01-01T00:00:00Z"}
+    return b"data: " + json.dumps(body).encode() + b"\r\n\r\n"
+
+
+@respx.mock
+def test_stream_yields_events_across_chunk_boundaries() -> None:
+    payload = b": keepalive\n\n" + _event(1) + _event(2)
+    chunks = [payload[i:i + 5] for i in range(0, len(payload), 5)]
+    route = respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        return_value=httpx.Response(200, content=iter(chunks))
+    )
+    client = EventsClient(BASE_URL, "test-key")
+
+    ids = [e.id for e in client.stream()]
+
+    assert ids == ["evt_1", "evt_2"]
+    assert route.calls.last.request.headers["authorization"] == "Bearer test-key"
+
+
+@respx.mock
+def test_invalid_payload_is_skipped_reported_or_raised(caplog: pytest.LogCaptureFixture) -> None:
+    payload = _event(1) + b"data: not json\n\n" + _event(2)
+    respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        side_effect=lambda _: httpx.Response(200, content=payload)
+    )
+    client = EventsClient(BASE_URL, "test-key")
+
+    with caplog.at_level(logging.WARNING, logger="grantex.resources._events"):
+        assert [e.id for e in client.stream()] == ["evt_1", "evt_2"]
+    assert "Skipped undecodable event" in caplog.text
+
+    errors: list[Exception] = []
+    metrics = StreamMetrics()
+    ids = [e.id for e in client.stream(on_error=errors.append, metrics=metrics)]
+    assert ids == ["evt_1", "evt_2"]
+    assert len(errors) == 1
+    assert metrics.invalid_events == 1
+
+    with pytest.raises(GrantexEventError) as excinfo:
+        list(client.stream(strict=True))
+    assert excinfo.value.data == "not json"
+
+
+@respx.mock
+def test_subscribe_reports_invalid_payload_without_reconnect() -> None:
+    payload = _event(1) + b"data: not json\n\n" + _event(2)
+    respx.get(f"{BASE_URL}/v1/events/stream").mock(
+        return_value=httpx.Response(200, content=payload)
+    )
+    client = EventsClient(BASE_URL, "test-key")
+    received: list[str] = []
+    errors: list[Exception] = []
+
+    subscription = client.subscribe(lambda e: received.append(e.id), on_error=errors.append)
+    subscription._thread.join(timeout=5)
+
+    assert received == ["evt_1", "evt_2"]
+    assert len(errors) == 1
+    assert isinstance(errors[0], GrantexEventError)
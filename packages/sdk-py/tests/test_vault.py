@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 
 import httpx
+import pytest
 import respx
 
 from grantex import (
@@ -11,6 +12,7 @@ from grantex import (
     StoreCredentialParams,
     ExchangeCredentialParams,
     ListVaultCredentialsParams,
+    GrantexApiError,
 )
 
 BASE_URL = "https://api.grantex.dev"
@@ -123,6 +125,46 @@ def test_exchange_credential() -> None:
     assert body["service"] == "google"
 
 
+@respx.mock
+def test_exchange_uses_pooled_client_and_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("grantex._http.time.sleep", lambda _: None)
+    route = respx.post(f"{BASE_URL}/v1/vault/credentials/exchange").mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.Response(200, json={
+                "accessToken": "ya29.real_token",
+                "service": "google",
+                "credentialType": "oauth2",
+                "tokenExpiresAt": None,
+                "metadata": {},
+            }),
+        ]
+    )
+
+    client = Grantex(api_key="test_key", base_url=BASE_URL)
+    result = client.vault.exchange("grant.jwt.token", ExchangeCredentialParams(service="google"))
+
+    assert result.access_token == "ya29.real_token"
+    assert route.call_count == 2
+    request = route.calls.last.request
+    assert request.headers["authorization"] == "Bearer grant.jwt.token"
+    assert request.headers["user-agent"].startswith("grantex-python/")
+
+
+@respx.mock
+def test_exchange_error_raises_value_error() -> None:
+    respx.post(f"{BASE_URL}/v1/vault/credentials/exchange").mock(
+        return_value=httpx.Response(403, json={"message": "Grant lacks vault scope"})
+    )
+
+    client = Grantex(api_key="test_key", base_url=BASE_URL)
+    with pytest.raises(ValueError, match="Grant lacks vault scope") as excinfo:
+        client.vault.exchange("grant.jwt.token", ExchangeCredentialParams(service="google"))
+
+    assert isinstance(excinfo.value.__cause__, GrantexApiError)
+    assert excinfo.value.__cause__.status_code == 403
+
+
 @respx.mock
 def test_list_credentials_without_filters() -> None:
     respx.get(f"{BASE_URL}/v1/vault/credentials").mock(
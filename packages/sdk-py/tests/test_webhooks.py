@@ -9,7 +9,13 @@ import pytest
 import respx
 
 from grantex import Grantex
-from grantex._webhook import verify_webhook, verify_webhook_signature
+from grantex._webhook import (
+    ReplayStore,
+    WebhookDelivery,
+    WebhookVerifier,
+    verify_webhook,
+    verify_webhook_signature,
+)
 
 BASE_URL = "http://test.local"
 
@@ -176,3 +182,117 @@ def test_verify_webhook_rejects_bad_timestamps(timestamp):
 def test_verify_webhook_rejects_bad_signatures(signature):
     ts = str(_now())
     assert verify_webhook(_TS_PAYLOAD, signature, ts, _TS_SECRET) is False
+
+
+# ── WebhookVerifier (precomputed keys, secret rotation, batches) ───────────
+
+
+def test_verifier_accepts_any_active_secret():
+    verifier = WebhookVerifier(secrets=["whsec_new", _TS_SECRET])
+    ts = str(_now())
+    assert verifier.verify(_TS_PAYLOAD, _sign(ts, _TS_PAYLOAD), ts) is True
+    assert verifier.verify(_TS_PAYLOAD.encode(), _sign(ts, _TS_PAYLOAD, "whsec_new"), ts) is True
+    assert verifier.verify(_TS_PAYLOAD, _sign(ts, _TS_PAYLOAD, "whsec_old"), ts) is False
+    stale = str(_now() - 301)
+    assert verifier.verify(_TS_PAYLOAD, _sign(stale, _TS_PAYLOAD), stale) is False
+
+
+@pytest.mark.parametrize("signature", ["", "garbage", "sha256=", "sha256=zz"])
+def test_verifier_rejects_bad_signatures(signature):
+    ts = str(_now())
+    assert WebhookVerifier([_TS_SECRET]).verify(_TS_PAYLOAD, signature, ts) is False
+
+
+def test_verifier_requires_canonical_signature_form():
+    verifier = WebhookVerifier([_TS_SECRET])
+    ts = str(_now())
+    sig = _sign(ts, _TS_PAYLOAD)
+    digest = sig[len("sha256="):]
+    for variant in ("sha256=" + digest.upper(), f"sha256={digest[:10]} {digest[10:]}", "SHA256=" + digest):
+        assert verify_webhook(_TS_PAYLOAD, variant, ts, _TS_SECRET) is False
+        assert verifier.verify(_TS_PAYLOAD, variant, ts) is False
+
+
+def test_verifier_batch_uses_received_at():
+    verifier = WebhookVerifier([_TS_SECRET], tolerance_seconds=60)
+    old = "1700000000"
+    fresh = str(_now())
+    results = verifier.verify_many([
+        WebhookDelivery(_TS_PAYLOAD, _sign(old, _TS_PAYLOAD), old, received_at=1700000005),
+        WebhookDelivery(_TS_PAYLOAD, _sign(old, _TS_PAYLOAD), old),
+        WebhookDelivery(_TS_PAYLOAD, _sign(fresh, _TS_PAYLOAD), fresh),
+        WebhookDelivery("{}", _sign(fresh, _TS_PAYLOAD), fresh),
+    ])
+    assert results == [True, False, True, False]
+
+
+def test_verifier_requires_secrets():
+    with pytest.raises(ValueError):
+        WebhookVerifier([])
+    with pytest.raises(ValueError):
+        WebhookVerifier(_TS_SECRET)  # type: ignore[arg-type]
+
+
+# ── Replay protection ──────────────────────────────────────────────────────
+
+
+def test_replay_store_refuses_repeat_inside_window():
+    store = ReplayStore()
+    ts = str(_now())
+    sig = _sign(ts, _TS_PAYLOAD)
+    assert verify_webhook(_TS_PAYLOAD, sig, ts, _TS_SECRET, replay_store=store) is True
+    assert verify_webhook(_TS_PAYLOAD, sig, ts, _TS_SECRET, replay_store=store) is False
+    # A different delivery is unaffected.
+    other = _sign(ts, "{}")
+    assert verify_webhook("{}", other, ts, _TS_SECRET, replay_store=store) is True
+
+    verifier = WebhookVerifier([_TS_SECRET], replay_store=ReplayStore())
+    assert verifier.verify(_TS_PAYLOAD, sig, ts) is True
+    assert verifier.verify(_TS_PAYLOAD, sig, ts) is False
+    # Batch re-verification of archives ignores the store.
+    assert verifier.verify_many([WebhookDelivery(_TS_PAYLOAD, sig, ts)]) == [True]
+
+
+def test_replay_store_refuses_respelled_signatures():
+    ts = str(_now())
+    sig = _sign(ts, _TS_PAYLOAD)
+    digest = sig[len("sha256="):]
+    variants = ["sha256=" + digest.upper(), f"sha256={digest[:10]} {digest[10:]}"]
+
+    store = ReplayStore()
+    assert verify_webhook(_TS_PAYLOAD, sig, ts, _TS_SECRET, replay_store=store) is True
+    verifier = WebhookVerifier([_TS_SECRET], replay_store=ReplayStore())
+    assert verifier.verify(_TS_PAYLOAD, sig, ts) is True
+    for variant in [sig, *variants]:
+        assert verify_webhook(_TS_PAYLOAD, variant, ts, _TS_SECRET, replay_store=store) is False
+        assert verifier.verify(_TS_PAYLOAD, variant, ts) is False
+
+
+def test_replay_store_expires_at_tolerance_edge(monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    store = ReplayStore()
+
+    assert store.add("sig_a", 1_000_300) is True
+    assert store.add("sig_b", 1_000_301) is True
+    clock[0] = 1_000_300.9  # still inside sig_a's window
+    assert store.add("sig_a", 1_000_300) is False
+    clock[0] = 1_000_301.0  # sig_a's window has closed
+    assert len(store) == 1
+    assert store.add("sig_b", 1_000_301) is False
+    clock[0] = 1_000_302.0
+    assert len(store) == 0
+
+
+def test_replay_store_is_bounded():
+    store = ReplayStore(max_entries=2)
+    now = _now()
+    assert store.add("late", now + 100)
+    assert store.add("soon", now + 10)
+    assert store.add("later", now + 200)
+    assert len(store) == 2
+    # The entry closest to expiry made room.
+    assert store.add("soon", now + 10) is True
+    assert store.add("later", now + 200) is False
+    with pytest.raises(ValueError):
+        ReplayStore(max_entries=0)